@@ -16,10 +16,14 @@ import requests
 import csv
 import io
 import uuid
-import json
+import gzip
+import orjson
 import traceback
 import concurrent.futures
 import logging
+import logging.handlers
+import queue
+import atexit
 import sys
 import re
 import vertexai
@@ -27,28 +31,41 @@ import time
 import threading
 import random
 import glob
+import functools
+import itertools
+import contextlib
+import hashlib
+import string
+import tempfile
+from collections import defaultdict, Counter
 from datetime import datetime, timezone, timedelta
 from vertexai.generative_models import GenerativeModel
-from flask import Flask, Response, request, render_template_string, redirect, url_for, jsonify
-import google.auth
-import google.auth.transport.requests
+from flask import Flask, Response, request, render_template_string, redirect, url_for, jsonify, stream_with_context
 from google.auth import default as google_auth_default
-from google.auth.transport.requests import Request as GoogleAuthRequest
+from google.auth.transport.requests import Request as GoogleAuthRequest, AuthorizedSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from googleapiclient.discovery import build as google_api_build
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
 from google.cloud import asset_v1, tasks_v2, storage, recommender_v1
 from google.api_core.exceptions import AlreadyExists, PermissionDenied
 from google.cloud import osconfig_v1
+from google.cloud.storage import transfer_manager
 from google.api_core import exceptions as core_exceptions
-from google.cloud.recommender_v1.types import Insight
 
 # --- Global Configuration ---
-# Configures logging to display INFO level messages with a timestamp.
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(levelname)s: [%(asctime)s] %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+# Configures logging to display INFO level messages with a timestamp. Records are
+# handed to a queue and written to stderr by a single listener thread, so check
+# threads never block on the stream lock while many checks log at once.
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(levelname)s: [%(asctime)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S'))
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(_log_queue)])
+logger = logging.getLogger("cloudgauge")
 
 
 # --- Flask App Initialization & Configuration ---
@@ -62,22 +79,203 @@ LOCATION = os.environ.get('LOCATION')
 TASK_QUEUE = os.environ.get('TASK_QUEUE')
 RESULTS_BUCKET = os.environ.get('RESULTS_BUCKET')
 SA_EMAIL = os.environ.get('SERVICE_ACCOUNT_EMAIL')
-
+# Scan scopes accepted from the UI.
+VALID_SCOPES = frozenset({'organization', 'folder', 'project'})
+# Size of each chunk the streaming findings writer uploads to GCS (a multiple of 256 KiB).
+FINDINGS_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# HTML reports above this size are uploaded as parallel parts and composed server-side.
+# Smaller reports use a single upload, since every part costs an extra Class A operation.
+PARALLEL_REPORT_UPLOAD_THRESHOLD = 256 * 1024 * 1024
+PARALLEL_REPORT_UPLOAD_CHUNK_SIZE = 64 * 1024 * 1024
+PARALLEL_REPORT_UPLOAD_MAX_WORKERS = 8
+# Maximum number of projects a single check scans concurrently.
+PROJECT_CHECK_MAX_WORKERS = 16
+# Number of independent gRPC channels (connections) kept per API client type.
+GRPC_CHANNEL_POOL_SIZE = 8
+# Number of getIamPolicy sub-requests packed into one batched HTTP request.
+IAM_POLICY_BATCH_SIZE = 100
+# Number of per-project Compute Engine list sub-requests packed into one batched HTTP request.
+# Compute stays on the discovery client on purpose: google-cloud-compute only ships a REST
+# transport (there is no Compute gRPC endpoint), so it would add a dependency without
+# HTTP/2 or protobuf-on-the-wire, and it cannot send batched requests.
+COMPUTE_BATCH_SIZE = 50
+# Service accounts whose keys are listed concurrently within one project.
+SA_KEY_LIST_MAX_WORKERS = 8
+# Bucket IAM policies fetched concurrently within one project.
+BUCKET_IAM_MAX_WORKERS = 8
+# Concurrent OS Config inventory lookups (one per zone) within one project.
+OS_INVENTORY_PROBE_MAX_WORKERS = 32
+# Concurrent list_insights calls (location x insight type) within one project.
+NETWORK_INSIGHT_MAX_WORKERS = 16
+# Concurrent list_recommendations calls (recommender x location) within one project.
+COST_RECOMMENDATION_MAX_WORKERS = 16
+# Gzip the findings objects (machine-only data). Set to 'false' to write plain NDJSON.
+COMPRESS_FINDINGS = os.environ.get('COMPRESS_FINDINGS', 'true').lower() != 'false'
+
+# --- Shared Credentials & API Clients ---
+# Discovery-based clients are expensive to build and are not thread-safe (they
+# share one httplib2 connection), so each worker thread keeps its own cache.
+_thread_local = threading.local()
+
+@functools.lru_cache(maxsize=1)
+def _get_credentials():
+    """Resolves the Application Default Credentials once per process."""
+    credentials, _ = google_auth_default(scopes=SCOPES)
+    return credentials
+
+class _OrjsonModel(JsonModel):
+    """
+    Discovery response model that decodes JSON bodies with orjson. Listings such as
+    instances.aggregatedList can be megabytes, and decoding them is the main CPU cost.
+    """
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+def _get_service(api_name, api_version):
+    """Returns a discovery-built API client for the calling thread, building it on first use."""
+    services = getattr(_thread_local, 'services', None)
+    if services is None:
+        services = _thread_local.services = {}
+    key = (api_name, api_version)
+    if key not in services:
+        services[key] = google_api_build(api_name, api_version, credentials=_get_credentials(),
+                                         cache_discovery=False, static_discovery=True, model=_OrjsonModel())
+    return services[key]
+
+# Shared session for plain HTTPS calls so connections (and TLS handshakes) are reused.
+# Transient 429/5xx responses are retried with backoff before the caller sees them.
+_http_session = requests.Session()
+_http_session.mount('https://', HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+))
+
+# Access tokens live for about an hour, so a token is refreshed only when it is
+# missing or within this many seconds of expiring.
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+_token_lock = threading.Lock()
+
+def _get_access_token():
+    """Returns a bearer token from the shared credentials, refreshing it only when it's about to expire."""
+    credentials = _get_credentials()
+    with _token_lock:
+        expiry = credentials.expiry
+        if (not credentials.token or expiry is None
+                or expiry - datetime.utcnow() < timedelta(seconds=TOKEN_REFRESH_MARGIN_SECONDS)):
+            credentials.refresh(GoogleAuthRequest(_http_session))
+        return credentials.token
+
+# gRPC clients are thread-safe, but a single channel multiplexes every call over one
+# HTTP/2 connection and queues once the server's concurrent stream limit is reached.
+# Calls are therefore spread round-robin over a small pool of clients, each with
+# its own channel and a local subchannel pool so they really open separate connections.
+_grpc_round_robin = itertools.count()
+
+def _build_grpc_client(client_cls):
+    """Builds a GAPIC client on a dedicated gRPC channel."""
+    transport_cls = client_cls.get_transport_class('grpc')
+    channel = transport_cls.create_channel(
+        credentials=_get_credentials(),
+        options=[('grpc.use_local_subchannel_pool', 1), ('grpc.max_receive_message_length', -1)],
+    )
+    return client_cls(transport=transport_cls(channel=channel))
+
+@functools.lru_cache(maxsize=None)
+def _get_grpc_client_pool(client_cls):
+    """Creates the pool of clients for a client class once per process."""
+    return tuple(_build_grpc_client(client_cls) for _ in range(GRPC_CHANNEL_POOL_SIZE))
+
+def _get_grpc_client(client_cls):
+    """Returns the next client from the class's channel pool."""
+    pool = _get_grpc_client_pool(client_cls)
+    return pool[next(_grpc_round_robin) % len(pool)]
+
+@functools.lru_cache(maxsize=1)
+def _get_storage_http():
+    """
+    Returns one authorized session shared by all per-project storage clients. Its
+    pool is sized for concurrent project scans; the default adapter keeps only 10
+    connections and discards the rest under load.
+    """
+    session = AuthorizedSession(_get_credentials())
+    adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64)
+    session.mount('https://', adapter)
+    return session
+
+def _get_storage_client(project_id):
+    """Builds a lightweight storage client for a project on top of the shared session."""
+    return storage.Client(project=project_id, credentials=_get_credentials(), _http=_get_storage_http())
+
+# --- Boot Cache ---
+# Values such as the service URL and parent org never change within a Cloud Run
+# revision, so they are persisted to /tmp (keyed by K_REVISION) and reused by
+# later boots of the same revision instead of calling the APIs again.
+BOOT_CACHE_PATH = '/tmp/.cg_boot.json'
+_boot_cache = None
+_boot_cache_lock = threading.Lock()
+
+def _load_boot_cache():
+    """Loads the boot cache file once per process, ignoring it if it belongs to another revision."""
+    global _boot_cache
+    if _boot_cache is None:
+        _boot_cache = {}
+        try:
+            with open(BOOT_CACHE_PATH, 'rb') as f:
+                cached = orjson.loads(f.read())
+            if cached.get('revision') == os.environ.get('K_REVISION'):
+                _boot_cache = cached
+        except (OSError, ValueError):
+            pass
+    return _boot_cache
+
+def _read_boot_cache(key):
+    """Returns a value cached for the current revision, or None."""
+    with _boot_cache_lock:
+        return _load_boot_cache().get(key)
+
+def _write_boot_cache(key, value):
+    """Stores a value in memory and, when running on Cloud Run, in the boot cache file."""
+    with _boot_cache_lock:
+        cache = _load_boot_cache()
+        cache[key] = value
+        revision = os.environ.get('K_REVISION')
+        if not revision:
+            return
+        cache['revision'] = revision
+        try:
+            tmp_path = f"{BOOT_CACHE_PATH}.{os.getpid()}"
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(cache))
+            os.replace(tmp_path, BOOT_CACHE_PATH)
+        except OSError as e:
+            logger.warning("Could not write boot cache file: %s", e)
+
+@functools.lru_cache(maxsize=1)
 def _get_self_url():
     """
     (NEW) Dynamically discovers the public URL of the Cloud Run service itself.
     This avoids the need to manually set WORKER_URL during deployment.
     """
+    if cached_url := _read_boot_cache('WORKER_URL'):
+        logger.info("✅ Using cached WORKER_URL: %s", cached_url)
+        return cached_url
+
     # Cloud Run automatically injects the K_SERVICE environment variable
     service_name = os.environ.get('K_SERVICE')
     if not service_name:
         raise RuntimeError("K_SERVICE environment variable not found. Cannot auto-discover URL. Please set WORKER_URL manually.")
 
-    print(f"🚀 Auto-discovering URL for service: {service_name}...")
+    logger.info("🚀 Auto-discovering URL for service: %s...", service_name)
     try:
-        credentials, _ = google_auth_default(scopes=SCOPES)
         # Use the Cloud Run Admin API
-        run_service = google_api_build('run', 'v1', credentials=credentials)
+        run_service = _get_service('run', 'v1')
         
         service_path = f"projects/{PROJECT_ID}/locations/{LOCATION}/services/{service_name}"
         
@@ -88,13 +286,43 @@ def _get_self_url():
         if not url:
             raise RuntimeError(f"Could not find URL in API response for service {service_name}.")
         
-        print(f"✅ Auto-discovered WORKER_URL: {url}")
+        logger.info("✅ Auto-discovered WORKER_URL: %s", url)
+        _write_boot_cache('WORKER_URL', url)
         return url
     except Exception as e:
-        logging.critical(f"FATAL: Could not discover WORKER_URL via API. Ensure the 'Cloud Run Admin API' is enabled. Error: {e}")
+        logger.critical("FATAL: Could not discover WORKER_URL via API. Ensure the 'Cloud Run Admin API' is enabled. Error: %s", e)
         raise
     
-WORKER_URL = _get_self_url()
+# --- In-Process TTL Cache ---
+
+def _ttl_cache(ttl_seconds, cache_if=None):
+    """
+    Memoizes a function's return value per argument tuple for ttl_seconds.
+    Exceptions are not cached, so a failed lookup is retried on the next call.
+    When cache_if is given, only return values it accepts are kept (e.g. to skip
+    functions that report failure through an error string).
+    """
+    def decorator(func):
+        cache = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = (func.__name__,) + args
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+            value = func(*args)
+            if cache_if is None or cache_if(value):
+                with lock:
+                    cache[key] = (now + ttl_seconds, value)
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
 
 # ---Add a startup check for essential environment variables ---
 def check_environment_variables():
@@ -103,18 +331,20 @@ def check_environment_variables():
     missing_vars = [var for var in required_vars if not os.environ.get(var)]
     if missing_vars:
         error_message = f"FATAL: Missing required environment variables: {', '.join(missing_vars)}"
-        logging.critical(error_message)
+        logger.critical(error_message)
         # In a production environment, you might want to raise an exception or exit
         # For Cloud Run, this will make the deployment fail with a clear log message
         raise RuntimeError(error_message)
     else:
-        print("✅ All required environment variables are set.")
+        logger.info("✅ All required environment variables are set.")
 
 check_environment_variables()
 
 # --- GCP Service Clients (Initialized once for efficiency) ---
-tasks_client = tasks_v2.CloudTasksClient()
+tasks_client = tasks_v2.CloudTasksClient(credentials=_get_credentials())
 storage_client = storage.Client()
+# Handle for the results bucket, shared by every reader and writer (creating it makes no API call)
+results_bucket = storage_client.bucket(RESULTS_BUCKET)
 
 # --- Startup Functions ---
 
@@ -124,139 +354,362 @@ def create_task_queue_if_not_exists():
     If the queue does not exist, it creates it. This function is essential for
     the asynchronous task processing of the application.
     """
-    print("🚀 Checking for Cloud Tasks queue...")
-    logging.info("🚀 Initializing startup checks: Verifying Cloud Tasks queue...")
+    logger.info("🚀 Checking for Cloud Tasks queue...")
+    logger.info("🚀 Initializing startup checks: Verifying Cloud Tasks queue...")
     LOCATION = os.environ.get('LOCATION')
     if not LOCATION:
-        logging.critical("FATAL: Location environment variable not found.")
+        logger.critical("FATAL: Location environment variable not found.")
         raise RuntimeError("Location environment variable is not available.")
-    logging.info(f"✅ Detected Cloud Run region: {LOCATION}")
+    logger.info("✅ Detected Cloud Run region: %s", LOCATION)
     try:
         parent = f"projects/{PROJECT_ID}/locations/{LOCATION}"
         queue_name = f"{parent}/queues/{TASK_QUEUE}"
         tasks_client.create_queue(parent=parent, queue={"name": queue_name})
-        logging.info(f"✅ Successfully created Cloud Tasks queue '{TASK_QUEUE}' in '{LOCATION}'.")
+        logger.info("✅ Successfully created Cloud Tasks queue '%s' in '%s'.", TASK_QUEUE, LOCATION)
     except AlreadyExists:
-        logging.info(f"✅ Cloud Tasks queue '{TASK_QUEUE}' already exists. No action needed.")
+        logger.info("✅ Cloud Tasks queue '%s' already exists. No action needed.", TASK_QUEUE)
     except PermissionDenied as e:
-        logging.critical(f"FATAL: PERMISSION DENIED. The service account '{SA_EMAIL}' is likely missing the 'Cloud Tasks Admin' role.")
+        logger.critical("FATAL: PERMISSION DENIED. The service account '%s' is likely missing the 'Cloud Tasks Admin' role.", SA_EMAIL)
         raise
     except Exception as e:
-        logging.critical(f"FATAL: An unexpected error occurred during startup task queue checks: {e}")
+        logger.critical("FATAL: An unexpected error occurred during startup task queue checks: %s", e)
         raise
 
 # Initialize task queue if environment variables are set.
-if PROJECT_ID and TASK_QUEUE:
-    create_task_queue_if_not_exists()
-else:
-    print("⚠️ PROJECT_ID or TASK_QUEUE environment variables not set. Skipping queue creation.")
+# URL discovery and the queue check are independent API round trips, so run them
+# concurrently rather than back to back. Any startup error is re-raised by result().
+with concurrent.futures.ThreadPoolExecutor(max_workers=2) as startup_executor:
+    worker_url_future = startup_executor.submit(_get_self_url)
+    queue_future = None
+    if PROJECT_ID and TASK_QUEUE:
+        queue_future = startup_executor.submit(create_task_queue_if_not_exists)
+    else:
+        logger.warning("⚠️ PROJECT_ID or TASK_QUEUE environment variables not set. Skipping queue creation.")
+    WORKER_URL = worker_url_future.result()
+    if queue_future:
+        queue_future.result()
+
+# Everything a scan task needs besides its job payload is fixed for the life of the process
+TASK_PARENT = tasks_client.queue_path(PROJECT_ID, LOCATION, TASK_QUEUE)
+WORKER_SCAN_URL = f"{WORKER_URL}/run-scan"
+
+# --- Check Cancellation ---
+# run_all_checks gives every check a threading.Event and sets it when the check runs past
+# its deadline. The event is installed in a thread-local on the check's thread (and, through
+# _with_cancel_event, on every pool thread it fans out to), where the shared helpers poll it
+# between API calls.
+class CheckCancelled(BaseException):
+    """
+    Raised inside a check once run_all_checks has given up on it. Derived from
+    BaseException so the per-project `except Exception` handlers don't swallow it.
+    """
+
+_check_state = threading.local()
+
+def _current_cancel_event():
+    """Returns the cancellation event of the check running on this thread, if any."""
+    return getattr(_check_state, 'cancel_event', None)
+
+def _raise_if_cancelled():
+    """Stops the current check if it has been cancelled."""
+    cancel_event = _current_cancel_event()
+    if cancel_event is not None and cancel_event.is_set():
+        raise CheckCancelled()
+
+def _run_with_cancel_event(cancel_event, func, *args):
+    """Runs func with cancel_event installed as this thread's cancellation event."""
+    previous = _current_cancel_event()
+    _check_state.cancel_event = cancel_event
+    try:
+        return func(*args)
+    finally:
+        _check_state.cancel_event = previous
+
+def _with_cancel_event(func):
+    """
+    Wraps func for a worker pool: pool threads don't inherit the calling check's
+    thread-local state, so its cancellation event is captured here and installed
+    around each call, and calls that start after cancellation are refused.
+    """
+    cancel_event = _current_cancel_event()
+
+    def run(*args):
+        if cancel_event is not None and cancel_event.is_set():
+            raise CheckCancelled()
+        return _run_with_cancel_event(cancel_event, func, *args)
+    return run
 
 # --- Helper Functions for Streaming Architecture ---
+# Findings for a job are streamed into a single newline-delimited JSON object through
+# a resumable-upload writer, so a scan opens one upload session per job and sends one
+# request per FINDINGS_UPLOAD_CHUNK_SIZE of data instead of one upload per finding.
+# Check threads only enqueue serialized records; a per-job background thread feeds
+# them to the writer, so chunk uploads never block (or serialize) the checks.
+_findings_writers = {}
+_findings_writers_lock = threading.Lock()
+# Jobs whose findings object has been finalized. A write for one of these comes from a
+# check that outlived its deadline and is dropped instead of opening a new writer.
+# Insertion-ordered and trimmed to the most recent CLOSED_FINDINGS_JOBS_MAX jobs.
+CLOSED_FINDINGS_JOBS_MAX = 1024
+_closed_findings_jobs = {}
+
+def _open_findings_writer(job_id):
+    """
+    Opens the job's findings object for streaming writes. Returns the blob writer and
+    the stream records are written to (a gzip wrapper around it when compression is on).
+    """
+    bucket = results_bucket
+    suffix = ".ndjson.gz" if COMPRESS_FINDINGS else ".ndjson"
+    blob = bucket.blob(f"intermediate/{job_id}/findings/part-{uuid.uuid4()}{suffix}")
+    # Stored as an opaque gzip object (no Content-Encoding) so the reader always gets the raw bytes.
+    # if_generation_match=0 makes the upload create-only, which is also what lets the client
+    # library retry a failed chunk instead of aborting the whole upload.
+    blob_writer = blob.open(
+        'wb',
+        chunk_size=FINDINGS_UPLOAD_CHUNK_SIZE,
+        ignore_flush=True,
+        if_generation_match=0,
+        content_type='application/gzip' if COMPRESS_FINDINGS else 'application/x-ndjson'
+    )
+    if COMPRESS_FINDINGS:
+        return blob_writer, gzip.GzipFile(fileobj=blob_writer, mode='wb', compresslevel=6)
+    return blob_writer, blob_writer
+
+def _close_findings_writer(job_id, writers):
+    """Finishes the gzip stream (if any) and finalizes the upload."""
+    blob_writer, stream = writers
+    try:
+        if stream is not blob_writer:
+            stream.close()
+        blob_writer.close()
+    except Exception as e:
+        logger.error("Failed to finalize findings upload to GCS for job %s: %s", job_id, e)
+
+def _drain_findings_queue(job_id, records, writers):
+    """Writes queued records to the job's findings object until the stop marker, then finalizes it."""
+    while True:
+        item = records.get()
+        if item is None:
+            break
+        check_name, record = item
+        try:
+            writers[1].write(record)
+        except Exception as e:
+            logger.error("Failed to write finding %s to GCS for job %s: %s", check_name, job_id, e)
+    _close_findings_writer(job_id, writers)
+
 def _write_finding_to_gcs(job_id, check_name, finding_data):
-    """Uploads a single finding record as a JSON object to GCS."""
+    """
+    Queues a single finding record for the job's findings object in GCS. The
+    background writer buffers in memory and uploads a chunk whenever its buffer fills.
+    """
+    cancel_event = _current_cancel_event()
+    if cancel_event is not None and cancel_event.is_set():
+        # The check already timed out and was reported as an error
+        logger.warning("[%s] Dropping finding %s from a cancelled check.", job_id, check_name)
+        return
     try:
-        bucket = storage_client.bucket(RESULTS_BUCKET)
-        # Use a unique name for each finding to prevent overwrites
-        blob_name = f"intermediate/{job_id}/{check_name}_{uuid.uuid4()}.json"
-        blob = bucket.blob(blob_name)
-        blob.upload_from_string(
-            json.dumps(finding_data),
-            content_type='application/json'
-        )
+        record = orjson.dumps(finding_data) + b"\n"
     except Exception as e:
-        logging.error(f"Failed to write finding to GCS for {check_name}: {e}")
+        logger.error("Failed to serialize finding for %s: %s", check_name, e)
+        return
+
+    with _findings_writers_lock:
+        if job_id in _closed_findings_jobs:
+            logger.warning("[%s] Dropping late finding %s; the job's findings were already finalized.", job_id, check_name)
+            return
+        entry = _findings_writers.get(job_id)
+        if entry is None:
+            try:
+                writers = _open_findings_writer(job_id)
+            except Exception as e:
+                logger.error("Failed to write finding %s to GCS for job %s: %s", check_name, job_id, e)
+                return
+            records = queue.SimpleQueue()
+            drainer = threading.Thread(target=_drain_findings_queue, args=(job_id, records, writers),
+                                       name=f"findings-{job_id}", daemon=True)
+            drainer.start()
+            entry = _findings_writers[job_id] = (records, drainer)
+    entry[0].put((check_name, record))
+
+def _stop_findings_writer(job_id):
+    """Lets the job's writer drain everything queued so far, then waits for it to finalize the upload."""
+    with _findings_writers_lock:
+        entry = _findings_writers.pop(job_id, None)
+        _closed_findings_jobs[job_id] = None
+        while len(_closed_findings_jobs) > CLOSED_FINDINGS_JOBS_MAX:
+            del _closed_findings_jobs[next(iter(_closed_findings_jobs))]
+    if entry:
+        records, drainer = entry
+        records.put(None)
+        drainer.join()
+
+def _flush_findings_to_gcs(job_id):
+    """Finalizes the job's findings object. Call once all checks have finished."""
+    _stop_findings_writer(job_id)
+
+def _discard_buffered_findings(job_id):
+    """
+    Closes any findings writer still open for the job (e.g. after a failed scan) so
+    no upload session is left dangling; the object is removed with the job's other
+    intermediate files.
+    """
+    _stop_findings_writer(job_id)
+
+# Maps each check name (the "Check" key of a finding) to its report category
+_CATEGORY_MAP = {
+    # Security & Identity
+    "Critical Org-Level Roles": "Security & Identity", "Public Org-Level Access": "Security & Identity",
+    "Organization IAM Policy": "Security & Identity", "Security Command Center Status": "Security & Identity",
+    "Project IAM Hygiene": "Security & Identity", "Service Account Key Rotation": "Security & Identity",
+    "Public GCS Buckets": "Security & Identity", "Open Firewall Rules": "Security & Identity",
+    "Primitive Roles (Owner or Editor)": "Security & Identity",
+
+    # Cost Optimization
+    "Idle Cloud SQL Instances": "Cost Optimization", "Low Utilization VMs": "Cost Optimization",
+    "VM Rightsizing": "Cost Optimization", "Unassociated IPs": "Cost Optimization",
+    "Idle Load Balancers": "Cost Optimization", "Idle Persistent Disks": "Cost Optimization",
+    "Underutilized Reservations": "Cost Optimization", "Idle Reservations": "Cost Optimization",
+
+    # Reliability & Resilience
+    "Cloud Storage Versioning": "Reliability & Resilience", "GKE Hygiene": "Reliability & Resilience",
+    "Essential Contacts": "Reliability & Resilience", "Personalized Service Health": "Reliability & Resilience",
+    "Cloud SQL High Availability": "Reliability & Resilience", "Cloud SQL Automated Backups": "Reliability & Resilience",
+    "Cloud SQL Backup Retention": "Reliability & Resilience", "Cloud SQL PITR": "Reliability & Resilience",
+    "MIG Resilience (Zonal)": "Reliability & Resilience", "Disk Snapshot Resilience": "Reliability & Resilience",
+
+    # Operational Excellence & Observability
+    "Organization Log Sink": "Operational Excellence & Observability",
+    "OS Config Agent Coverage": "Operational Excellence & Observability", "Monitoring Alert Coverage": "Operational Excellence & Observability",
+    "Standalone VMs (Not in MIGs)": "Operational Excellence & Observability",
+    "VPC IP Address Utilization": "Operational Excellence & Observability", "VPC Connectivity": "Operational Excellence & Observability",
+    "Load Balancer Health": "Operational Excellence & Observability", "GKE IP Address Utilization": "Operational Excellence & Observability",
+    "GKE Connectivity": "Operational Excellence & Observability", "GKE Service Account": "Operational Excellence & Observability",
+    "Dynamic Route Health": "Operational Excellence & Observability", "Cloud SQL Connectivity": "Operational Excellence & Observability",
+    "VPC Firewall Complexity (>150 Rules)": "Operational Excellence & Observability",
+    "Recent Changes (Org & Project)": "Operational Excellence & Observability", "Unattended Projects": "Operational Excellence & Observability",
+    "Quota Utilization (>80%)": "Operational Excellence & Observability"
+}
+
+# Intermediate files that live next to the findings and must never be parsed as findings
+_FINDINGS_SKIP_SUFFIXES = ('best_practices.json', 'current_policies.json')
 
 def _read_all_findings_from_gcs(job_id):
-    """Reads all temporary finding files for a job and groups them by category."""
-    category_map = {
-        # Security & Identity
-        "Critical Org-Level Roles": "Security & Identity", "Public Org-Level Access": "Security & Identity",
-        "Organization IAM Policy": "Security & Identity", "Security Command Center Status": "Security & Identity",
-        "Project IAM Hygiene": "Security & Identity", "Service Account Key Rotation": "Security & Identity",
-        "Public GCS Buckets": "Security & Identity", "Open Firewall Rules": "Security & Identity",
-        "Primitive Roles (Owner or Editor)": "Security & Identity",
-
-        # Cost Optimization
-        "Idle Cloud SQL Instances": "Cost Optimization", "Low Utilization VMs": "Cost Optimization",
-        "VM Rightsizing": "Cost Optimization", "Unassociated IPs": "Cost Optimization",
-        "Idle Load Balancers": "Cost Optimization", "Idle Persistent Disks": "Cost Optimization",
-        "Underutilized Reservations": "Cost Optimization", "Idle Reservations": "Cost Optimization",
-
-        # Reliability & Resilience
-        "Cloud Storage Versioning": "Reliability & Resilience", "GKE Hygiene": "Reliability & Resilience",
-        "Essential Contacts": "Reliability & Resilience", "Personalized Service Health": "Reliability & Resilience",
-        "Cloud SQL High Availability": "Reliability & Resilience", "Cloud SQL Automated Backups": "Reliability & Resilience",
-        "Cloud SQL Backup Retention": "Reliability & Resilience", "Cloud SQL PITR": "Reliability & Resilience",
-        "MIG Resilience (Zonal)": "Reliability & Resilience", "Disk Snapshot Resilience": "Reliability & Resilience",
-
-        # Operational Excellence & Observability
-        "Organization Log Sink": "Operational Excellence & Observability",
-        "OS Config Agent Coverage": "Operational Excellence & Observability", "Monitoring Alert Coverage": "Operational Excellence & Observability",
-        "Standalone VMs (Not in MIGs)": "Operational Excellence & Observability",
-        "VPC IP Address Utilization": "Operational Excellence & Observability", "VPC Connectivity": "Operational Excellence & Observability",
-        "Load Balancer Health": "Operational Excellence & Observability", "GKE IP Address Utilization": "Operational Excellence & Observability",
-        "GKE Connectivity": "Operational Excellence & Observability", "GKE Service Account": "Operational Excellence & Observability",
-        "Dynamic Route Health": "Operational Excellence & Observability", "Cloud SQL Connectivity": "Operational Excellence & Observability",
-        "VPC Firewall Complexity (>150 Rules)": "Operational Excellence & Observability",
-        "Recent Changes (Org & Project)": "Operational Excellence & Observability", "Unattended Projects": "Operational Excellence & Observability",
-        "Quota Utilization (>80%)": "Operational Excellence & Observability"
-    }
-    categorized_results = {cat: [] for cat in set(category_map.values())}
+    """Reads all temporary NDJSON finding batches (plain or gzipped) for a job and groups them by category."""
+    categorized_results = defaultdict(list)
     
     try:
-        bucket = storage_client.bucket(RESULTS_BUCKET)
-        prefix = f"intermediate/{job_id}/"
-        blobs = bucket.list_blobs(prefix=prefix)
+        bucket = results_bucket
+        prefix = f"intermediate/{job_id}/findings/"
+        # Only the object names are needed, so trim the listing to names and let
+        # GCS filter out anything that is not a findings batch.
+        blobs = bucket.list_blobs(
+            prefix=prefix,
+            match_glob=f"{prefix}*.{{ndjson,ndjson.gz}}",
+            fields='items(name),nextPageToken'
+        )
 
-        for blob in blobs:
-            # Skip the org policy files
-            if "best_practices.json" in blob.name or "current_policies.json" in blob.name:
-                continue
-            
+        def process_batch(future, blob):
             try:
-                data_string = blob.download_as_text()
-                data = json.loads(data_string)
-                # The check name is stored inside the JSON object itself
-                check_name = data.get("Check")
-                category = category_map.get(check_name)
-                if category:
-                    categorized_results[category].append(data)
+                # Each blob is a batch of newline-delimited JSON finding records
+                content = future.result()
+                if blob.name.endswith(".gz"):
+                    content = gzip.decompress(content)
+                for line in content.splitlines():
+                    if not line:
+                        continue
+                    data = orjson.loads(line)
+                    # The check name is stored inside the JSON object itself
+                    check_name = data.get("Check")
+                    category = _CATEGORY_MAP.get(check_name)
+                    if category:
+                        categorized_results[category].append(data)
             except Exception as e:
-                logging.error(f"Failed to read and process GCS finding {blob.name}: {e}")
+                logger.error("Failed to read and process GCS finding %s: %s", blob.name, e)
+
+        # Downloads are pure network waits, so fetch the batches concurrently and
+        # parse each one as soon as it arrives. The listing is consumed lazily and
+        # only a bounded window of downloads is in flight, so memory stays flat
+        # regardless of how many batches the job produced.
+        max_workers = 32
+        max_in_flight = max_workers * 2
+        in_flight = {}
+        blob_count = 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for blob in blobs:
+                # Skip the org policy files
+                if blob.name.endswith(_FINDINGS_SKIP_SUFFIXES):
+                    continue
+                in_flight[executor.submit(blob.download_as_bytes)] = blob
+                blob_count += 1
+                # Periodic summary only; %-style args are formatted only when the record is emitted
+                if blob_count % 1000 == 0:
+                    logger.info("[%s] Queued %d finding batches for download...", job_id, blob_count)
+                if len(in_flight) >= max_in_flight:
+                    done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        process_batch(future, in_flight.pop(future))
+
+            for future in concurrent.futures.as_completed(in_flight):
+                process_batch(future, in_flight[future])
+        logger.info("[%s] Read %d finding batches from GCS.", job_id, blob_count)
     except Exception as e:
-        logging.error(f"Failed to list findings from GCS for job {job_id}: {e}")
+        logger.error("Failed to list findings from GCS for job %s: %s", job_id, e)
         
-    return categorized_results
+    # Report code reads categories with .get(), so categories without findings can simply be absent
+    return dict(categorized_results)
 
 def _write_org_policies_to_gcs(job_id, best_practices, current_policies):
     """Writes the raw org policy data to JSON files in GCS."""
     try:
-        bucket = storage_client.bucket(RESULTS_BUCKET)
+        bucket = results_bucket
         
         bp_blob = bucket.blob(f"intermediate/{job_id}/best_practices.json")
-        bp_blob.upload_from_string(json.dumps(best_practices), content_type='application/json')
+        bp_blob.upload_from_string(orjson.dumps(best_practices), content_type='application/json')
         
         cp_blob = bucket.blob(f"intermediate/{job_id}/current_policies.json")
-        cp_blob.upload_from_string(json.dumps(current_policies), content_type='application/json')
+        cp_blob.upload_from_string(orjson.dumps(current_policies), content_type='application/json')
     except Exception as e:
-        logging.error(f"Failed to write org policy files to GCS: {e}")
+        logger.error("Failed to write org policy files to GCS: %s", e)
 
 def _read_org_policies_from_gcs(job_id):
     """Reads the raw org policy data from GCS files."""
     try:
-        bucket = storage_client.bucket(RESULTS_BUCKET)
+        bucket = results_bucket
         
         bp_blob = bucket.blob(f"intermediate/{job_id}/best_practices.json")
-        best_practices = json.loads(bp_blob.download_as_text())
+        best_practices = orjson.loads(bp_blob.download_as_bytes())
         
         cp_blob = bucket.blob(f"intermediate/{job_id}/current_policies.json")
-        current_policies = json.loads(cp_blob.download_as_text())
+        current_policies = orjson.loads(cp_blob.download_as_bytes())
         
         return (best_practices, current_policies)
     except Exception as e:
-        logging.error(f"Failed to read org policy files from GCS: {e}")
+        logger.error("Failed to read org policy files from GCS: %s", e)
         return (None, None)
 
+def _write_locations_to_gcs(job_id, scope_id, active_zones, active_regions):
+    """Saves a job's discovered zones and regions next to its report so later requests can reuse them."""
+    try:
+        blob = results_bucket.blob(f"{job_id}/{scope_id}_locations.json")
+        blob.upload_from_string(orjson.dumps({"zones": active_zones, "regions": active_regions}), content_type='application/json')
+    except Exception as e:
+        logger.warning("[%s] Could not write active locations to GCS: %s", job_id, e)
+
+@functools.lru_cache(maxsize=32)
+def _read_locations_from_gcs(job_id, scope_id):
+    """
+    Reads the zones and regions saved by `_write_locations_to_gcs`.
+
+    A finished job's locations never change, so they are cached per container.
+    Raises if the file is missing, which also keeps failures out of the cache.
+
+    Returns:
+        tuple: (active_zones, active_regions) as tuples.
+    """
+    data = orjson.loads(results_bucket.blob(f"{job_id}/{scope_id}_locations.json").download_as_bytes())
+    return tuple(data["zones"]), tuple(data["regions"])
+
 # --- Core Data Fetching and Analysis Functions ---
 
 def find_col_index(header_map, possible_names):
@@ -279,6 +732,15 @@ def find_col_index(header_map, possible_names):
             return header_map[name]
     raise KeyError(f"Could not find any of the required columns: {possible_names}")
 
+# Maps the MoSCoW label in the "Recommended to set" column to the expected boolean value
+_RECOMMENDATION_RE = re.compile(r"(should|must|could|wont) have")
+_RECOMMENDATION_EXPECTED_VALUES = {"should": "True", "must": "True", "could": "True", "wont": "False"}
+
+# Parsed best practices per URL as (expiry, ETag, parsed dict). The CSV rarely changes,
+# so it is only revalidated against the server every BEST_PRACTICES_TTL_SECONDS.
+BEST_PRACTICES_TTL_SECONDS = 300
+_best_practices_cache = {}
+
 def get_best_practices_from_gcs(public_url):
     """
     Downloads and parses a CSV file of GCP best practices from a public GCS URL.
@@ -291,58 +753,77 @@ def get_best_practices_from_gcs(public_url):
         dict: A dictionary of best practices grouped by category.
         str: An error message if the download or parsing fails.
     """
-    print("⬇️  Downloading best practices...")
+    cached = _best_practices_cache.get(public_url)
+    if cached and cached[0] > time.monotonic():
+        return cached[2]
+
+    # Once the TTL lapses, revalidate with the ETag; an unchanged file costs a 304 and no parsing
+    headers = {'If-None-Match': cached[1]} if cached and cached[1] else {}
+    logger.info("⬇️  Downloading best practices...")
     try:
-        response = requests.get(public_url)
-        response.raise_for_status()
-        reader = csv.reader(response.text.splitlines())
-        header_map = {h.strip().lower(): i for i, h in enumerate(next(reader))}
+        with _http_session.get(public_url, stream=True, headers=headers) as response:
+            if cached and response.status_code == 304:
+                _best_practices_cache[public_url] = (time.monotonic() + BEST_PRACTICES_TTL_SECONDS, cached[1], cached[2])
+                return cached[2]
+            response.raise_for_status()
+            etag = response.headers.get('ETag')
+            # Parse rows as the body streams in instead of holding the decoded text and its lines
+            response.raw.decode_content = True
+            reader = csv.reader(io.TextIOWrapper(response.raw, encoding='utf-8', newline=''))
+            header_map = {h.strip().lower(): i for i, h in enumerate(next(reader))}
         
-        id_col = find_col_index(header_map, ['id', 'constraint'])
-        name_col = find_col_index(header_map, ['display name', 'policy', 'policy name', 'name', 'policy display name', 'displayname'])
-        rec_col = find_col_index(header_map, ['recommended to set *'])
-
-        best_practices_by_category = {}
-        current_category = "Uncategorized"
-        policies_added = 0 
-
-        for row in reader:
-            if len([c for c in row if c.strip()]) == 1:
-                current_category = row[0].strip()
-                if current_category not in best_practices_by_category:
-                    best_practices_by_category[current_category] = []
-                continue
-                
-            if len(row) > max(id_col, name_col, rec_col) and row[id_col].strip():
-                
+            id_col = find_col_index(header_map, ['id', 'constraint'])
+            name_col = find_col_index(header_map, ['display name', 'policy', 'policy name', 'name', 'policy display name', 'displayname'])
+            rec_col = find_col_index(header_map, ['recommended to set *'])
+
+            best_practices_by_category = {}
+            current_category = "Uncategorized"
+            policies_added = 0 
+
+            for row in reader:
+                if len([c for c in row if c.strip()]) == 1:
+                    current_category = row[0].strip()
+                    if current_category not in best_practices_by_category:
+                        best_practices_by_category[current_category] = []
+                    continue
                 
-                recommendation_text = row[rec_col].strip().lower()
-                expected_value = None
-
-                if "should have" in recommendation_text or "must have" in recommendation_text or "could have" in recommendation_text:
-                    expected_value = "True"
-                elif "wont have" in recommendation_text:
-                    expected_value = "False"
+                if len(row) > max(id_col, name_col, rec_col) and (policy_id := row[id_col].strip()):
+                    match = _RECOMMENDATION_RE.search(row[rec_col].strip().lower())
+                    expected_value = _RECOMMENDATION_EXPECTED_VALUES[match.group(1)] if match else None
                 
-                # We still use "is not None" to correctly include policies that are "False"
-                if expected_value is not None:
-                    if current_category not in best_practices_by_category: 
-                        best_practices_by_category[current_category] = []
+                    # We still use "is not None" to correctly include policies that are "False"
+                    if expected_value is not None:
+                        if current_category not in best_practices_by_category: 
+                            best_practices_by_category[current_category] = []
                     
-                    best_practices_by_category[current_category].append({
-                        "policyId": row[id_col].strip(), 
-                        "displayName": row[name_col].strip(), 
-                        "expectedValue": expected_value
-                    })
-                    policies_added += 1
-                
+                        best_practices_by_category[current_category].append({
+                            "policyId": policy_id, 
+                            "displayName": row[name_col].strip(), 
+                            "expectedValue": expected_value
+                        })
+                        policies_added += 1
 
-        print(f"✅ CSV parsing complete. Loaded {policies_added} boolean policies into the checker.")
+        logger.info("✅ CSV parsing complete. Loaded %s boolean policies into the checker.", policies_added)
+        _best_practices_cache[public_url] = (time.monotonic() + BEST_PRACTICES_TTL_SECONDS, etag, best_practices_by_category)
         return best_practices_by_category
         
     except Exception as e:
         return f"Error downloading or parsing CSV: {e}"
     
+@functools.lru_cache(maxsize=256)
+def _get_project_ancestry(project_id):
+    """
+    Returns the getAncestry response for a project. A project's ancestry does not
+    change during a scan, so it is memoized and shared by every caller.
+    """
+    service = _get_service('cloudresourcemanager', 'v1')
+    return service.projects().getAncestry(projectId=project_id, body={}).execute()
+
+# Effective policies only change when someone edits an org policy, so repeated scans
+# of the same scope within a few minutes reuse the last successful traversal.
+EFFECTIVE_POLICIES_TTL_SECONDS = 300
+
+@_ttl_cache(EFFECTIVE_POLICIES_TTL_SECONDS, cache_if=lambda result: isinstance(result, dict))
 def get_effective_org_policies(scope, scope_id):
     """
     Calculates the effective organization policies for a resource by manually
@@ -357,31 +838,43 @@ def get_effective_org_policies(scope, scope_id):
         dict: A dictionary of effective organization policies, keyed by policy ID.
         str: An error message if fetching fails.
     """
-    print(f"🔍 Calculating effective policies for {scope} '{scope_id}' by traversing hierarchy...")
+    logger.info("🔍 Calculating effective policies for %s '%s' by traversing hierarchy...", scope, scope_id)
     try:
-        credentials, _ = google_auth_default(scopes=SCOPES)
         # Main client remains v1 for compatibility with listOrgPolicies
-        crm_service = google_api_build('cloudresourcemanager', 'v1', credentials=credentials)
+        crm_service = _get_service('cloudresourcemanager', 'v1')
 
         # --- START OF MODIFICATION ---
         # Initialize a separate v3 client specifically to bypass the v1 'get' bug for folder
-        crm_v3_service = google_api_build('cloudresourcemanager', 'v3', credentials=credentials)
+        crm_v3_service = _get_service('cloudresourcemanager', 'v3')
         # --- END OF MODIFICATION ---
 
+        def build_list_request(service, resource_str):
+            """Builds the listOrgPolicies request matching the resource type."""
+            if resource_str.startswith('organizations/'):
+                return service.organizations().listOrgPolicies(resource=resource_str, body={})
+            if resource_str.startswith('folders/'):
+                return service.folders().listOrgPolicies(resource=resource_str, body={})
+            return service.projects().listOrgPolicies(resource=resource_str, body={})
+
+        def policies_from_response(response):
+            """Keys the policies in a listOrgPolicies response by their short constraint name."""
+            policies = {}
+            for policy in response.get('policies', []):
+                if full_path := policy.get('constraint'):
+                    policies[full_path.split('/')[-1]] = policy
+            return policies
+
         def list_policies_for_resource(resource_str):
             """Helper to fetch and format policies for a given resource string."""
-            policies = {}
             try:
-                api_call = lambda: crm_service.organizations().listOrgPolicies(resource=resource_str, body={}).execute() if resource_str.startswith('organizations/') else \
-                                 crm_service.folders().listOrgPolicies(resource=resource_str, body={}).execute() if resource_str.startswith('folders/') else \
-                                 crm_service.projects().listOrgPolicies(resource=resource_str, body={}).execute()
-                response = _call_api_with_backoff(api_call, context_message=f"listOrgPolicies for {resource_str}")
-                for policy in response.get('policies', []):
-                    if full_path := policy.get('constraint'):
-                        policies[full_path.split('/')[-1]] = policy
+                # Runs on a pool thread, so use that thread's own client.
+                service = _get_service('cloudresourcemanager', 'v1')
+                api_call = lambda: build_list_request(service, resource_str).execute()
+                response = _call_api_with_backoff(api_call, context_message=f"listOrgPolicies for {resource_str}", api_name='cloudresourcemanager')
+                return policies_from_response(response)
             except Exception as e:
-                logging.warning(f"Could not list policies for {resource_str}: {e}")
-            return policies
+                logger.warning("Could not list policies for %s: %s", resource_str, e)
+                return {}
 
         effective_policies = {}
         resource_hierarchy = []
@@ -389,10 +882,13 @@ def get_effective_org_policies(scope, scope_id):
         if scope == 'organization':
             resource_hierarchy.append(f"organizations/{scope_id}")
         elif scope == 'project':
-            ancestry = crm_service.projects().getAncestry(projectId=scope_id, body={}).execute()
-            for ancestor in ancestry.get('ancestor', []):
+            ancestry = _get_project_ancestry(scope_id)
+            # getAncestry lists the project itself first and the organization last
+            for ancestor in reversed(ancestry.get('ancestor', [])):
                 resource_hierarchy.append(f"{ancestor['resourceId']['type']}s/{ancestor['resourceId']['id']}")
             resource_hierarchy.append(f"projects/{scope_id}")
+            # The batch keys requests by resource, so each level may only appear once
+            resource_hierarchy = list(dict.fromkeys(resource_hierarchy))
         elif scope == 'folder':
             ancestors = []
             curr_folder = f"folders/{scope_id}"
@@ -412,12 +908,35 @@ def get_effective_org_policies(scope, scope_id):
         if not resource_hierarchy:
             return f"Could not determine hierarchy for {scope} {scope_id}"
 
-        print(f"   -> Traversing hierarchy: {' -> '.join(resource_hierarchy)}")
+        logger.info("   -> Traversing hierarchy: %s", ' -> '.join(resource_hierarchy))
+        # Fetch every level in a single batched HTTP request
+        policies_by_level = {}
+
+        def store_batch_response(request_id, response, exception):
+            if exception is None:
+                policies_by_level[request_id] = policies_from_response(response)
+            else:
+                logger.warning("Batched listOrgPolicies failed for %s: %s", request_id, exception)
+
+        try:
+            batch = crm_service.new_batch_http_request(callback=store_batch_response)
+            for resource_str in resource_hierarchy:
+                batch.add(build_list_request(crm_service, resource_str), request_id=resource_str)
+            batch.execute()
+        except Exception as e:
+            logger.warning("Batched listOrgPolicies request failed: %s", e)
+
+        # Any level the batch could not serve is fetched individually, in parallel
+        missing_levels = [r for r in resource_hierarchy if r not in policies_by_level]
+        if missing_levels:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(missing_levels)) as executor:
+                policies_by_level.update(zip(missing_levels, executor.map(_with_cancel_event(list_policies_for_resource), missing_levels)))
+
+        # Merge top-down so the child's policy wins
         for resource_str in resource_hierarchy:
-            policies_at_level = list_policies_for_resource(resource_str)
-            effective_policies.update(policies_at_level)
+            effective_policies.update(policies_by_level[resource_str])
 
-        print(f"✅ Successfully calculated {len(effective_policies)} effective policies.")
+        logger.info("✅ Successfully calculated %s effective policies.", len(effective_policies))
         return effective_policies
 
     except Exception as e:
@@ -429,28 +948,27 @@ def list_projects_for_scope(scope, scope_id):
     Retrieves a list of all ACTIVE projects within a given scope (org, folder, or project)
     using the recursive Cloud Asset Inventory API for complete coverage.
     """
-    print(f"📋 Listing projects for {scope} '{scope_id}' using Cloud Asset Inventory...")
+    logger.info("📋 Listing projects for %s '%s' using Cloud Asset Inventory...", scope, scope_id)
 
     # The single-project case remains the fastest method for that specific scope.
     if scope == 'project':
         try:
-            credentials, _ = google_auth_default(scopes=SCOPES)
-            service = google_api_build('cloudresourcemanager', 'v1', credentials=credentials)
+            service = _get_service('cloudresourcemanager', 'v1')
             project = service.projects().get(projectId=scope_id).execute()
             if project.get('lifecycleState') == 'ACTIVE':
-                print(f"✅ Found 1 ACTIVE project.")
+                logger.info("✅ Found 1 ACTIVE project.")
                 # Return in the same format as the Asset API for consistency
                 return [{'projectId': project['projectId'], 'displayName': project.get('name', project['projectId'])}]
             else:
-                print("⚠️ Project is not ACTIVE.")
+                logger.warning("⚠️ Project is not ACTIVE.")
                 return []
         except Exception as e:
-            print(f"❌ Error fetching single project: {e}")
+            logger.error("❌ Error fetching single project: %s", e)
             return []
 
     # --- NEW RECURSIVE LOGIC USING CLOUD ASSET API ---
     try:
-        asset_client = asset_v1.AssetServiceClient()
+        asset_client = _get_grpc_client(asset_v1.AssetServiceClient)
 
         # Define the parent scope for the asset search
         parent_scope_map = {
@@ -459,7 +977,7 @@ def list_projects_for_scope(scope, scope_id):
         }
         asset_search_scope = parent_scope_map.get(scope)
         if not asset_search_scope:
-            print(f"❌ Invalid scope '{scope}' provided for asset search.")
+            logger.error("❌ Invalid scope '%s' provided for asset search.", scope)
             return []
 
         # Perform a single, recursive search for all projects
@@ -481,38 +999,40 @@ def list_projects_for_scope(scope, scope_id):
                 'displayName': resource.display_name
             })
         
-        print(f"✅ Found {len(all_projects)} ACTIVE projects recursively.")
+        logger.info("✅ Found %s ACTIVE projects recursively.", len(all_projects))
         return all_projects
 
     except Exception as e:
-        logging.error(f"❌ Critical error listing projects with Cloud Asset API: {e}")
+        logger.error("❌ Critical error listing projects with Cloud Asset API: %s", e)
         traceback.print_exc()
         return []
     
-def get_active_compute_locations(all_projects):
+def get_active_compute_locations(scope, scope_id, all_projects):
     """
-    Discovers active GCP zones and regions by scanning for various compute resources
-    across all projects in the organization. This helps focus subsequent checks
-    on relevant locations.
+    Discovers active GCP zones and regions by searching for various compute resources
+    across the scan scope. This helps focus subsequent checks on relevant locations.
+
+    A single Cloud Asset Inventory search covers every project in the scope at once.
+    If that search fails, each project is scanned individually via the Compute API.
 
     Args:
-        org_id (str): The ID of the organization.
+        scope (str): The scope ('organization', 'folder', 'project').
+        scope_id (str): The ID of the resource.
         all_projects (list): A list of project dictionaries.
 
     Returns:
         tuple: A tuple containing two lists: (active_zones, active_regions).
     """
-    print("📍 Discovering active compute zones and regions...")
+    logger.info("📍 Discovering active compute zones and regions...")
     active_zones, active_regions = set(), set()
 
     def scan_project(project):
         project_id = project['projectId']
         try:
-            credentials, _ = google_auth_default(scopes=SCOPES)
-            compute = google_api_build('compute', 'v1', credentials=credentials)
+            compute = _get_service('compute', 'v1')
             
             # Method 1: Discover zones from VM instances AND infer their regions
-            req = compute.instances().aggregatedList(project=project_id)
+            req = compute.instances().aggregatedList(project=project_id, fields='items/*/instances/id,nextPageToken')
             while req:
                 resp = req.execute()
                 for scope, result in resp.get('items', {}).items():
@@ -524,7 +1044,7 @@ def get_active_compute_locations(all_projects):
                 req = compute.instances().aggregatedList_next(previous_request=req, previous_response=resp)
 
             # Method 2: Discover regions from reserved IP Addresses (your suggestion)
-            req = compute.addresses().aggregatedList(project=project_id)
+            req = compute.addresses().aggregatedList(project=project_id, fields='items/*/addresses/id,nextPageToken')
             while req:
                 resp = req.execute()
                 for scope, result in resp.get('items', {}).items():
@@ -533,7 +1053,7 @@ def get_active_compute_locations(all_projects):
                 req = compute.addresses().aggregatedList_next(previous_request=req, previous_response=resp)
 
             # Method 3: Discover regions from Forwarding Rules (Load Balancers)
-            req = compute.forwardingRules().aggregatedList(project=project_id)
+            req = compute.forwardingRules().aggregatedList(project=project_id, fields='items/*/forwardingRules/id,nextPageToken')
             while req:
                 resp = req.execute()
                 for scope, result in resp.get('items', {}).items():
@@ -542,28 +1062,71 @@ def get_active_compute_locations(all_projects):
                 req = compute.forwardingRules().aggregatedList_next(previous_request=req, previous_response=resp)
 
         except Exception as e:
-            logging.warning(f"Could not scan locations for project {project_id}: {e}")
-    
-    with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-        executor.map(scan_project, all_projects)
+            logger.warning("Could not scan locations for project %s: %s", project_id, e)
+
+    asset_search_scope = {
+        'organization': f'organizations/{scope_id}',
+        'folder': f'folders/{scope_id}',
+        'project': f'projects/{scope_id}'
+    }.get(scope)
+
+    try:
+        # One recursive search replaces three paginated aggregatedList walks per project
+        asset_client = _get_grpc_client(asset_v1.AssetServiceClient)
+        response = asset_client.search_all_resources(
+            request={
+                "scope": asset_search_scope,
+                "asset_types": [
+                    "compute.googleapis.com/Instance",
+                    "compute.googleapis.com/Address",
+                    "compute.googleapis.com/ForwardingRule",
+                ],
+            }
+        )
+        for resource in response:
+            location = resource.location
+            if not location or location == 'global':
+                continue
+            if resource.asset_type == "compute.googleapis.com/Instance":
+                # Instances live in a zone; infer the region from it (e.g., 'us-central1-a' -> 'us-central1')
+                active_zones.add(location)
+                active_regions.add('-'.join(location.split('-')[:-1]))
+            else:
+                active_regions.add(location)
+    except Exception as e:
+        logger.warning("Could not discover locations with Cloud Asset API, scanning projects individually: %s", e)
+        active_zones.clear()
+        active_regions.clear()
+        # The scans only wait on the network, so run well above CPU count and
+        # surface per-project failures instead of discarding the map iterator.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=50) as executor:
+            future_to_project = {executor.submit(scan_project, p): p['projectId'] for p in all_projects}
+            for future in concurrent.futures.as_completed(future_to_project):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.warning("Location scan failed for project %s: %s", future_to_project[future], e)
 
     # Add 'global' as it's a valid location for some recommenders
     active_regions.add('global')
     
-    print(f"✅ Discovered {len(active_zones)} active zones and {len(active_regions)} active regions.")
+    logger.info("✅ Discovered %s active zones and %s active regions.", len(active_zones), len(active_regions))
     return list(active_zones), list(active_regions)
 
 def _get_parent_org():
     """Finds the parent organization of the current project."""
+    # Only successful lookups are cached, so a transient failure is retried on the next call
+    if cached_org_id := _read_boot_cache('ORG_ID'):
+        return cached_org_id
     try:
-        credentials, _ = google_auth_default(scopes=SCOPES)
-        service = google_api_build('cloudresourcemanager', 'v1', credentials=credentials)
-        ancestry = service.projects().getAncestry(projectId=PROJECT_ID, body={}).execute()
+        ancestry = _get_project_ancestry(PROJECT_ID)
         for resource in ancestry.get('ancestor', []):
             if resource.get('resourceId', {}).get('type') == 'organization':
-                return resource['resourceId']['id']
+                org_id = resource['resourceId']['id']
+                _write_boot_cache('ORG_ID', org_id)
+                return org_id
     except Exception as e:
-        print(f"⚠️ Could not automatically determine organization ID: {e}")
+        logger.warning("⚠️ Could not automatically determine organization ID: %s", e)
     return None
 
 @app.route('/api/list-resources')
@@ -579,7 +1142,7 @@ def list_resources():
 
     resources = []
     try:
-        asset_client = asset_v1.AssetServiceClient()
+        asset_client = _get_grpc_client(asset_v1.AssetServiceClient)
         parent_scope = f"organizations/{org_id}"
 
         if scope == 'organization':
@@ -595,7 +1158,7 @@ def list_resources():
         if not asset_type:
             return jsonify({"error": "Invalid scope"}), 400
 
-        print(f"🔍 Searching for assets of type '{asset_type}' under organization '{org_id}'...")
+        logger.info("🔍 Searching for assets of type '%s' under organization '%s'...", asset_type, org_id)
         response = asset_client.search_all_resources(
             request={
                 "scope": parent_scope,
@@ -615,53 +1178,249 @@ def list_resources():
         
         # Sort resources by name
         resources.sort(key=lambda x: x['name'])
-        print(f"✅ Found {len(resources)} resources.")
+        logger.info("✅ Found %s resources.", len(resources))
         return jsonify(resources)
 
     except Exception as e:
-        print(f"❌ Error listing resources: {e}")
+        logger.error("❌ Error listing resources: %s", e)
         traceback.print_exc()
         return jsonify({"error": f"Failed to list resources: {e}"}), 500
 
 # --- Helper function for backoff ---
 
-def _call_api_with_backoff(api_call_func, context_message="API call"):
+class _TokenBucket:
+    """
+    Thread-safe token bucket that paces calls to an API at a steady average rate.
+    Callers reserve a token up front and sleep off any deficit, so a burst of
+    parallel callers is spread out instead of all hitting the API at once.
+    """
+    def __init__(self, rate, capacity):
+        self.rate = rate  # tokens added per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+    def penalize(self):
+        """Drains the bucket after a 429 so every caller backs off for about a second."""
+        with self.lock:
+            self.tokens = min(self.tokens - 1, -self.rate)
+
+# Average requests per second and burst size allowed per API, shared by all threads.
+API_RATE_LIMITS = {
+    'cloudresourcemanager': (10, 10),
+    'recommender': (20, 20),
+    'gemini': (1, 10),  # ~60 requests per minute
+    'iam': (50, 50),
+    'monitoring': (50, 50),
+    'storage': (50, 50),
+}
+_rate_limiters = {api: _TokenBucket(rate, burst) for api, (rate, burst) in API_RATE_LIMITS.items()}
+
+def _retry_after_seconds(error):
+    """Returns the server's Retry-After hint in seconds for an HttpError, if it sent one."""
+    if isinstance(error, HttpError):
+        try:
+            return float(error.resp.get('retry-after'))
+        except (TypeError, ValueError):
+            pass
+    return None
+
+# Read-only calls still unanswered after this long are re-issued once (hedged); the
+# first response wins. Only used for idempotent list calls with a long latency tail.
+HEDGE_DELAY_SECONDS = 0.8
+# Hedged calls run on one process-wide pool rather than a fresh thread per call; the
+# pool only ever runs leaf API calls, so it can't deadlock on itself.
+HEDGE_POOL_MAX_WORKERS = 64
+_hedge_executor = concurrent.futures.ThreadPoolExecutor(max_workers=HEDGE_POOL_MAX_WORKERS, thread_name_prefix='hedge')
+
+def _hedged_call(api_call_func, delay, rate_limiter=None):
+    """
+    Runs api_call_func and, if it hasn't returned within delay seconds, starts a
+    second identical call and returns whichever succeeds first. The slower call
+    is left to finish in the background; its result is discarded.
+    """
+    primary = _hedge_executor.submit(api_call_func)
+    done, _ = concurrent.futures.wait([primary], timeout=delay)
+    if done:
+        return primary.result()
+
+    if rate_limiter:
+        rate_limiter.acquire()
+    hedge = _hedge_executor.submit(api_call_func)
+    pending = {primary, hedge}
+    while True:
+        done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+        if not pending:
+            # Both calls failed; surface the later error
+            return future.result()
+
+def _call_api_with_backoff(api_call_func, context_message="API call", api_name=None, reraise=(), hedge=False):
     """
     Wraps a Google Cloud API list call with exponential backoff to handle 429 rate limit errors.
+    When api_name has a configured rate limit, each attempt first waits for a token
+    so parallel callers stay under the API's quota instead of triggering 429s.
 
     Args:
         api_call_func: A lambda or function that executes the actual API call
                        (e.g., lambda: client.list_recommendations(parent=parent)).
+        context_message (str): Description of the call used in log messages.
+        api_name (str, optional): The API being called, e.g. 'recommender'.
+        reraise (tuple, optional): Exception types to propagate to the caller
+                                   instead of logging them and returning [].
+        hedge (bool, optional): Re-issue the call if it is slower than HEDGE_DELAY_SECONDS
+                                and take the first response. Only for read-only calls.
 
     Returns:
         The results of the API call, or an empty list if all retries fail.
     """
-    max_retries = 5
+    max_retries = 8
     initial_delay = 1.5  # seconds
     backoff_factor = 2
+    max_delay = 30.0  # seconds
+    rate_limiter = _rate_limiters.get(api_name)
 
     for attempt in range(max_retries):
+        _raise_if_cancelled()
+        if rate_limiter:
+            rate_limiter.acquire()
         try:
             # Execute the provided API call function
+            if hedge:
+                return _hedged_call(api_call_func, HEDGE_DELAY_SECONDS, rate_limiter)
             return api_call_func()
-        except core_exceptions.ResourceExhausted as e:
-            # This is the specific exception for 429 errors from google-api-core
+        except (core_exceptions.ResourceExhausted, core_exceptions.TooManyRequests, HttpError) as e:
+            # ResourceExhausted (gRPC) and TooManyRequests (JSON clients such as Cloud Storage)
+            # are the 429 errors from google-api-core; discovery clients raise HttpError
+            if isinstance(e, HttpError) and e.resp.status != 429:
+                if isinstance(e, reraise):
+                    raise
+                logger.error("An unexpected API error occurred for %s: %s", context_message, e)
+                return []
+            if rate_limiter:
+                rate_limiter.penalize()
             if attempt < max_retries - 1:
-                # Calculate wait time with exponential backoff and random jitter
-                delay = (initial_delay * (backoff_factor ** attempt)) + random.uniform(0, 1)
-                logging.warning(
-                    f"Rate limit hit (429) for for {context_message}. Retrying in {delay:.2f} seconds... (Attempt {attempt + 1}/{max_retries})"
-                )
+                # "Full jitter": pick uniformly below the capped exponential bound so
+                # concurrent callers spread their retries out instead of clustering
+                delay = random.uniform(0, min(max_delay, initial_delay * (backoff_factor ** attempt)))
+                # Never retry sooner than the server asked us to
+                delay = max(delay, _retry_after_seconds(e) or 0)
+                logger.warning("Rate limit hit (429) for for %s. Retrying in %.2f seconds... (Attempt %s/%s)", context_message, delay, attempt + 1, max_retries)
                 time.sleep(delay)
             else:
-                logging.error(f"API rate limit exceeded for {context_message} after {max_retries} attempts. Error: {e}")
+                if isinstance(e, reraise):
+                    raise
+                logger.error("API rate limit exceeded for %s after %s attempts. Error: %s", context_message, max_retries, e)
                 return [] # Return empty list after final failure
         except Exception as e:
+            if isinstance(e, reraise):
+                raise
             # For any other error, don't retry, just log it and move on.
-            logging.error(f"An unexpected API error occurred for {context_message}: {e}")
+            logger.error("An unexpected API error occurred for %s: %s", context_message, e)
             return []
     return [] # Should not be reached, but as a fallback
 
+def _map_over_projects(check_func, projects, max_workers=PROJECT_CHECK_MAX_WORKERS):
+    """
+    Runs a per-project check function across projects concurrently.
+    The per-project work is almost entirely waiting on API round trips, so a
+    bounded thread pool overlaps those waits instead of paying them one by one.
+
+    Args:
+        check_func: A function taking a single project dictionary.
+        projects (list): A list of project dictionaries.
+
+    Returns:
+        list: The return value of check_func for each project, in project order.
+    """
+    if not projects:
+        return []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(projects))) as executor:
+        return list(executor.map(_with_cancel_event(check_func), projects))
+
+def _execute_paged_batch(service, requests_by_id, next_page_func):
+    """
+    Sends many discovery list requests as batched HTTP requests, following each
+    one's page tokens in further batch rounds until every listing is complete.
+
+    Args:
+        service: The discovery client the requests were built from.
+        requests_by_id (dict): Maps a request ID (e.g. project ID) to its first-page request.
+        next_page_func: The collection's *_next method, e.g. compute.firewalls().list_next.
+
+    Returns:
+        tuple: ({request_id: [response pages]}, set of request IDs whose sub-request failed)
+    """
+    pages, failed = defaultdict(list), set()
+    pending = requests_by_id
+    while pending:
+        _raise_if_cancelled()
+        next_round = {}
+
+        def store_page(request_id, response, exception):
+            if exception is not None:
+                failed.add(request_id)
+                return
+            pages[request_id].append(response)
+            next_request = next_page_func(pending[request_id], response)
+            if next_request is not None:
+                next_round[request_id] = next_request
+
+        batch = service.new_batch_http_request(callback=store_page)
+        for request_id, req in pending.items():
+            batch.add(req, request_id=request_id)
+        batch.execute()
+        pending = next_round
+    return pages, failed
+
+# --- Org-Level Response Cache ---
+
+ORG_RESPONSE_TTL_SECONDS = 900
+
+# Org-level responses don't change within a scan, so repeated or retried checks reuse them.
+@_ttl_cache(ORG_RESPONSE_TTL_SECONDS)
+def _fetch_org_iam_policy(org_id):
+    service = _get_service('cloudresourcemanager', 'v1')
+    return service.organizations().getIamPolicy(resource=f'organizations/{org_id}', body={}).execute()
+
+@_ttl_cache(ORG_RESPONSE_TTL_SECONDS)
+def _fetch_org_log_sinks(org_id):
+    service = _get_service('logging', 'v2')
+    return service.organizations().sinks().list(parent=f'organizations/{org_id}', fields='sinks(name,destination)').execute().get('sinks', [])
+
+@_ttl_cache(ORG_RESPONSE_TTL_SECONDS)
+def _fetch_scc_settings(org_id):
+    service = _get_service('securitycenter', 'v1')
+    return service.organizations().getOrganizationSettings(name=f"organizations/{org_id}/organizationSettings").execute()
+
+@_ttl_cache(ORG_RESPONSE_TTL_SECONDS)
+def _fetch_service_health_events(org_id):
+    """Returns (status_code, raw body bytes) so the body is only decoded when it's needed."""
+    headers = {"Authorization": f"Bearer {_get_access_token()}"}
+    url = f"https://servicehealth.googleapis.com/v1beta/organizations/{org_id}/locations/global/organizationEvents?filter=state=ACTIVE%20category=INCIDENT"
+    response = _http_session.get(url, headers=headers)
+    if response.status_code not in (200, 403):
+        response.raise_for_status()
+    return response.status_code, response.content
+
+@_ttl_cache(ORG_RESPONSE_TTL_SECONDS)
+def _fetch_essential_contacts(org_id):
+    service = _get_service('essentialcontacts', 'v1')
+    return service.organizations().contacts().list(parent=f"organizations/{org_id}", fields='contacts(notificationCategorySubscriptions)').execute().get('contacts', [])
+
 # --- Security & Identity Checks ---
 
 def check_org_iam_policy(org_id, job_id):
@@ -676,22 +1435,26 @@ def check_org_iam_policy(org_id, job_id):
     """
     CHECK_NAME_CRITICAL = "Critical Org-Level Roles"
     CHECK_NAME_PUBLIC = "Public Org-Level Access"
-    print(f"🕵️  [{job_id}] Checking for {CHECK_NAME_CRITICAL} and {CHECK_NAME_PUBLIC}...")
+    logger.info("🕵️  [%s] Checking for %s and %s...", job_id, CHECK_NAME_CRITICAL, CHECK_NAME_PUBLIC)
 
     try:
-        credentials, _ = google_auth_default(scopes=SCOPES)
-        service = google_api_build('cloudresourcemanager', 'v1', credentials=credentials)
-        policy = service.organizations().getIamPolicy(resource=f'organizations/{org_id}', body={}).execute()
+        policy = _fetch_org_iam_policy(org_id)
         
-        critical_roles = ['roles/owner', 'roles/resourcemanager.organizationAdmin']
-        public_principals = ['allUsers', 'allAuthenticatedUsers']
+        critical_roles = frozenset(('roles/owner', 'roles/resourcemanager.organizationAdmin'))
+        public_principals = frozenset(('allUsers', 'allAuthenticatedUsers'))
+
+        # Single pass over the bindings collects both the critical-role and public-access findings
+        crit_role_findings, public_access_findings = [], []
+        for b in policy.get('bindings', ()):
+            role = b.get('role')
+            is_critical = role in critical_roles
+            for m in b.get('members', ()):
+                if is_critical:
+                    crit_role_findings.append({"Role": role, "Principal": m})
+                if m in public_principals:
+                    public_access_findings.append({"Role": role, "Principal": m})
 
         # --- Check 1: Critical Org-Level Roles ---
-        crit_role_findings = [{"Role": b.get('role'), "Principal": m} 
-                              for b in policy.get('bindings', []) 
-                              if b.get('role') in critical_roles 
-                              for m in b.get('members', [])]
-        
         if crit_role_findings:
             result_crit = {"Check": CHECK_NAME_CRITICAL, "Finding": crit_role_findings, "Status": "Action Required"}
         else:
@@ -699,11 +1462,6 @@ def check_org_iam_policy(org_id, job_id):
         _write_finding_to_gcs(job_id, CHECK_NAME_CRITICAL.replace(" ", "_"), result_crit)
 
         # --- Check 2: Public Org-Level Access ---
-        public_access_findings = [{"Role": b.get('role'), "Principal": m} 
-                                  for b in policy.get('bindings', []) 
-                                  for m in b.get('members', []) 
-                                  if m in public_principals]
-        
         if public_access_findings:
             result_public = {"Check": CHECK_NAME_PUBLIC, "Finding": public_access_findings, "Status": "Action Required"}
         else:
@@ -726,11 +1484,9 @@ def check_audit_logging(org_id, job_id):
         list: A list of finding dictionaries.
     """
     CHECK_NAME = "Organization Log Sink"
-    print(f"📜 [{job_id}] Checking for {CHECK_NAME}...")
+    logger.info("📜 [%s] Checking for %s...", job_id, CHECK_NAME)
     try:
-        credentials, _ = google_auth_default(scopes=SCOPES)
-        service = google_api_build('logging', 'v2', credentials=credentials)
-        sinks = service.organizations().sinks().list(parent=f'organizations/{org_id}').execute().get('sinks', [])
+        sinks = _fetch_org_log_sinks(org_id)
         if sinks:
             finding_data = [{"Sink Name": s['name'], "Destination": s['destination']} for s in sinks]
             result = {"Check": CHECK_NAME, "Finding": finding_data, "Status": "Compliant"}
@@ -751,11 +1507,9 @@ def check_scc_status(org_id, job_id):
         list: A list of finding dictionaries. Recommends 'PREMIUM' tier.
     """
     CHECK_NAME = "Security Command Center Status"
-    print(f"🛡️  [{job_id}] Checking {CHECK_NAME}...")
+    logger.info("🛡️  [%s] Checking %s...", job_id, CHECK_NAME)
     try:
-        credentials, _ = google_auth_default(scopes=SCOPES)
-        service = google_api_build('securitycenter', 'v1', credentials=credentials)
-        settings = service.organizations().getOrganizationSettings(name=f"organizations/{org_id}/organizationSettings").execute()
+        settings = _fetch_scc_settings(org_id)
         tier = settings.get('tier', 'STANDARD')
         status = "Compliant" if tier == "PREMIUM" else "Action Required"
         finding = {"Tier": tier, "Recommendation": "Premium tier provides advanced threat detection." if status == "Action Required" else "N/A"}
@@ -780,21 +1534,14 @@ def check_service_health_status(org_id, job_id):
         list: A list of finding dictionaries indicating the status.
     """
     CHECK_NAME = "Personalized Service Health"
-    print(f"❤️‍🩹 [{job_id}] Checking {CHECK_NAME}...")
+    logger.info("❤️‍🩹 [%s] Checking %s...", job_id, CHECK_NAME)
     try:
-        credentials, _ = google_auth_default(scopes=SCOPES)
-        credentials.refresh(GoogleAuthRequest())
-        headers = {"Authorization": f"Bearer {credentials.token}"}
-        url = f"https://servicehealth.googleapis.com/v1beta/organizations/{org_id}/locations/global/organizationEvents?filter=state=ACTIVE%20category=INCIDENT"
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            result = {"Check": CHECK_NAME, "Finding": [{"Status": "Enabled"}], "Status": "Compliant"}
-        elif response.status_code == 403:
-            error = response.json().get('error', {}).get('message', 'Permission denied.')
+        status_code, content = _fetch_service_health_events(org_id)
+        if status_code == 403:
+            error = orjson.loads(content).get('error', {}).get('message', 'Permission denied.')
             result = {"Check": CHECK_NAME, "Finding": [{"Error": error}], "Status": "Error"}
         else:
-            response.raise_for_status()
-            result = {"Check": CHECK_NAME, "Finding": [{"Status": "Enabled"}], "Status": "Compliant"} # Should not be reached on error
+            result = {"Check": CHECK_NAME, "Finding": [{"Status": "Enabled"}], "Status": "Compliant"}
     except Exception as e:
         result = {"Check": CHECK_NAME, "Finding": [{"Error": str(e)}], "Status": "Error"}
     _write_finding_to_gcs(job_id, CHECK_NAME.replace(" ", "_"), result)
@@ -811,11 +1558,9 @@ def check_essential_contacts(org_id, job_id):
         list: A list of finding dictionaries indicating missing contact categories.
     """
     CHECK_NAME = "Essential Contacts"
-    print(f"📞 [{job_id}] Checking for {CHECK_NAME}...")
+    logger.info("📞 [%s] Checking for %s...", job_id, CHECK_NAME)
     try:
-        credentials, _ = google_auth_default(scopes=SCOPES)
-        service = google_api_build('essentialcontacts', 'v1', credentials=credentials)
-        contacts = service.organizations().contacts().list(parent=f"organizations/{org_id}").execute().get('contacts', [])
+        contacts = _fetch_essential_contacts(org_id)
         found = {c.get('notificationCategorySubscriptions', [])[0] for c in contacts if c.get('notificationCategorySubscriptions')}
         missing = sorted(list({"SECURITY", "TECHNICAL", "LEGAL"} - found))
         
@@ -845,28 +1590,59 @@ def check_project_iam_policy(scope_id, projects, job_id):
         list: A list of finding dictionaries detailing primitive role usage.
     """
     CHECK_NAME = "Primitive Roles (Owner or Editor)"
-    print(f"🕵️  [{job_id}] Checking for {CHECK_NAME} in parallel...")
+    logger.info("🕵️  [%s] Checking for %s in parallel...", job_id, CHECK_NAME)
     if not projects: 
         result = {"Check": "Project IAM Hygiene", "Finding": [{"Error": "Could not list projects."}], "Status": "Error"}
         _write_finding_to_gcs(job_id, CHECK_NAME.replace(" ", "_"), result)
         return
     
+    def findings_from_policy(project_id, policy):
+        findings = []
+        for b in policy.get('bindings', []):
+            if b.get('role') in ['roles/owner', 'roles/editor']:
+                for member in b.get('members', []):
+                    findings.append({'Project': project_id, 'Principal': member, 'Role': b.get('role')})
+        return findings
+
     def check_single_project(p):
-        project_id, findings = p['projectId'], []
+        project_id = p['projectId']
         try:
-            credentials, _ = google_auth_default(scopes=SCOPES)
-            service = google_api_build('cloudresourcemanager', 'v1', credentials=credentials)
+            service = _get_service('cloudresourcemanager', 'v1')
             policy = service.projects().getIamPolicy(resource=project_id, body={}).execute()
-            for b in policy.get('bindings', []):
-                if b.get('role') in ['roles/owner', 'roles/editor']:
-                    for member in b.get('members', []):
-                        findings.append({'Project': project_id, 'Principal': member, 'Role': b.get('role')})
-        except Exception as e: logging.warning(f"Could not check {CHECK_NAME} for {project_id}: {e}")
+            return findings_from_policy(project_id, policy)
+        except Exception as e: logger.warning("Could not check %s for %s: %s", CHECK_NAME, project_id, e)
+        return []
+
+    def check_project_batch(batch_projects):
+        """Fetches the IAM policies for a group of projects in one batched HTTP request."""
+        policies = {}
+
+        def store_policy(request_id, response, exception):
+            if exception is None:
+                policies[request_id] = response
+
+        try:
+            service = _get_service('cloudresourcemanager', 'v1')
+            batch = service.new_batch_http_request(callback=store_policy)
+            for p in batch_projects:
+                batch.add(service.projects().getIamPolicy(resource=p['projectId'], body={}), request_id=p['projectId'])
+            batch.execute()
+        except Exception as e:
+            logger.warning("Batched getIamPolicy failed for %s projects, falling back to single calls: %s", len(batch_projects), e)
+
+        findings = []
+        for p in batch_projects:
+            if p['projectId'] in policies:
+                findings.extend(findings_from_policy(p['projectId'], policies[p['projectId']]))
+            else:
+                # The batch (or this sub-request) failed, so fetch the policy on its own
+                findings.extend(check_single_project(p))
         return findings
 
+    project_batches = [projects[i:i + IAM_POLICY_BATCH_SIZE] for i in range(0, len(projects), IAM_POLICY_BATCH_SIZE)]
     all_findings = []
-    for project in projects:
-        all_findings.extend(check_single_project(project))
+    for findings in _map_over_projects(check_project_batch, project_batches):
+        all_findings.extend(findings)
     
     if all_findings:
         result = {"Check": CHECK_NAME, "Finding": all_findings, "Status": "Action Required"}
@@ -887,35 +1663,61 @@ def check_os_config_coverage(scope_id, all_projects, job_id):
         list: A list of finding dictionaries listing VMs without OS Config agent coverage.
     """
     CHECK_NAME = "OS Config Agent Coverage"
-    print(f"🤖 [{job_id}] Checking for {CHECK_NAME} in parallel...")
+    logger.info("🤖 [%s] Checking for %s in parallel...", job_id, CHECK_NAME)
     if not all_projects: return []
 
     def check_single_project(project):
         project_id = project['projectId']
         try:
-            credentials, _ = google_auth_default(scopes=SCOPES)
-            compute = google_api_build('compute', 'v1', credentials=credentials)
-            osconfig = osconfig_v1.OsConfigZonalServiceClient()
-            vms, req = [], compute.instances().aggregatedList(project=project_id, filter='status = "RUNNING"')
+            compute = _get_service('compute', 'v1')
+            osconfig = _get_grpc_client(osconfig_v1.OsConfigZonalServiceClient)
+            # Only the fields used below are requested; nextPageToken keeps pagination working
+            req = compute.instances().aggregatedList(
+                project=project_id, filter='status = "RUNNING"',
+                fields='items/*/instances(id,name,zone,labels,metadata/items/key),nextPageToken'
+            )
+            candidates_by_zone = defaultdict(list)
             while req:
                 resp = req.execute(); req = compute.instances().aggregatedList_next(previous_request=req, previous_response=resp)
                 for res in resp.get('items', {}).values():
-                    if 'instances' in res: vms.extend(res['instances'])
-            if not vms: return None
-
-            # --- FIX: Added a filter to exclude Dataproc VMs by label ---
-            missing = [
-                vm['name'] for vm in vms
-                if not vm['name'].startswith('gke-')
-                and 'goog-dataproc-cluster-name' not in vm.get('labels', {})
-                and not any(item.get('key') == 'gke-cluster-name' for item in vm.get('metadata', {}).get('items', []))
-                and not _is_os_reporting(osconfig, project_id, vm)
-            ]
+                    for vm in res.get('instances', []):
+                        # --- FIX: Added a filter to exclude Dataproc VMs by label ---
+                        if (vm['name'].startswith('gke-')
+                                or 'goog-dataproc-cluster-name' in vm.get('labels', {})
+                                or any(item.get('key') == 'gke-cluster-name' for item in vm.get('metadata', {}).get('items', []))):
+                            continue
+                        candidates_by_zone[vm['zone'].split('/')[-1]].append(vm)
+            if not candidates_by_zone: return None
+
+            def zone_reporting_instances(zone):
+                """Lists every inventory in a zone with one paged call instead of one get per VM."""
+                parent = f"projects/{project_id}/locations/{zone}/instances/-"
+                inventories = osconfig.list_inventories(request={"parent": parent, "view": osconfig_v1.InventoryView.BASIC})
+                # Inventory names look like .../instances/{instance}/inventory
+                return {inventory.name.split('/')[-2] for inventory in inventories}
+
+            missing = []
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(OS_INVENTORY_PROBE_MAX_WORKERS, len(candidates_by_zone))) as executor:
+                future_to_zone = {executor.submit(_with_cancel_event(zone_reporting_instances), zone): zone for zone in candidates_by_zone}
+                for future in concurrent.futures.as_completed(future_to_zone):
+                    zone = future_to_zone[future]
+                    try:
+                        reporting = future.result()
+                    except core_exceptions.FailedPrecondition:
+                        raise
+                    except Exception as e:
+                        # Fall back to probing this zone's VMs one by one
+                        logger.warning("Could not list inventories for %s in %s, probing VMs individually: %s", project_id, zone, e)
+                        reporting = {vm['name'] for vm in candidates_by_zone[zone] if _is_os_reporting(osconfig, project_id, vm)}
+                    missing.extend(
+                        vm['name'] for vm in candidates_by_zone[zone]
+                        if vm.get('id') not in reporting and vm['name'] not in reporting
+                    )
 
             if missing: return {"Project": project_id, "VMs Not Reporting": ", ".join(sorted(missing))}
         except core_exceptions.FailedPrecondition:
             return {"Project": project_id, "Issue": "OS inventory management disabled."}
-        except Exception as e: logging.warning(f"Could not check {CHECK_NAME} for {project_id}: {e}")
+        except Exception as e: logger.warning("Could not check %s for %s: %s", CHECK_NAME, project_id, e)
         return None
 
     def _is_os_reporting(client, project, vm):
@@ -928,13 +1730,8 @@ def check_os_config_coverage(scope_id, all_projects, job_id):
         except Exception:
             return False
 
-    results = []
-    for project in all_projects:
-        # check_single_project returns a single dictionary or None
-        finding = check_single_project(project)
-        if finding:
-            # We append the single dictionary to our list of results
-            results.append(finding)
+    # check_single_project returns a single dictionary or None
+    results = [finding for finding in _map_over_projects(check_single_project, all_projects) if finding]
 
     if not results:
         result = {"Check": CHECK_NAME, "Finding": [{"Status": "All unmanaged VMs appear to have OS Config agent."}], "Status": "Compliant"}
@@ -955,31 +1752,39 @@ def check_monitoring_coverage(scope_id, all_projects, job_id):
         list: A list of finding dictionaries for projects missing essential alerts.
     """
     CHECK_NAME = "Monitoring Alert Coverage"
-    print(f"📊 [{job_id}] Checking {CHECK_NAME} in parallel...")
+    logger.info("📊 [%s] Checking %s in parallel...", job_id, CHECK_NAME)
     if not all_projects: return []
     
     def check_project(project):
         project_id, issues = project['projectId'], []
         try:
-            credentials, _ = google_auth_default(scopes=SCOPES)
-            monitor = google_api_build('monitoring', 'v3', credentials=credentials)
-            asset = asset_v1.AssetServiceClient(credentials=credentials)
-            policies = monitor.projects().alertPolicies().list(name=f"projects/{project_id}").execute().get('alertPolicies', [])
+            monitor = _get_service('monitoring', 'v3')
+            asset = _get_grpc_client(asset_v1.AssetServiceClient)
+            policies = _call_api_with_backoff(
+                lambda: monitor.projects().alertPolicies().list(
+                    name=f"projects/{project_id}", fields='alertPolicies(conditions/conditionThreshold/filter)'
+                ).execute(),
+                context_message=f"Listing alert policies for {project_id}", api_name='monitoring', reraise=(Exception,)
+            ).get('alertPolicies', [])
             filters = " ".join(c.get('conditionThreshold', {}).get('filter', '') for p in policies for c in p.get('conditions', [])).lower()
             
             asset_map = {'sqladmin.googleapis.com/Instance': 'Cloud SQL', 'container.googleapis.com/Cluster': 'GKE Cluster', 'compute.googleapis.com/ForwardingRule': 'Load Balancer'}
             for asset_type, name in asset_map.items():
-                if list(asset.list_assets(request={"parent": f"projects/{project_id}", "asset_types": [asset_type]})) and name.lower().replace(" ", "_") not in filters:
+                # Check the alert filters first; the asset lookup is only needed when no alert covers this type
+                if name.lower().replace(" ", "_") in filters:
+                    continue
+                # Only existence matters, so fetch a single asset instead of paging through all of them
+                assets = asset.list_assets(request={"parent": f"projects/{project_id}", "asset_types": [asset_type], "page_size": 1})
+                if next(iter(assets), None) is not None:
                     issues.append({"Project": project_id, "Issue": f"Missing alert policy for {name}"})
             if "serviceruntime.googleapis.com/quota" not in filters:
                 issues.append({"Project": project_id, "Issue": "Missing Quota alerting policy"})
-        except Exception as e: logging.warning(f"Could not check {CHECK_NAME} for {project_id}: {e}")
+        except Exception as e: logger.warning("Could not check %s for %s: %s", CHECK_NAME, project_id, e)
         return issues
         
     results = []
-    for project in all_projects:
-        # check_project returns a list of findings for the project
-        findings = check_project(project)
+    # check_project returns a list of findings for the project
+    for findings in _map_over_projects(check_project, all_projects):
         if findings:
             # We extend the main results list with the items from the findings list
             results.extend(findings)
@@ -991,6 +1796,27 @@ def check_monitoring_coverage(scope_id, all_projects, job_id):
     _write_finding_to_gcs(job_id, CHECK_NAME.replace(" ", "_"), result)
 
 
+# Network Analyzer insight types checked by run_network_insights, keyed by check name
+NETWORK_INSIGHT_TYPES = {
+    "VPC IP Address Utilization": "google.networkanalyzer.vpcnetwork.ipAddressInsight",
+    "VPC Connectivity": "google.networkanalyzer.vpcnetwork.connectivityInsight",
+    "Load Balancer Health": "google.networkanalyzer.networkservices.loadBalancerInsight",
+    "GKE IP Address Utilization": "google.networkanalyzer.container.ipAddressInsight",
+    "GKE Connectivity": "google.networkanalyzer.container.connectivityInsight",
+    "GKE Service Account": "google.networkanalyzer.container.serviceAccountInsight",
+    "Dynamic Route Health": "google.networkanalyzer.hybridconnectivity.dynamicRouteInsight",
+    "Cloud SQL Connectivity": "google.networkanalyzer.managedservices.cloudSqlInsight",
+}
+
+# Extracts the cluster name from a GKE service account insight description
+_GKE_CLUSTER_RE = re.compile(r"GKE cluster '([^']+)'")
+
+# Response field mask for network list_insights calls: only what the parser reads,
+# plus the page token so pagination keeps working.
+NETWORK_INSIGHT_FIELD_MASK = (
+    ('x-goog-fieldmask', 'insights.name,insights.description,insights.content,insights.target_resources,next_page_token'),
+)
+
 def run_network_insights(scope_id, all_projects, active_zones, active_regions, job_id):
     """
     Fetches and parses Network Analyzer insights across all projects.
@@ -1005,19 +1831,23 @@ def run_network_insights(scope_id, all_projects, active_zones, active_regions, j
     Returns:
         list: A list of finding dictionaries, grouped by insight type.
     """
-    print("🌐 Performing Network Insights checks (Final Normalized Parser)...")
+    logger.info("🌐 Performing Network Insights checks (Final Normalized Parser)...")
     if not all_projects: return []
     
     all_locations = active_zones + active_regions
 
     # --- THIS HELPER FUNCTION DOES ALL THE PARSING ---
-    def _parse_network_insight_content(insight_dict, description, project_id, check_name):
+    def _parse_network_insight_content(insight, description, project_id, check_name):
         """
         Helper to parse raw insight data into a structured dictionary. This version includes
         the corrected logic for extracting the GKE cluster name for serviceAccountInsight.
+
+        Reads the Insight proto directly: its Struct content behaves like a dict whose
+        nested values are only converted when accessed, so only the fields a parser
+        touches are materialized instead of the whole message.
         """
         parsed_findings_list = []
-        content_dict = insight_dict.get('content', {})
+        content_dict = insight.content or {}
         
         if check_name == "GKE Service Account":
             resource_name = "N/A"  # Default value
@@ -1027,19 +1857,19 @@ def run_network_insights(scope_id, all_projects, active_zones, active_regions, j
                 # Path: content -> nodeServiceAccountInsight -> clusterUri
                 cluster_uri = content_dict.get('nodeServiceAccountInsight', {}).get('clusterUri')
                 if cluster_uri and isinstance(cluster_uri, str):
-                    resource_name = cluster_uri.split('/')[-1]
+                    resource_name = cluster_uri.rpartition('/')[2]
             except Exception:
                 pass # Failsafe
 
             # Method 2 (Excellent Fallback): Use the top-level 'target_resources' field.
             if resource_name == "N/A":
-                target_resources = insight_dict.get('target_resources', [])
+                target_resources = insight.target_resources
                 if target_resources and isinstance(target_resources[0], str):
-                    resource_name = target_resources[0].split('/')[-1]
+                    resource_name = target_resources[0].rpartition('/')[2]
 
             # Method 3 (Final Fallback): Regex on the description string.
             if resource_name == "N/A":
-                match = re.search(r"GKE cluster '([^']+)'", description)
+                match = _GKE_CLUSTER_RE.search(description)
                 if match:
                     resource_name = match.group(1)
 
@@ -1062,9 +1892,9 @@ def run_network_insights(scope_id, all_projects, active_zones, active_regions, j
             if 'ipUtilizationSummaryInfo' in content_dict:
                 for info in content_dict.get('ipUtilizationSummaryInfo', []):
                     for net_stat in info.get('networkStats', []):
-                        network = net_stat.get('networkUri', 'N/A').split('/')[-1]
+                        network = net_stat.get('networkUri', 'N/A').rpartition('/')[2]
                         for sub_stat in net_stat.get('subnetStats', []):
-                            subnet = sub_stat.get('subnetUri', 'N/A').split('/')[-1]
+                            subnet = sub_stat.get('subnetUri', 'N/A').rpartition('/')[2]
                             for range_stat in sub_stat.get('subnetRangeStats', []):
                                 parsed_findings_list.append({
                                     "Project": project_id,
@@ -1078,7 +1908,7 @@ def run_network_insights(scope_id, all_projects, active_zones, active_regions, j
             if 'psaIpUtilizationSummaryInfo' in content_dict:
                 for info in content_dict.get('psaIpUtilizationSummaryInfo', []):
                     for net_stat in info.get('networkStats', []):
-                        network = net_stat.get('networkUri', 'N/A').split('/')[-1]
+                        network = net_stat.get('networkUri', 'N/A').rpartition('/')[2]
                         for psa_stat in net_stat.get('psaStats', []):
                             parsed_findings_list.append({
                                 "Project": project_id,
@@ -1095,7 +1925,7 @@ def run_network_insights(scope_id, all_projects, active_zones, active_regions, j
                         parsed_findings_list.append({
                             "Project": project_id,
                             "Finding Type": "GKE Utilization",
-                            "Resource": f"Cluster: {cluster_stat.get('clusterUri', 'N/A').split('/')[-1]}",
+                            "Resource": f"Cluster: {cluster_stat.get('clusterUri', 'N/A').rpartition('/')[2]}",
                             "Detail": f"Pod Range Usage: {cluster_stat.get('podRangesAllocationRatio', 0) * 100:.2f}%",
                             "Value": f"Service Range Usage: {cluster_stat.get('serviceRangesAllocationRatio', 0) * 100:.2f}%"
                         })
@@ -1125,57 +1955,68 @@ def run_network_insights(scope_id, all_projects, active_zones, active_regions, j
         return parsed_findings_list
     
 
-    insight_type_map = {
-        "VPC IP Address Utilization": "google.networkanalyzer.vpcnetwork.ipAddressInsight",
-        "VPC Connectivity": "google.networkanalyzer.vpcnetwork.connectivityInsight",
-        "Load Balancer Health": "google.networkanalyzer.networkservices.loadBalancerInsight",
-        "GKE IP Address Utilization": "google.networkanalyzer.container.ipAddressInsight",
-        "GKE Connectivity": "google.networkanalyzer.container.connectivityInsight",
-        "GKE Service Account": "google.networkanalyzer.container.serviceAccountInsight",
-        "Dynamic Route Health": "google.networkanalyzer.hybridconnectivity.dynamicRouteInsight",
-        "Cloud SQL Connectivity": "google.networkanalyzer.managedservices.cloudSqlInsight",
-    }
+    # Every (location, insight type) pair is an independent list_insights call
+    insight_targets = [
+        (loc, check_name, insight_type_id)
+        for loc in all_locations
+        for check_name, insight_type_id in NETWORK_INSIGHT_TYPES.items()
+    ]
 
     def check_project(project):
         project_id = project['projectId']
         project_findings_map = {} 
         try:
-            client = recommender_v1.RecommenderClient()
-            for loc in all_locations:
-                for check_name, insight_type_id in insight_type_map.items(): 
-                    parent = f"projects/{project_id}/locations/{loc}/insightTypes/{insight_type_id}"
-                    try:
-                        api_call = lambda: client.list_insights(parent=parent)
-                        context = f"'{check_name}' in {project_id} at {loc}"
-                        for insight in _call_api_with_backoff(api_call,context_message=context):
-                            parsed_data_list = []
-                            try:
-                                insight_dict = Insight.to_dict(insight)
-                                
-                                # --- MODIFIED CALL ---
-                                # Pass the check_name INTO the parser so it knows what it's parsing.
-                                parsed_data_list = _parse_network_insight_content(insight_dict, insight.description, project_id, check_name)
-
-                            except Exception as e:
-                                parsed_data_list = [{"Project": project_id, "Finding Type": "Top-level Parse Error", "Resource": insight.description, "Detail": str(e), "Value": "N/A"}]
-                            
-                            if check_name not in project_findings_map:
-                                project_findings_map[check_name] = []
-
-                            project_findings_map[check_name].extend(parsed_data_list)
-                            
-                    except Exception:
-                        pass 
+            client = _get_grpc_client(recommender_v1.RecommenderClient)
+
+            # Insight types the project cannot serve (API disabled or not permitted). These
+            # errors are project-wide, so the remaining locations for the type are skipped.
+            unavailable_types = set()
+
+            def fetch_insights(target):
+                loc, check_name, insight_type_id = target
+                parsed_findings = []
+                if insight_type_id in unavailable_types:
+                    return check_name, parsed_findings
+                parent = f"projects/{project_id}/locations/{loc}/insightTypes/{insight_type_id}"
+                try:
+                    api_call = lambda: client.list_insights(parent=parent, metadata=NETWORK_INSIGHT_FIELD_MASK)
+                    context = f"'{check_name}' in {project_id} at {loc}"
+                    insights = _call_api_with_backoff(
+                        api_call, context_message=context, api_name='recommender',
+                        reraise=(core_exceptions.FailedPrecondition, core_exceptions.PermissionDenied), hedge=True
+                    )
+                    for insight in insights:
+                        parsed_data_list = []
+                        try:
+                            # --- MODIFIED CALL ---
+                            # Pass the check_name INTO the parser so it knows what it's parsing.
+                            parsed_data_list = _parse_network_insight_content(insight, insight.description, project_id, check_name)
+
+                        except Exception as e:
+                            parsed_data_list = [{"Project": project_id, "Finding Type": "Top-level Parse Error", "Resource": insight.description, "Detail": str(e), "Value": "N/A"}]
+                        
+                        parsed_findings.extend(parsed_data_list)
+                        
+                except (core_exceptions.FailedPrecondition, core_exceptions.PermissionDenied) as e:
+                    if insight_type_id not in unavailable_types:
+                        unavailable_types.add(insight_type_id)
+                        logger.info("Skipping '%s' for %s in all remaining locations: %s", check_name, project_id, e)
+                except Exception:
+                    pass 
+                return check_name, parsed_findings
+
+            # The calls are pure network waits, so run them concurrently; map() keeps the original order
+            with concurrent.futures.ThreadPoolExecutor(max_workers=NETWORK_INSIGHT_MAX_WORKERS) as executor:
+                for check_name, parsed_findings in executor.map(_with_cancel_event(fetch_insights), insight_targets):
+                    if parsed_findings:
+                        project_findings_map.setdefault(check_name, []).extend(parsed_findings)
         except Exception as e:
-            logging.warning(f"Could not check network insights for {project_id}: {e}")
+            logger.warning("Could not check network insights for %s: %s", project_id, e)
         return project_findings_map
         
 
-    project_results_list = []
-    for project in all_projects:
-        project_results_list.append(check_project(project))
+    project_results_list = _map_over_projects(check_project, all_projects)
 
-    
     # Aggregate results from all projects
     final_findings_by_check = {}
     for project_map in project_results_list:
@@ -1198,64 +2039,92 @@ def check_sa_key_rotation(scope_id, all_projects, job_id):
     This version corrects the pagination logic for listing keys.
     """
     CHECK_NAME = "Service Account Key Rotation"
-    print(f"🔑 [{job_id}] Checking for {CHECK_NAME}...")
+    logger.info("🔑 [%s] Checking for %s...", job_id, CHECK_NAME)
+
+    # Keys count as old when age.days > 90. validAfterTime is an ISO-8601 UTC
+    # string, so comparing it against this cutoff as a string avoids a datetime
+    # parse per key.
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=91)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    SA_KEY_FIELDS = 'keys(validAfterTime),nextPageToken'
+
+    def list_user_managed_keys(sa):
+        """Lists all user-managed keys of one service account. Runs on a pool thread."""
+        iam_service = _get_service('iam', 'v1')
+        keys = []
+        # --- CORRECTED: Start of manual pagination for keys ---
+        # Make the initial request to list keys
+        key_request = iam_service.projects().serviceAccounts().keys().list(
+            name=sa['name'], keyTypes=['USER_MANAGED'], fields=SA_KEY_FIELDS
+        )
 
-    all_findings = []
+        # Loop until there are no more pages
+        while True:
+            key_response = _call_api_with_backoff(
+                key_request.execute, context_message=f"Listing keys for {sa['email']}",
+                api_name='iam', reraise=(Exception,)
+            )
+            keys.extend(key_response.get('keys', []))
+            
+            next_page_token = key_response.get('nextPageToken')
+            if next_page_token:
+                # If a next page token exists, prepare the next request
+                key_request = iam_service.projects().serviceAccounts().keys().list(
+                    name=sa['name'],
+                    keyTypes=['USER_MANAGED'],
+                    fields=SA_KEY_FIELDS,
+                    pageToken=next_page_token
+                )
+            else:
+                # If there's no token, we've retrieved all keys, so break the loop
+                break
+        # --- END of corrected manual pagination ---
+        return keys
 
-    for project in all_projects:
-        project_id = project['projectId']
+    def check_project(project):
+        project_id, findings = project['projectId'], []
         try:
-            credentials, _ = google_auth_default(scopes=SCOPES)
-            iam_service = google_api_build('iam', 'v1', credentials=credentials)
+            iam_service = _get_service('iam', 'v1')
 
             # This pagination loop for service accounts is correct and remains unchanged.
             s_accounts = []
-            request = iam_service.projects().serviceAccounts().list(name=f'projects/{project_id}')
+            request = iam_service.projects().serviceAccounts().list(
+                name=f'projects/{project_id}', fields='accounts(name,email),nextPageToken'
+            )
             while request:
-                response = request.execute()
+                response = _call_api_with_backoff(
+                    request.execute, context_message=f"Listing service accounts for {project_id}",
+                    api_name='iam', reraise=(Exception,)
+                )
                 s_accounts.extend(response.get('accounts', []))
                 request = iam_service.projects().serviceAccounts().list_next(previous_request=request, previous_response=response)
 
-            for sa in s_accounts:
-                keys = []
-                # --- CORRECTED: Start of manual pagination for keys ---
-                # Make the initial request to list keys
-                key_request = iam_service.projects().serviceAccounts().keys().list(name=sa['name'], keyTypes=['USER_MANAGED'])
+            if not s_accounts:
+                return findings
 
-                # Loop until there are no more pages
-                while True:
-                    key_response = key_request.execute()
-                    keys.extend(key_response.get('keys', []))
-                    
-                    next_page_token = key_response.get('nextPageToken')
-                    if next_page_token:
-                        # If a next page token exists, prepare the next request
-                        key_request = iam_service.projects().serviceAccounts().keys().list(
-                            name=sa['name'],
-                            keyTypes=['USER_MANAGED'],
-                            pageToken=next_page_token
-                        )
-                    else:
-                        # If there's no token, we've retrieved all keys, so break the loop
-                        break
-                # --- END of corrected manual pagination ---
-
-                for key in keys:
-                    created_time = datetime.fromisoformat(key['validAfterTime'].replace('Z', '+00:00'))
-                    if (datetime.now(timezone.utc) - created_time).days > 90:
-                        all_findings.append({
-                            "Project": project_id,
-                            "Service Account": sa['email'],
-                            "Issue": f"Key is older than 90 days (created {created_time.strftime('%Y-%m-%d')})."
-                        })
+            # List each account's keys concurrently instead of one account at a time
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(SA_KEY_LIST_MAX_WORKERS, len(s_accounts))) as executor:
+                for sa, keys in zip(s_accounts, executor.map(_with_cancel_event(list_user_managed_keys), s_accounts)):
+                    for key in keys:
+                        valid_after = key['validAfterTime']
+                        if valid_after <= cutoff:
+                            findings.append({
+                                "Project": project_id,
+                                "Service Account": sa['email'],
+                                "Issue": f"Key is older than 90 days (created {valid_after[:10]})."
+                            })
 
         except Exception as e:
-            logging.error(f"Failed SA key check for project {project_id}: {e}")
-            all_findings.append({
+            logger.error("Failed SA key check for project %s: %s", project_id, e)
+            findings.append({
                 "Project": project_id,
                 "Service Account": "N/A",
                 "Issue": f"Error scanning project for SA keys: {e}"
             })
+        return findings
+
+    all_findings = []
+    for findings in _map_over_projects(check_project, all_projects):
+        all_findings.extend(findings)
 
     # Final reporting logic remains the same.
     if all_findings:
@@ -1286,26 +2155,41 @@ def check_public_buckets(scope_id, all_projects, job_id):
         list: A list of finding dictionaries for any public buckets found.
     """
     CHECK_NAME = "Public GCS Buckets"
-    print(f"🪣 [{job_id}] Checking for {CHECK_NAME}...")
+    logger.info("🪣 [%s] Checking for %s...", job_id, CHECK_NAME)
     
+    def public_binding_role(bucket):
+        policy = _call_api_with_backoff(
+            lambda: bucket.get_iam_policy(requested_policy_version=3),
+            context_message=f"Fetching IAM policy for bucket {bucket.name}", api_name='storage', reraise=(Exception,)
+        )
+        for binding in policy.bindings:
+            if 'allUsers' in binding['members'] or 'allAuthenticatedUsers' in binding['members']:
+                return binding['role'] # No need to check other bindings for this bucket
+        return None
+
     def check_project(p):
         project_id, findings = p['projectId'], []
         try:
             # Using a project-specific client can be more reliable at scale
-            storage_client_local = storage.Client(project=project_id)
-            for bucket in storage_client_local.list_buckets():
-                policy = bucket.get_iam_policy(requested_policy_version=3)
-                for binding in policy.bindings:
-                    if 'allUsers' in binding['members'] or 'allAuthenticatedUsers' in binding['members']:
-                        findings.append({"Project": project_id, "Bucket": bucket.name, "Issue": f"Publicly accessible via role {binding['role']}."})
-                        break # No need to check other bindings for this bucket
+            storage_client_local = _get_storage_client(project_id)
+            # Buckets with public access prevention enforced can't be public, so only the
+            # rest need their IAM policy fetched.
+            buckets = _call_api_with_backoff(
+                lambda: list(storage_client_local.list_buckets(fields='items(name,iamConfiguration),nextPageToken')),
+                context_message=f"Listing buckets for {project_id}", api_name='storage', reraise=(Exception,)
+            )
+            buckets = [b for b in buckets if b.iam_configuration.public_access_prevention != 'enforced']
+            if buckets:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=min(BUCKET_IAM_MAX_WORKERS, len(buckets))) as executor:
+                    for bucket, role in zip(buckets, executor.map(_with_cancel_event(public_binding_role), buckets)):
+                        if role:
+                            findings.append({"Project": project_id, "Bucket": bucket.name, "Issue": f"Publicly accessible via role {role}."})
         except Exception:
             pass # Silently fail for projects where API is disabled or permissions lack
         return findings
 
     all_findings = []
-    for project in all_projects:
-        findings = check_project(project)
+    for findings in _map_over_projects(check_project, all_projects):
         if findings:
             all_findings.extend(findings)
 
@@ -1319,7 +2203,7 @@ def check_public_buckets(scope_id, all_projects, job_id):
 def check_organization_policies(scope, scope_id, job_id):
     """Fetches Org Policies and writes the raw data to temp files."""
     CHECK_NAME = "Organization_Policies_Data"
-    print(f"📜 [{job_id}] Checking for {CHECK_NAME}...")
+    logger.info("📜 [%s] Checking for %s...", job_id, CHECK_NAME)
     best_practices = get_best_practices_from_gcs(GCS_PUBLIC_URL)
     
    
@@ -1346,21 +2230,24 @@ def check_storage_versioning(scope_id, all_projects, job_id):
         list: A list of finding dictionaries for buckets without versioning.
     """
     CHECK_NAME = "Cloud Storage Versioning"
-    print(f"🔄 [{job_id}] Checking for {CHECK_NAME}...")
+    logger.info("🔄 [%s] Checking for %s...", job_id, CHECK_NAME)
 
     def check_project(p):
         project_id, findings = p['projectId'], []
         try:
-            storage_client = storage.Client(project=project_id)
-            for bucket in storage_client.list_buckets():
+            storage_client = _get_storage_client(project_id)
+            buckets = _call_api_with_backoff(
+                lambda: list(storage_client.list_buckets(fields='items(name,versioning),nextPageToken')),
+                context_message=f"Listing buckets for {project_id}", api_name='storage', reraise=(Exception,)
+            )
+            for bucket in buckets:
                 if not bucket.versioning_enabled:
                     findings.append({"Project": project_id, "Bucket": bucket.name, "Issue": "Object versioning is not enabled."})
-        except Exception as e: logging.warning(f"Could not check {CHECK_NAME} for {project_id}: {e}")
+        except Exception as e: logger.warning("Could not check %s for %s: %s", CHECK_NAME, project_id, e)
         return findings
 
     all_findings = []
-    for project in all_projects:
-        findings = check_project(project)
+    for findings in _map_over_projects(check_project, all_projects):
         if findings:
             all_findings.extend(findings)
 
@@ -1370,6 +2257,8 @@ def check_storage_versioning(scope_id, all_projects, job_id):
         result = {"Check": CHECK_NAME, "Finding": [{"Status": "Object versioning is enabled on all buckets."}], "Status": "Compliant"}
     _write_finding_to_gcs(job_id, CHECK_NAME.replace(" ", "_"), result)
 
+DATAPROC_CLUSTER_LABEL = 'goog-dataproc-cluster-name'
+
 def check_standalone_vms(scope_id, all_projects, job_id):
     """
     Identifies standalone VMs that are not managed by a Managed Instance Group (MIG).
@@ -1383,37 +2272,59 @@ def check_standalone_vms(scope_id, all_projects, job_id):
         list: A list of finding dictionaries for standalone VMs.
     """
     CHECK_NAME = "Standalone VMs (Not in MIGs)"
-    print(f"🖥️  [{job_id}] Checking for {CHECK_NAME}...")
+    logger.info("🖥️  [%s] Checking for %s...", job_id, CHECK_NAME)
+
+    def list_request(compute, project_id):
+        return compute.instances().aggregatedList(
+            project=project_id, filter='status = "RUNNING"', maxResults=500,
+            fields='items/*/instances(name,labels,metadata/items/key),nextPageToken'
+        )
+
+    def finding_from_pages(project_id, pages):
+        # --- FIX: Added a filter to exclude Dataproc VMs by label and GKE by name ---
+        # Single pass over the pages; the cheap name test runs first and only the
+        # remaining VMs have their labels and metadata keys inspected.
+        standalone = []
+        for resp in pages:
+            for res in resp.get('items', {}).values():
+                for vm in res.get('instances', ()):
+                    name = vm['name']
+                    if name.startswith('gke-') or DATAPROC_CLUSTER_LABEL in (vm.get('labels') or ()):
+                        continue
+                    if any(item.get('key') == 'created-by' for item in vm.get('metadata', {}).get('items', ())):
+                        continue
+                    standalone.append(name)
+        if standalone:
+            return {"Project": project_id, "Standalone VMs": ", ".join(sorted(standalone))}
+        return None
 
     def check_project(p):
         project_id = p['projectId']
         try:
-            credentials, _ = google_auth_default(scopes=SCOPES)
-            compute = google_api_build('compute', 'v1', credentials=credentials)
-            vms, req = [], compute.instances().aggregatedList(project=project_id, filter='status = "RUNNING"')
+            compute = _get_service('compute', 'v1')
+            pages, req = [], list_request(compute, project_id)
             while req:
                 resp = req.execute(); req = compute.instances().aggregatedList_next(previous_request=req, previous_response=resp)
-                for res in resp.get('items', {}).values():
-                    if 'instances' in res: vms.extend(res['instances'])
-
-            # --- FIX: Added a filter to exclude Dataproc VMs by label and GKE by name ---
-            standalone = [
-                vm['name'] for vm in vms
-                if not any(item.get('key') == 'created-by' for item in vm.get('metadata', {}).get('items', []))
-                and not vm['name'].startswith('gke-')
-                and 'goog-dataproc-cluster-name' not in vm.get('labels', {})
-            ]
-            
-            if standalone:
-                return {"Project": project_id, "Standalone VMs": ", ".join(sorted(standalone))}
-        except Exception as e: logging.warning(f"Could not check {CHECK_NAME} for {project_id}: {e}")
+                pages.append(resp)
+            return finding_from_pages(project_id, pages)
+        except Exception as e: logger.warning("Could not check %s for %s: %s", CHECK_NAME, project_id, e)
         return None
 
-    all_findings = []
-    for project in all_projects:
-        finding = check_project(project)
-        if finding:
-            all_findings.append(finding)
+    def check_project_batch(batch_projects):
+        """Lists the running VMs of a group of projects in batched HTTP requests."""
+        try:
+            compute = _get_service('compute', 'v1')
+            requests_by_id = {p['projectId']: list_request(compute, p['projectId']) for p in batch_projects}
+            pages, failed = _execute_paged_batch(compute, requests_by_id, compute.instances().aggregatedList_next)
+        except Exception as e:
+            logger.warning("Batched aggregatedList failed for %s projects, falling back to single calls: %s", len(batch_projects), e)
+            pages, failed = {}, {p['projectId'] for p in batch_projects}
+        # Projects whose sub-request failed are retried on their own
+        return [check_project(p) if p['projectId'] in failed else finding_from_pages(p['projectId'], pages.get(p['projectId'], []))
+                for p in batch_projects]
+
+    project_batches = [all_projects[i:i + COMPUTE_BATCH_SIZE] for i in range(0, len(all_projects), COMPUTE_BATCH_SIZE)]
+    all_findings = [finding for findings in _map_over_projects(check_project_batch, project_batches) for finding in findings if finding]
 
     if all_findings:
         result = {"Check": CHECK_NAME, "Finding": all_findings, "Status": "Investigation Recommended"}
@@ -1433,24 +2344,92 @@ def check_open_firewall_rules(scope_id, all_projects, job_id):
         list: A list of finding dictionaries for open firewall rules.
     """
     CHECK_NAME = "Open Firewall Rules"
-    print(f"🔥 [{job_id}] Checking for Open Firewall Rules in parallel...")
+    logger.info("🔥 [%s] Checking for Open Firewall Rules in parallel...", job_id)
     
-    def check_project(p):
-        project_id, open_rules = p['projectId'], []
-        try:
-            credentials, _ = google_auth_default(scopes=SCOPES)
-            compute = google_api_build('compute', 'v1', credentials=credentials)
-            for rule in compute.firewalls().list(project=project_id).execute().get('items', []):
+    def list_request(compute, project_id):
+        return compute.firewalls().list(project=project_id, fields='items(name,network,sourceRanges,disabled),nextPageToken')
+
+    def findings_from_pages(project_id, pages):
+        open_rules = []
+        for resp in pages:
+            for rule in resp.get('items', []):
                 if not rule.get('disabled', False) and '0.0.0.0/0' in rule.get('sourceRanges', []):
                     open_rules.append({"Project": project_id, "Rule Name": rule['name'], "VPC": rule['network'].split('/')[-1]})
-        except Exception as e: logging.warning(f"Could not check {CHECK_NAME} for {project_id}: {e}")
         return open_rules
 
+    def check_project(p):
+        project_id = p['projectId']
+        try:
+            compute = _get_service('compute', 'v1')
+            pages, req = [], list_request(compute, project_id)
+            while req:
+                resp = req.execute(); req = compute.firewalls().list_next(previous_request=req, previous_response=resp)
+                pages.append(resp)
+            return findings_from_pages(project_id, pages)
+        except Exception as e: logger.warning("Could not check %s for %s: %s", CHECK_NAME, project_id, e)
+        return []
+
+    def check_project_batch(batch_projects):
+        """Lists the firewall rules of a group of projects in batched HTTP requests."""
+        try:
+            compute = _get_service('compute', 'v1')
+            requests_by_id = {p['projectId']: list_request(compute, p['projectId']) for p in batch_projects}
+            pages, failed = _execute_paged_batch(compute, requests_by_id, compute.firewalls().list_next)
+        except Exception as e:
+            logger.warning("Batched firewalls.list failed for %s projects, falling back to single calls: %s", len(batch_projects), e)
+            pages, failed = {}, {p['projectId'] for p in batch_projects}
+        findings = []
+        for p in batch_projects:
+            # Projects whose sub-request failed are retried on their own
+            findings.extend(check_project(p) if p['projectId'] in failed else findings_from_pages(p['projectId'], pages.get(p['projectId'], [])))
+        return findings
+
+    project_batches = [all_projects[i:i + COMPUTE_BATCH_SIZE] for i in range(0, len(all_projects), COMPUTE_BATCH_SIZE)]
     all_findings = []
-    for project in all_projects:
-        findings = check_project(project)
-        if findings:
-            all_findings.extend(findings)
+    for findings in _map_over_projects(check_project_batch, project_batches):
+        all_findings.extend(findings)
+
+    if all_findings:
+        result = {"Check": CHECK_NAME, "Finding": all_findings, "Status": "Action Required"}
+    else:
+        result = {"Check": CHECK_NAME, "Finding": [{"Status": "No firewall rules found open to 0.0.0.0/0."}], "Status": "Compliant"}
+    _write_finding_to_gcs(job_id, "Open_Firewall_Rules", result) # Using a simplified filename
+
+def check_open_firewall_rules_org(org_id, all_projects, job_id):
+    """
+    Organization-wide variant of check_open_firewall_rules. A single Cloud Asset
+    Inventory listing returns every firewall rule in the organization, replacing
+    one firewalls.list round trip per project. Falls back to the per-project scan
+    if the listing fails.
+
+    Args:
+        org_id (str): The organization ID.
+        all_projects (list): A list of project dictionaries.
+    """
+    CHECK_NAME = "Open Firewall Rules"
+    logger.info("🔥 [%s] Checking for Open Firewall Rules via Cloud Asset Inventory...", job_id)
+    # Only rules in the ACTIVE projects being scanned are reported, as with the per-project scan
+    scanned_projects = {p['projectId'] for p in all_projects}
+    all_findings = []
+    try:
+        asset_client = _get_grpc_client(asset_v1.AssetServiceClient)
+        req = {
+            "parent": f"organizations/{org_id}",
+            "asset_types": ["compute.googleapis.com/Firewall"],
+            "content_type": asset_v1.ContentType.RESOURCE,
+            "page_size": 1000,
+        }
+        for asset in asset_client.list_assets(request=req):
+            # e.g. //compute.googleapis.com/projects/my-project/global/firewalls/allow-ssh
+            project_id = asset.name.partition('/projects/')[2].partition('/')[0]
+            if project_id not in scanned_projects:
+                continue
+            rule = asset.resource.data
+            if not rule.get('disabled', False) and '0.0.0.0/0' in rule.get('sourceRanges', []):
+                all_findings.append({"Project": project_id, "Rule Name": rule.get('name'), "VPC": rule.get('network', '').rpartition('/')[2]})
+    except Exception as e:
+        logger.warning("Could not list firewall rules with Cloud Asset API, scanning projects individually: %s", e)
+        return check_open_firewall_rules(org_id, all_projects, job_id)
 
     if all_findings:
         result = {"Check": CHECK_NAME, "Finding": all_findings, "Status": "Action Required"}
@@ -1471,17 +2450,20 @@ def check_gke_hygiene(scope_id, all_projects, job_id):
         list: A list of finding dictionaries for GKE hygiene issues.
     """
     CHECK_NAME = "GKE Hygiene"
-    print(f"🚢 [{job_id}] Checking {CHECK_NAME} in parallel...")
+    logger.info("🚢 [%s] Checking %s in parallel...", job_id, CHECK_NAME)
     
     def check_project(p):
         project_id, issues = p['projectId'], []
         try:
-            credentials, _ = google_auth_default(scopes=SCOPES)
-            container = google_api_build('container', 'v1', credentials=credentials)
-            recommender = google_api_build('recommender', 'v1', credentials=credentials)
+            container = _get_service('container', 'v1')
+            recommender = _get_service('recommender', 'v1')
             
-            for cluster in container.projects().locations().clusters().list(parent=f"projects/{project_id}/locations/-").execute().get('clusters', []):
-                name, location = cluster.get('name'), cluster.get('location')
+            clusters = container.projects().locations().clusters().list(
+                parent=f"projects/{project_id}/locations/-",
+                fields='clusters(name,location,releaseChannel,nodePools(name,management/autoUpgrade))'
+            ).execute().get('clusters', [])
+            for cluster in clusters:
+                name = cluster.get('name')
 
                 if not cluster.get('releaseChannel'):
                     issues.append({"Project": project_id, "Cluster": name, "Issue": "Not on a release channel."})
@@ -1490,18 +2472,45 @@ def check_gke_hygiene(scope_id, all_projects, job_id):
                     if not pool.get('management', {}).get('autoUpgrade', False):
                         issues.append({"Project": project_id, "Cluster": name, "Node Pool": pool.get('name'), "Issue": "Auto-upgrades disabled."})
 
-                
-                reco_parent = f"projects/{project_id}/locations/{location}/recommenders/google.container.DiagnosisRecommender"
-                reco_req = recommender.projects().locations().recommenders().recommendations().list(parent=reco_parent, filter='stateInfo.state="ACTIVE"')
-                for reco in reco_req.execute().get('recommendations', []):
-                    issues.append({"Project": project_id, "Cluster": name, "Recommendation": reco.get('description')})
+            # Recommendations are listed once per location (not once per cluster), in one
+            # batched request, and then matched back to the clusters they target.
+            recommendations = recommender.projects().locations().recommenders().recommendations()
+            reco_requests = {
+                location: recommendations.list(
+                    parent=f"projects/{project_id}/locations/{location}/recommenders/google.container.DiagnosisRecommender",
+                    filter='stateInfo.state="ACTIVE"',
+                    fields='recommendations(description,targetResources),nextPageToken'
+                )
+                for location in {cluster.get('location') for cluster in clusters}
+            }
+            reco_pages, failed = _execute_paged_batch(recommender, reco_requests, recommendations.list_next) if reco_requests else ({}, set())
+            for location in failed:
+                pages, request = [], reco_requests[location]
+                while request is not None:
+                    response = request.execute()
+                    pages.append(response)
+                    request = recommendations.list_next(request, response)
+                reco_pages[location] = pages
+
+            for location, pages in reco_pages.items():
+                names = [cluster.get('name') for cluster in clusters if cluster.get('location') == location]
+                for page in pages:
+                    for reco in page.get('recommendations', []):
+                        targets = reco.get('targetResources') or []
+                        # A target may be the cluster itself or one of its sub-resources (e.g. a node pool)
+                        matched = [
+                            name for name in names
+                            if any(t.endswith(f"/clusters/{name}") or f"/clusters/{name}/" in t for t in targets)
+                        ]
+                        # Recommendations that name no cluster here apply to every cluster in the location
+                        for name in matched or names:
+                            issues.append({"Project": project_id, "Cluster": name, "Recommendation": reco.get('description')})
         except Exception as e:
-            logging.warning(f"Could not check GKE hygiene for {project_id}: {e}")
+            logger.warning("Could not check GKE hygiene for %s: %s", project_id, e)
         return issues
 
     all_findings = []
-    for project in all_projects:
-        findings = check_project(project)
+    for findings in _map_over_projects(check_project, all_projects):
         if findings:
             all_findings.extend(findings)
 
@@ -1511,6 +2520,10 @@ def check_gke_hygiene(scope_id, all_projects, job_id):
         result = {"Check": CHECK_NAME, "Finding": [{"Status": "All checked GKE clusters seem to follow best practices."}], "Status": "Compliant"}
     _write_finding_to_gcs(job_id, CHECK_NAME.replace(" ", "_"), result)
 
+SQL_INSTANCE_ASSET = "sqladmin.googleapis.com/Instance"
+MIG_ASSET = "compute.googleapis.com/InstanceGroupManager"
+SNAPSHOT_ASSET = "compute.googleapis.com/Snapshot"
+
 def check_resilience_assets(org_id, job_id):
     """
     Checks organization-wide assets for resilience best practices, including
@@ -1522,27 +2535,49 @@ def check_resilience_assets(org_id, job_id):
     Returns:
         list: A list of finding dictionaries for resilience issues.
     """
-    print("🏗️  Checking resilience assets (SQL, MIGs, Snapshots)...")
+    logger.info("🏗️  Checking resilience assets (SQL, MIGs, Snapshots)...")
     all_findings = []
     
     def get_project_from_asset_name(asset_name):
-        parts = asset_name.split('/'); return parts[parts.index('projects') + 1] if 'projects' in parts else 'unknown'
+        # e.g. //sqladmin.googleapis.com/projects/my-project/instances/db-1
+        _, found, rest = asset_name.partition('/projects/')
+        return rest.partition('/')[0] if found else 'unknown'
 
     try:
-        credentials, _ = google_auth_default(scopes=SCOPES)
-        asset_client = asset_v1.AssetServiceClient(credentials=credentials)
+        asset_client = _get_grpc_client(asset_v1.AssetServiceClient)
         parent = f"organizations/{org_id}"
 
-        # Cloud SQL Checks
-        sql_req = {"parent": parent, "asset_types": ["sqladmin.googleapis.com/Instance"], "content_type": asset_v1.ContentType.RESOURCE}
+        # One organization-wide listing covers all three asset types; each asset is routed
+        # to its check by type instead of paging through the organization once per type.
+        req = {
+            "parent": parent,
+            "asset_types": [SQL_INSTANCE_ASSET, MIG_ASSET, SNAPSHOT_ASSET],
+            "content_type": asset_v1.ContentType.RESOURCE,
+            "page_size": 1000,
+        }
         non_ha, no_backup, bad_retention, no_pitr = [], [], [], []
-        for asset in asset_client.list_assets(request=sql_req):
-            s, name, proj = asset.resource.data.get("settings", {}), asset.resource.data.get('name'), get_project_from_asset_name(asset.name)
-            if s.get("availabilityType") == "ZONAL": non_ha.append({"Project": proj, "Instance": name})
-            backup_conf = s.get("backupConfiguration", {})
-            if not backup_conf.get("enabled"): no_backup.append({"Project": proj, "Instance": name})
-            elif not backup_conf.get("pointInTimeRecoveryEnabled"): no_pitr.append({"Project": proj, "Instance": name})
-            if backup_conf.get("retainedBackupsCount", 0) < 30 : bad_retention.append({"Project": proj, "Instance": name, "Retention": backup_conf.get("retainedBackupsCount", "N/A")})
+        zonal_migs, single_region = [], 0
+        for asset in asset_client.list_assets(request=req):
+            data = asset.resource.data
+            if asset.asset_type == SQL_INSTANCE_ASSET:
+                # Cloud SQL Checks
+                s, name, proj = data.get("settings", {}), data.get('name'), get_project_from_asset_name(asset.name)
+                # One row per instance, shared by every list it lands in (it is only serialized)
+                instance = {"Project": proj, "Instance": name}
+                if s.get("availabilityType") == "ZONAL": non_ha.append(instance)
+                backup_conf = s.get("backupConfiguration", {})
+                if not backup_conf.get("enabled"): no_backup.append(instance)
+                elif not backup_conf.get("pointInTimeRecoveryEnabled"): no_pitr.append(instance)
+                retained = backup_conf.get("retainedBackupsCount")
+                if (retained or 0) < 30 : bad_retention.append({"Project": proj, "Instance": name, "Retention": "N/A" if retained is None else retained})
+            elif asset.asset_type == MIG_ASSET:
+                # Zonal MIGs Check
+                if 'zone' in data and not data.get('name', '').startswith('gke-'):
+                    zonal_migs.append({"Project": get_project_from_asset_name(asset.name), "MIG Name": data.get('name')})
+            elif asset.asset_type == SNAPSHOT_ASSET:
+                # Disk Snapshots Check
+                if len(data.get("storageLocations", [])) <= 1:
+                    single_region += 1
 
         if non_ha:
             _write_finding_to_gcs(job_id, "Cloud_SQL_High_Availability", {"Check": "Cloud SQL High Availability", "Finding": non_ha, "Status": "Action Required"})
@@ -1552,16 +2587,8 @@ def check_resilience_assets(org_id, job_id):
             _write_finding_to_gcs(job_id, "Cloud_SQL_Backup_Retention", {"Check": "Cloud SQL Backup Retention", "Finding": bad_retention, "Status": "Action Required"})
         if no_pitr:
             _write_finding_to_gcs(job_id, "Cloud_SQL_PITR", {"Check": "Cloud SQL PITR", "Finding": no_pitr, "Status": "Action Required"})
-
-        # Zonal MIGs Check
-        mig_req = {"parent": parent, "asset_types": ["compute.googleapis.com/InstanceGroupManager"], "content_type": asset_v1.ContentType.RESOURCE}
-        zonal_migs = [{"Project": get_project_from_asset_name(a.name), "MIG Name": a.resource.data.get('name')} for a in asset_client.list_assets(request=mig_req) if 'zone' in a.resource.data and not a.resource.data.get('name', '').startswith('gke-')]
         if zonal_migs:
             _write_finding_to_gcs(job_id, "MIG_Resilience_(Zonal)", {"Check": "MIG Resilience (Zonal)", "Finding": zonal_migs, "Status": "Action Required"})
-        
-        # Disk Snapshots Check
-        snap_req = {"parent": parent, "asset_types": ["compute.googleapis.com/Snapshot"], "content_type": asset_v1.ContentType.RESOURCE}
-        single_region = len([a for a in asset_client.list_assets(request=snap_req) if len(a.resource.data.get("storageLocations", [])) <= 1])
         if single_region > 0:
             _write_finding_to_gcs(job_id, "Disk_Snapshot_Resilience", {"Check": "Disk Snapshot Resilience", "Finding": [{"Issue": f"Found {single_region} snapshots stored in only one region."}], "Status": "Action Required"})
 
@@ -1571,6 +2598,18 @@ def check_resilience_assets(org_id, job_id):
 
 # --- Cost Optimization Checks ---
 
+# Ways to find a recommendation's resource name, tried in order until one yields a value.
+# Full resource paths (e.g. //compute.googleapis.com/.../disks/disk-1) are cut to the last segment.
+# Each takes the recommendation and its already-unwrapped content, since every proto-plus
+# attribute access builds a new wrapper object.
+_RECOMMENDATION_RESOURCE_EXTRACTORS = (
+    lambda r, content: content.overview['resourceName'],
+    lambda r, content: content.overview['resource'].rpartition('/')[2],
+    lambda r, content: content.operation_groups[0].operations[0].resource.rpartition('/')[2],
+    # target_resources is set for e.g. Reservations
+    lambda r, content: r.target_resources[0].rpartition('/')[2],
+)
+
 def run_cost_recommendations(scope_id, all_projects, active_zones, active_regions, job_id):
     """
     Fetches cost-saving recommendations from the Recommender API for all projects.
@@ -1585,7 +2624,7 @@ def run_cost_recommendations(scope_id, all_projects, active_zones, active_region
     Returns:
         list: A list of finding dictionaries detailing cost recommendations.
     """
-    print("💰 Performing Cost Recommendation checks in parallel...")
+    logger.info("💰 Performing Cost Recommendation checks in parallel...")
     if not all_projects: return []
     
     #active_zones, active_regions = get_active_compute_locations(org_id, all_projects)
@@ -1595,36 +2634,16 @@ def run_cost_recommendations(scope_id, all_projects, active_zones, active_region
         resource_name = "N/A"
         cost_savings = "N/A"
         
-        try:
-            # Attempt to get resource name from various possible fields
-            if hasattr(reco.content, 'overview'):
-                overview_struct = reco.content.overview 
-                if 'resourceName' in overview_struct:
-                    resource_name = overview_struct['resourceName']
-                elif 'resource' in overview_struct:
-                    resource_name = overview_struct['resource'].split('/')[-1]
-
-        
-            if resource_name == "N/A":
-                if (hasattr(reco.content, 'operation_groups') and 
-                    reco.content.operation_groups and 
-                    reco.content.operation_groups[0].operations and
-                    reco.content.operation_groups[0].operations[0].resource):
-                    
-                    # Get the full resource path, e.g., //compute.googleapis.com/.../disks/disk-1
-                    full_resource_path = reco.content.operation_groups[0].operations[0].resource
-                    resource_name = full_resource_path.split('/')[-1]
-
-            # If both fail, check targetResources (camelCase, for Reservations etc.) ---
-            if resource_name == "N/A":
-                if hasattr(reco, 'targetResources') and reco.targetResources:
-                    target_list = reco.targetResources
-                    if target_list and isinstance(target_list[0], str):
-                        resource_name = target_list[0].split('/')[-1]
-
-        except Exception as e:
-            logging.warning(f"Failed to parse resource name for {reco.name}: {e}")
-            pass # If any error, resource_name remains "N/A"
+        # Attempt to get resource name from various possible fields, in order
+        content = reco.content
+        for extract in _RECOMMENDATION_RESOURCE_EXTRACTORS:
+            try:
+                name = extract(reco, content)
+            except (KeyError, IndexError, AttributeError, TypeError):
+                continue
+            if name:
+                resource_name = name
+                break
 
         # Safely get cost savings
         try:
@@ -1635,9 +2654,10 @@ def run_cost_recommendations(scope_id, all_projects, active_zones, active_region
             pass
 
         # Build the final description string
-        detail = reco.description
+        description = reco.description
+        detail = description
         if "CHANGE_MACHINE_TYPE" in reco.recommender_subtype:
-            detail = f"For VM '{resource_name}', {reco.description}"
+            detail = f"For VM '{resource_name}', {description}"
             
         return {
             "Project": project_id, 
@@ -1659,35 +2679,51 @@ def run_cost_recommendations(scope_id, all_projects, active_zones, active_region
             "Underutilized Reservations": ("google.compute.RightSizeResourceRecommender", "zone"),
             "Idle Reservations": ("google.compute.IdleResourceRecommender", "zone"),
         }
+        # Every (recommender, location) pair is an independent list_recommendations call
+        reco_targets = [
+            (check, rec_id, loc)
+            for check, (rec_id, loc_type) in recommender_map.items()
+            for loc in (active_zones if loc_type == "zone" else active_regions)
+            if loc != 'global'
+        ]
         try:
-            client = recommender_v1.RecommenderClient()
-            for check, (rec_id, loc_type) in recommender_map.items():
-                locations = active_zones if loc_type == "zone" else active_regions
-                for loc in locations:
-                    if loc_type in ['region', 'zone'] and loc == 'global':
-                        continue
-                    parent = f"projects/{project_id}/locations/{loc}/recommenders/{rec_id}"
-                    try:
-                        api_call = lambda: client.list_recommendations(parent=parent)
-                        context = f"'{check}' in {project_id} at {loc}"
-                        for reco in _call_api_with_backoff(api_call, context_message=context):
-                            finding = _parse_recommendation_safely(reco, project_id)
-                            if check not in findings_map:
-                                findings_map[check] = []
-                            findings_map[check].append(finding)
-                    except (PermissionDenied, core_exceptions.FailedPrecondition):
-                        logging.warning(f"Skipping '{check}' for {project_id} in {loc} due to permissions or disabled API.")
-                        break 
-                    except Exception as e:
-                        logging.error(f"An unexpected API error occurred (or parser failed) for '{check}' in {project_id} at {loc}: {e}")
+            client = _get_grpc_client(recommender_v1.RecommenderClient)
+
+            # Recommenders the project cannot serve (API disabled or not permitted). These
+            # errors are project-wide, so the remaining locations for the recommender are skipped.
+            unavailable_recommenders = set()
+
+            def fetch_recommendations(target):
+                check, rec_id, loc = target
+                findings = []
+                if rec_id in unavailable_recommenders:
+                    return check, findings
+                parent = f"projects/{project_id}/locations/{loc}/recommenders/{rec_id}"
+                try:
+                    api_call = lambda: client.list_recommendations(parent=parent)
+                    context = f"'{check}' in {project_id} at {loc}"
+                    for reco in _call_api_with_backoff(api_call, context_message=context, api_name='recommender',
+                                                       reraise=(PermissionDenied, core_exceptions.FailedPrecondition), hedge=True):
+                        findings.append(_parse_recommendation_safely(reco, project_id))
+                except (PermissionDenied, core_exceptions.FailedPrecondition):
+                    if rec_id not in unavailable_recommenders:
+                        unavailable_recommenders.add(rec_id)
+                        logger.warning("Skipping '%s' for %s due to permissions or disabled API.", check, project_id)
+                except Exception as e:
+                    logger.error("An unexpected API error occurred (or parser failed) for '%s' in %s at %s: %s", check, project_id, loc, e)
+                return check, findings
+
+            # The calls are pure network waits, so run them concurrently; map() keeps the original order
+            with concurrent.futures.ThreadPoolExecutor(max_workers=COST_RECOMMENDATION_MAX_WORKERS) as executor:
+                for check, findings in executor.map(_with_cancel_event(fetch_recommendations), reco_targets):
+                    if findings:
+                        findings_map.setdefault(check, []).extend(findings)
         except Exception as e:
-            logging.error(f"CRITICAL: Cost check failed for project {project_id}. Error: {e}")
+            logger.error("CRITICAL: Cost check failed for project %s. Error: %s", project_id, e)
         
         return findings_map
 
-    project_results_list = []
-    for project in all_projects:
-        project_results_list.append(check_project(project))
+    project_results_list = _map_over_projects(check_project, all_projects)
     
     final_findings_by_check = {}
     for project_map in project_results_list:
@@ -1704,12 +2740,14 @@ def run_cost_recommendations(scope_id, all_projects, active_zones, active_region
 
 # --- Operational Excellence Checks ---
 
+_UNATTENDED_PROJECT_RE = re.compile(r"Project `([^`]+)`")
+
 def run_miscellaneous_checks_refactored(scope, scope_id, all_projects, job_id):
     """
     Runs a series of miscellaneous operational checks, such as firewall complexity,
     recent changes, and unattended projects, respecting the scan scope.
     """
-    print("🔍 Performing Miscellaneous checks...")
+    logger.info("🔍 Performing Miscellaneous checks...")
     if not all_projects:
         return []
 
@@ -1723,19 +2761,14 @@ def run_miscellaneous_checks_refactored(scope, scope_id, all_projects, job_id):
     def check_firewall_rules_count(project):
         project_id = project['projectId']
         try:
-            credentials, _ = google_auth_default(scopes=SCOPES)
-            compute_service = google_api_build('compute', 'v1', credentials=credentials)
-            rules = compute_service.firewalls().list(project=project_id).execute().get('items', [])
+            compute_service = _get_service('compute', 'v1')
+            rules = compute_service.firewalls().list(project=project_id, fields='items(name)').execute().get('items', [])
             if len(rules) > 150:
                 return {"Project": project_id, "Rule Count": len(rules), "Recommendation": f"Project has {len(rules)} firewall rules."}
-        except Exception as e: logging.warning(f"Could not check firewall_rule_count for {project_id}: {e}")
+        except Exception as e: logger.warning("Could not check firewall_rule_count for %s: %s", project_id, e)
         return None
 
-    firewall_findings = []
-    for project in all_projects:
-        finding = check_firewall_rules_count(project)
-        if finding:
-            firewall_findings.append(finding)
+    firewall_findings = [finding for finding in _map_over_projects(check_firewall_rules_count, all_projects) if finding]
 
     if firewall_findings:
         result = {"Check": "VPC Firewall Complexity (>150 Rules)", "Finding": firewall_findings, "Status": "Investigation Recommended"}
@@ -1743,14 +2776,14 @@ def run_miscellaneous_checks_refactored(scope, scope_id, all_projects, job_id):
 
     # --- Org-Level Recommender/Insight Checks (Run ONLY for organization scope) ---
     if scope == 'organization':
-        print("   -> Checking for organization-level insights...")
+        logger.info("   -> Checking for organization-level insights...")
         try:
-            recommender_client = recommender_v1.RecommenderClient()
+            recommender_client = _get_grpc_client(recommender_v1.RecommenderClient)
             
             # Check for Org-Level Recent Changes
             parent_recent = f"organizations/{scope_id}/locations/global/insightTypes/google.cloud.RecentChangeInsight"
             api_call_recent = lambda: recommender_client.list_insights(parent=parent_recent)
-            for insight in _call_api_with_backoff(api_call_recent, context_message="Org-Level Recent Changes"):
+            for insight in _call_api_with_backoff(api_call_recent, context_message="Org-Level Recent Changes", api_name='recommender'):
                 recent_change_findings.append({
                     "Project": f"Org-Level ({scope_id})",
                     "Insight": insight.description
@@ -1759,7 +2792,7 @@ def run_miscellaneous_checks_refactored(scope, scope_id, all_projects, job_id):
             # Check for Unattended Project Recommendations
             parent_unattended = f"organizations/{scope_id}/locations/global/recommenders/google.resourcemanager.projectUtilization.Recommender"
             api_call_unattended = lambda: recommender_client.list_recommendations(parent=parent_unattended)
-            for reco in _call_api_with_backoff(api_call_unattended, context_message="Unattended Projects"):
+            for reco in _call_api_with_backoff(api_call_unattended, context_message="Unattended Projects", api_name='recommender'):
                 project_id_from_reco = "Unknown"
                 # Method 1: Try the structured targetResources field (camelCase)
                 if hasattr(reco, 'targetResources') and reco.targetResources:
@@ -1772,7 +2805,7 @@ def run_miscellaneous_checks_refactored(scope, scope_id, all_projects, job_id):
 
                 # Method 3: As a final fallback, parse the description string
                 elif reco.description:
-                    match = re.search(r"Project `([^`]+)`", reco.description)
+                    match = _UNATTENDED_PROJECT_RE.search(reco.description)
                     if match:
                         project_id_from_reco = match.group(1)
                         
@@ -1785,12 +2818,12 @@ def run_miscellaneous_checks_refactored(scope, scope_id, all_projects, job_id):
 
 
     # --- Project-Level Recent Changes Check (Runs for all scopes) ---
-    print("   -> Checking for project-level recent changes...")
+    logger.info("   -> Checking for project-level recent changes...")
     def check_project_for_iam_changes(project):
         project_id = project['projectId']
         project_findings_list = []
         try:
-            recommender_client = recommender_v1.RecommenderClient()
+            recommender_client = _get_grpc_client(recommender_v1.RecommenderClient)
             parent = f"projects/{project_id}/locations/global/insightTypes/google.cloud.RecentChangeInsight"
             insights = recommender_client.list_insights(parent=parent)
             for insight in insights:
@@ -1802,10 +2835,8 @@ def run_miscellaneous_checks_refactored(scope, scope_id, all_projects, job_id):
             pass 
         return project_findings_list
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-        results = executor.map(check_project_for_iam_changes, all_projects)
-        for res_list in results:
-            recent_change_findings.extend(res_list)
+    for res_list in _map_over_projects(check_project_for_iam_changes, all_projects):
+        recent_change_findings.extend(res_list)
 
     # --- Final Assembly ---
     if recent_change_findings:
@@ -1816,10 +2847,13 @@ def run_miscellaneous_checks_refactored(scope, scope_id, all_projects, job_id):
         result = {"Check": "Unattended Projects", "Finding": unattended_findings, "Status": "Action Required"}
         _write_finding_to_gcs(job_id, "Unattended_Projects", result)
 
-    print("✅ Miscellaneous checks complete.")
+    logger.info("✅ Miscellaneous checks complete.")
 
 
 
+# Fraction of a quota's limit above which it is reported.
+QUOTA_UTILIZATION_THRESHOLD = 0.8
+
 def run_service_limit_checks_refactored(scope_id, all_projects, job_id):
     """
     Checks regional compute quotas for all projects to identify any approaching their limit (>80%).
@@ -1832,22 +2866,30 @@ def run_service_limit_checks_refactored(scope_id, all_projects, job_id):
         list: A list of finding dictionaries for quotas with high utilization.
     """
     CHECK_NAME = "Quota Utilization (>80%)"
-    print(f"🚦 [{job_id}] Performing Service Limit (Quota) checks...")
+    logger.info("🚦 [%s] Performing Service Limit (Quota) checks...", job_id)
     
     def check_project_quotas(project):
         project_id = project['projectId']
         exceeded_quotas = [] # Store findings for this project here
         try:
-            credentials, _ = google_auth_default(scopes=SCOPES)
-            compute_service = google_api_build('compute', 'v1', credentials=credentials)
-            regions = [r['name'] for r in compute_service.regions().list(project=project_id).execute().get('items', [])]
-            
-            for region in regions:
-                quotas = compute_service.regions().get(project=project_id, region=region).execute().get('quotas', [])
-                for quota in quotas:
-                    usage = quota.get('usage', 0.0)
+            compute_service = _get_service('compute', 'v1')
+            # regions.list already carries every region's quotas, so one listing replaces
+            # a regions.get round trip per region.
+            regions, req = [], compute_service.regions().list(
+                project=project_id, fields='items(name,quotas(metric,usage,limit)),nextPageToken'
+            )
+            while req:
+                resp = req.execute(); req = compute_service.regions().list_next(previous_request=req, previous_response=resp)
+                regions.extend(resp.get('items', []))
+
+            for r in regions:
+                region = r['name']
+                for quota in r.get('quotas', []):
+                    usage = quota.get('usage')
+                    if not usage:
+                        continue # Most quotas are unused, so skip them before any arithmetic
                     limit = quota.get('limit', 0.0)
-                    if limit > 0 and (usage / limit) > 0.8: # Check if usage > 80%
+                    if limit > 0 and usage > QUOTA_UTILIZATION_THRESHOLD * limit: # Check if usage > 80%
                         # Add the structured data to our list
                         exceeded_quotas.append({
                             "Project": project_id,
@@ -1861,14 +2903,13 @@ def run_service_limit_checks_refactored(scope_id, all_projects, job_id):
         return exceeded_quotas # Return the list of findings (will be empty if none)
 
     all_findings = []
-    for project in all_projects:
-        # check_project_quotas returns a list of findings for the project
-        findings = check_project_quotas(project)
+    # check_project_quotas returns a list of findings for the project
+    for findings in _map_over_projects(check_project_quotas, all_projects):
         if findings:
             # We extend the main list with the items from the returned list
             all_findings.extend(findings)
 
-    print("✅ Service Limit checks complete.")
+    logger.info("✅ Service Limit checks complete.")
     
     # Wrap the final list in our standard check group format
     if not all_findings:
@@ -1879,6 +2920,18 @@ def run_service_limit_checks_refactored(scope_id, all_projects, job_id):
     
 # --- Vertex AI Remediation Generation ---
 
+GEMINI_MODEL_NAME = "gemini-2.5-flash"
+# Upper bound on remembered remediation commands; the oldest entries are evicted first.
+REMEDIATION_CACHE_MAX_ENTRIES = 2048
+_remediation_cache = {}
+_remediation_cache_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
+def _get_gemini_model():
+    """Initializes Vertex AI and builds the Gemini model once per process."""
+    vertexai.init(project=os.environ.get('PROJECT_ID'), location="global")
+    return GenerativeModel(GEMINI_MODEL_NAME)
+
 def generate_remediation_command(finding_text: str, project_id: str) -> str:
     """
     Uses the Gemini model to generate a gcloud CLI command to remediate a given finding.
@@ -1891,16 +2944,24 @@ def generate_remediation_command(finding_text: str, project_id: str) -> str:
     Returns:
         str: A single-line gcloud command or an error message.
     """
+    # The same finding in the same project always gets the same command, so reuse it
+    cache_key = (finding_text, project_id)
+    with _remediation_cache_lock:
+        cached = _remediation_cache.get(cache_key)
+    if cached:
+        return cached
+
     # Configuration for the retry logic
     max_retries = 3
     initial_delay = 2  # seconds
-    backoff_factor = 2
+    max_delay = 30  # seconds
+    # Shared by every concurrent caller, so requests are paced at the model's quota instead
+    # of all retrying in lockstep after a 429
+    limiter = _rate_limiters['gemini']
 
     for attempt in range(max_retries):
         try:
-            # Initialize Vertex AI inside the function for thread safety
-            vertexai.init(project=os.environ.get('PROJECT_ID'), location="global")
-            model = GenerativeModel("gemini-2.5-flash")
+            model = _get_gemini_model()
 
             prompt = f"""
             You are a Google Cloud security expert. Your task is to generate a precise and executable gcloud command to fix the following compliance finding.
@@ -1912,33 +2973,49 @@ def generate_remediation_command(finding_text: str, project_id: str) -> str:
             **gcloud command:**
             """
             
+            limiter.acquire()
             response = model.generate_content(prompt)
             command = response.text.strip()
 
             if command.startswith("gcloud"):
+                with _remediation_cache_lock:
+                    if len(_remediation_cache) >= REMEDIATION_CACHE_MAX_ENTRIES:
+                        _remediation_cache.pop(next(iter(_remediation_cache)))
+                    _remediation_cache[cache_key] = command
                 return command  # Success, exit the loop
             else:
                 return "AI could not generate a valid command." # Model returned a non-command, exit
 
         except core_exceptions.ResourceExhausted as e:
             # This specifically catches the 429 rate limit error
+            limiter.penalize()
             if attempt < max_retries - 1:
-                # Calculate wait time with exponential backoff and random jitter
-                delay = (initial_delay * (backoff_factor ** attempt)) + random.uniform(0, 1)
-                print(f"⚠️ Rate limit hit for a finding. Retrying in {delay:.2f} seconds... (Attempt {attempt + 1}/{max_retries})")
+                # Full jitter: a random wait up to the exponential cap spreads retries out
+                delay = random.uniform(0, min(max_delay, initial_delay * 2 ** attempt))
+                logger.warning("⚠️ Rate limit hit for a finding. Retrying in %.2f seconds... (Attempt %s/%s)", delay, attempt + 1, max_retries)
                 time.sleep(delay)
             else:
-                print(f"❌ Gemini API rate limit exceeded after {max_retries} attempts. Error: {e}")
+                logger.error("❌ Gemini API rate limit exceeded after %s attempts. Error: %s", max_retries, e)
                 return "Error: API rate limit exceeded." # Final failure after all retries
 
         except Exception as e:
             # For any other error (not a 429), fail immediately without retrying
-            print(f"⚠️ An unexpected error occurred calling Gemini API: {e}")
+            logger.warning("⚠️ An unexpected error occurred calling Gemini API: %s", e)
             return "Error generating remediation command."
     
     return "Error: All retry attempts failed." # Should not be reached, but as a fallback
 
 
+# Every check gets its own worker; the checks are I/O-bound and fan out over projects
+# internally, so queueing a check behind another only adds wall time. The pool lives for
+# the whole process so each job reuses its threads, and it is sized for a couple of
+# concurrent jobs.
+CHECK_POOL_MAX_WORKERS = 64
+# Wall-clock budget for each check. It stays well under the 1-hour Cloud Run request timeout
+# the deployment uses, so the worker still has time to build the reports.
+CHECK_TIMEOUT_SECONDS = int(os.environ.get('CHECK_TIMEOUT_SEC', 2700))
+_check_executor = concurrent.futures.ThreadPoolExecutor(max_workers=CHECK_POOL_MAX_WORKERS, thread_name_prefix='check')
+
 def run_all_checks(scope, scope_id, job_id, progress_callback=None):
     """
     Orchestrates the entire scan by running all check functions in parallel.
@@ -1952,33 +3029,27 @@ def run_all_checks(scope, scope_id, job_id, progress_callback=None):
     Returns:
         dict: A dictionary containing all categorized findings.
     """
-    print("🚀 Starting organization scan, fetching all projects first...")
+    logger.info("🚀 Starting organization scan, fetching all projects first...")
     all_projects = list_projects_for_scope(scope, scope_id)
     if not all_projects:
-        print("❌ No active projects found or failed to list projects. Aborting scan.")
+        logger.error("❌ No active projects found or failed to list projects. Aborting scan.")
         return {"error": "Could not retrieve project list."}
     
-    # --- RUN LOCATION SCAN ONCE HERE ---
-    print("📍 Discovering all active locations (running once)...")
-    active_zones, active_regions = get_active_compute_locations(all_projects)
-    print(f"✅ Discovery complete. Found {len(active_zones)} zones and {len(active_regions)} regions.")
-
-
     # --- This structured list is the key to accurate progress reporting ---
     # Format: (Category, Friendly Name, function_to_run, (tuple_of_arguments,))
+    # These checks don't need the active locations, so they start while discovery runs.
     all_checks_to_run = [
         ("Special", "Organization Policies", check_organization_policies, (scope, scope_id, job_id)),
         ("Security & Identity", "Project IAM Hygiene", check_project_iam_policy, (scope_id, all_projects, job_id)),
         ("Security & Identity", "Service Account Key Rotation", check_sa_key_rotation, (scope_id, all_projects, job_id)),
         ("Security & Identity", "Public GCS Buckets", check_public_buckets, (scope_id, all_projects, job_id)),
-        ("Security & Identity", "Open Firewall Rules", check_open_firewall_rules, (scope_id, all_projects, job_id)),
-        ("Cost Optimization", "Cost-Saving Recommendations", run_cost_recommendations, (scope_id, all_projects, active_zones, active_regions, job_id)),
+        ("Security & Identity", "Open Firewall Rules",
+         check_open_firewall_rules_org if scope == 'organization' else check_open_firewall_rules, (scope_id, all_projects, job_id)),
         ("Reliability & Resilience", "GCS Bucket Versioning", check_storage_versioning, (scope_id, all_projects, job_id)),
         ("Reliability & Resilience", "GKE Hygiene", check_gke_hygiene, (scope_id, all_projects, job_id)),
         ("Operational Excellence & Observability", "OS Config Agent Coverage", check_os_config_coverage, (scope_id, all_projects, job_id)),
         ("Operational Excellence & Observability", "Monitoring Alert Coverage", check_monitoring_coverage, (scope_id, all_projects, job_id)),
         ("Operational Excellence & Observability", "Standalone VMs", check_standalone_vms, (scope_id, all_projects, job_id)),
-        ("Operational Excellence & Observability", "Network Insights", run_network_insights, (scope_id, all_projects, active_zones, active_regions, job_id)),
         ("Operational Excellence & Observability", "Miscellaneous Checks", run_miscellaneous_checks_refactored, (scope, scope_id, all_projects, job_id)),
         ("Operational Excellence & Observability", "Service Quota Limits", run_service_limit_checks_refactored, (scope_id, all_projects, job_id)),
     ]
@@ -1994,40 +3065,83 @@ def run_all_checks(scope, scope_id, job_id, progress_callback=None):
         ]
         all_checks_to_run.extend(org_only_checks)
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=15) as executor:
+    # Checks that run per active zone/region, submitted once location discovery finishes
+    location_checks = [
+        ("Cost Optimization", "Cost-Saving Recommendations", run_cost_recommendations),
+        ("Operational Excellence & Observability", "Network Insights", run_network_insights),
+    ]
+
+    # The shared pool is not shut down here; completion is tracked through the futures below.
+    with contextlib.nullcontext(_check_executor) as executor:
+        def submit_check(category, name, func, *args):
+            cancel_event = threading.Event()
+            future = executor.submit(_run_with_cancel_event, cancel_event, func, *args)
+            future_to_info[future] = {
+                "category": category, "name": name,
+                "deadline": time.monotonic() + CHECK_TIMEOUT_SECONDS, "cancel_event": cancel_event,
+            }
+
         # This map directly links each running task (future) to its specific name and category.
-        future_to_info = {
-            executor.submit(func, *args): {"category": category, "name": name}
-            for category, name, func, args in all_checks_to_run
-        }
+        future_to_info = {}
+        for category, name, func, args in all_checks_to_run:
+            submit_check(category, name, func, *args)
+
+        # --- RUN LOCATION SCAN ONCE HERE, overlapping the checks already running ---
+        logger.info("📍 Discovering all active locations (running once)...")
+        active_zones, active_regions = get_active_compute_locations(scope, scope_id, all_projects)
+        logger.info("✅ Discovery complete. Found %s zones and %s regions.", len(active_zones), len(active_regions))
+        locations_saved = executor.submit(_write_locations_to_gcs, job_id, scope_id, active_zones, active_regions)
+        for category, name, func in location_checks:
+            submit_check(category, name, func, scope_id, all_projects, active_zones, active_regions, job_id)
 
         total_checks = len(future_to_info)
         completed_checks = 0
 
-        for future in concurrent.futures.as_completed(future_to_info):
-            info = future_to_info[future]
-            category = info["category"]
-            check_name = info["name"] # This will now ALWAYS be the specific name.
+        def record_error(check_name, message):
+            error_result = {"Check": check_name, "Finding": [{"Error": message}], "Status": "Error"}
+            _write_finding_to_gcs(job_id, f"ERROR_{check_name}".replace(" ", "_"), error_result)
+
+        pending = set(future_to_info)
+        while pending:
+            next_deadline = min(future_to_info[f]["deadline"] for f in pending)
+            done, _ = concurrent.futures.wait(
+                pending, timeout=max(0, next_deadline - time.monotonic()), return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            now = time.monotonic()
+            # Checks past their deadline are reported as errors so one wedged API can't hold up the job.
+            # A check that hasn't started is cancelled outright; a running one has its cancel event
+            # set and stops at its next API call or project, and any findings it still produces are dropped.
+            expired = {f for f in pending - done if future_to_info[f]["deadline"] <= now}
+            pending -= done | expired
+
+            for future in itertools.chain(done, expired):
+                check_name = future_to_info[future]["name"] # This will now ALWAYS be the specific name.
+                if future in expired:
+                    future_to_info[future]["cancel_event"].set()
+                    future.cancel()
+                    logger.error("⏱️ Check '%s' did not finish within %ss.", check_name, CHECK_TIMEOUT_SECONDS)
+                    record_error(check_name, f"Check timed out after {CHECK_TIMEOUT_SECONDS} seconds.")
+                else:
+                    try:
+                        future.result()  # Call result to raise exceptions, but don't store return value
+                    except Exception as e:
+                        logger.error("❌ Check '%s' failed critically: %s", check_name, e)
+                        record_error(check_name, str(e))
 
-            try:
-                future.result()  # Call result to raise exceptions, but don't store return value
-            except Exception as e:
-                print(f"❌ Check '{check_name}' failed critically: {e}")
-                # Optionally write an error finding to a temp file
-                error_result = {"Check": check_name, "Finding": [{"Error": str(e)}], "Status": "Error"}
-                _write_finding_to_gcs(job_id, f"ERROR_{check_name}".replace(" ", "_"), error_result)
-            finally:
                 completed_checks += 1
                 progress = 5 + int((completed_checks / total_checks) * 90)
                 if progress_callback:
                     progress_callback(progress=progress, current_task=f"({completed_checks}/{total_checks}) Finished: {check_name}")
-                
+
+        locations_saved.result()
     return True
 
-def get_js_script_content(scope, scope_id, job_id):
+def get_js_script_content():
     """
     Returns the JavaScript content for the interactive HTML report.
     This includes logic for navigation, fetching AI summaries, and displaying data.
+    The script is the same for every report; per-report values are read from
+    `window.CG_CTX`, which each report defines before loading it.
     """
     license_header = """
 /*
@@ -2046,54 +3160,68 @@ def get_js_script_content(scope, scope_id, job_id):
  * limitations under the License.
  */
 """
-    return f"""
-        {license_header}
-        function showSection(sectionId, clickedLinkElement = null) {{
-            document.querySelectorAll('.content-section').forEach(section => {{
-                section.style.display = 'none';
-            }});
-            const targetSection = document.getElementById(sectionId + '-section');
-            if (targetSection) {{
-                targetSection.style.display = 'block';
-            }}
-            document.querySelectorAll('.nav-link').forEach(link => {{
-                link.classList.remove('active');
-            }});
-            const targetNavLink = document.querySelector(`.sidebar .nav-link[href='#${{sectionId}}']`);
-            if (targetNavLink) {{
-                 targetNavLink.classList.add('active');
-            }}
-            if (history.pushState) {{
+    return license_header + """        // The visible section and highlighted link are tracked so a click only touches those two
+        // elements; the full section and link lists are walked once, on the first call.
+        let navLinksBySection = null;
+        let activeSection = null;
+        let activeNavLink = null;
+
+        function showSection(sectionId, clickedLinkElement = null) {
+            if (navLinksBySection === null) {
+                navLinksBySection = {};
+                document.querySelectorAll('.content-section').forEach(section => {
+                    section.style.display = 'none';
+                });
+                document.querySelectorAll('.sidebar .nav-link').forEach(link => {
+                    link.classList.remove('active');
+                    navLinksBySection[link.getAttribute('href').substring(1)] = link;
+                });
+            }
+            if (activeSection) {
+                activeSection.style.display = 'none';
+            }
+            if (activeNavLink) {
+                activeNavLink.classList.remove('active');
+            }
+            activeSection = document.getElementById(sectionId + '-section');
+            if (activeSection) {
+                activeSection.style.display = 'block';
+            }
+            activeNavLink = navLinksBySection[sectionId] || null;
+            if (activeNavLink) {
+                 activeNavLink.classList.add('active');
+            }
+            if (history.pushState) {
                 history.pushState(null, null, '#' + sectionId);
-            }} else {{
+            } else {
                 window.location.hash = sectionId;
-            }}
-        }}
+            }
+        }
 
-        document.addEventListener("DOMContentLoaded", function() {{
+        document.addEventListener("DOMContentLoaded", function() {
             const hash = window.location.hash.substring(1);
-            if (hash && document.getElementById(hash + '-section')) {{
+            if (hash && document.getElementById(hash + '-section')) {
                 showSection(hash);
-            }} else {{
+            } else {
                 showSection('overview');
-            }}
-        }});
+            }
+        });
         
-        function toggleSubSection(btn) {{
+        function toggleSubSection(btn) {
             const container = btn.nextElementSibling;
-            if (container) {{
-                if (container.style.display === "none") {{
+            if (container) {
+                if (container.style.display === "none") {
                     container.style.display = "block";
                     btn.textContent = "Hide Details";
-                }} else {{
+                } else {
                     container.style.display = "none";
                     btn.textContent = "View Details";
-                }}
-            }}
-        }}
+                }
+            }
+        }
 
         // --- UPDATED: generateAiSummary now includes the new Gemini sparkle theme ---
-        async function generateAiSummary() {{
+        async function generateAiSummary() {
             const btn = document.getElementById("summaryBtn");
             const container = document.getElementById("ai-summary-container");
             const content = document.getElementById("ai-summary-content");
@@ -2116,101 +3244,141 @@ def get_js_script_content(scope, scope_id, job_id):
                 </div>`;
             content.innerHTML = geminiLoaderHtml;
 
-            try {{
-                const response = await fetch('/api/get-summary', {{
+            try {
+                const response = await fetch('/api/get-summary', {
                     method: 'POST',
-                    headers: {{ 'Content-Type': 'application/json' }},
-                    body: JSON.stringify({{ scope_id: '{scope_id}', job_id: '{job_id}' }}) 
-                }});
-                if (!response.ok) {{
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ scope_id: CG_CTX.scope_id, job_id: CG_CTX.job_id }) 
+                });
+                if (!response.ok) {
                     const err = await response.json();
                     throw new Error(err.error || 'Network response was not ok');
-                }}
-                const data = await response.json();
-                content.innerHTML = renderMarkdown(data.summary);
+                }
+                // The summary arrives as streamed text; re-render the accumulated markdown as each chunk lands
+                const reader = response.body.getReader();
+                const decoder = new TextDecoder();
+                let summary = '';
+                while (true) {
+                    const { done, value } = await reader.read();
+                    if (done) break;
+                    summary += decoder.decode(value, { stream: true });
+                    content.innerHTML = renderMarkdown(summary);
+                }
+                summary += decoder.decode();
+                if (!summary) { throw new Error('The summary came back empty.'); }
+                content.innerHTML = renderMarkdown(summary);
                 btn.textContent = "Summary Generated";
-            }} catch (error) {{
+            } catch (error) {
                 container.classList.remove('gemini-summary-card');
-                content.innerHTML = `<p style='color:var(--error-color);'><strong>Failed to generate summary:</strong> ${{error.message}}</p>`;
+                content.innerHTML = `<p style='color:var(--error-color);'><strong>Failed to generate summary:</strong> ${error.message}</p>`;
                 btn.textContent = "Error - Retry?";
                 btn.disabled = false;
-            }}
-        }}
+            }
+        }
 
         // --- The rest of the functions are unchanged ---
         let allInsightsData = [];
         let currentPage = 1;
         const rowsPerPage = 10;
 
-        function renderTablePage(page) {{
+        const INSIGHT_COLUMNS = ['check', 'project', 'resource', 'details'];
+
+        function buildInsightsTable(placeholder) {
+            // The table, header and pagination controls are created once; page changes only swap the rows
+            placeholder.innerHTML = `<h3>Detailed Insights</h3><table class="styled-table"><thead><tr><th>Check</th><th>Project</th><th>Resource</th><th>Details</th></tr></thead><tbody id="insights-tbody"></tbody></table>
+                <div class="pagination-controls" id="insights-pagination">
+                    <button id="insights-prev" onclick="renderTablePage(currentPage - 1)">&laquo; Previous</button>
+                    <span id="insights-page-label"></span>
+                    <button id="insights-next" onclick="renderTablePage(currentPage + 1)">Next &raquo;</button>
+                </div>
+                <template id="insights-row-tpl"><tr><td></td><td></td><td></td><td></td></tr></template>`;
+        }
+
+        function renderTablePage(page) {
             currentPage = page;
             const placeholder = document.getElementById('insights-placeholder');
             if (!placeholder || allInsightsData.length === 0) return;
+            if (!document.getElementById('insights-tbody')) buildInsightsTable(placeholder);
             const startIndex = (page - 1) * rowsPerPage;
             const endIndex = startIndex + rowsPerPage;
-            const pageData = allInsightsData.slice(startIndex, endIndex);
-            let tableRowsHtml = '';
-            pageData.forEach(insight => {{
-                tableRowsHtml += `<tr><td>${{insight.check}}</td><td>${{insight.project}}</td><td>${{insight.resource}}</td><td>${{insight.details}}</td></tr>`;
-            }});
-            const tableHtml = `<h3>Detailed Insights</h3><table class="styled-table"><thead><tr><th>Check</th><th>Project</th><th>Resource</th><th>Details</th></tr></thead><tbody>${{tableRowsHtml}}</tbody></table>`;
+            // Rows are cloned from a pre-parsed template instead of being built element by element
+            const rowTemplate = document.getElementById('insights-row-tpl').content.firstElementChild;
+            const frag = document.createDocumentFragment();
+            allInsightsData.slice(startIndex, endIndex).forEach(insight => {
+                const row = rowTemplate.cloneNode(true);
+                const cells = row.children;
+                INSIGHT_COLUMNS.forEach((column, i) => {
+                    cells[i].textContent = insight[column] ?? '';
+                });
+                frag.appendChild(row);
+            });
+            document.getElementById('insights-tbody').replaceChildren(frag);
             const totalPages = Math.ceil(allInsightsData.length / rowsPerPage);
-            let paginationHtml = '';
-            if (totalPages > 1) {{
-                paginationHtml = '<div class="pagination-controls">';
-                paginationHtml += `<button onclick="renderTablePage(${{page - 1}})" ${{page === 1 ? 'disabled' : ''}}>&laquo; Previous</button>`;
-                paginationHtml += `<span> Page ${{page}} of ${{totalPages}} </span>`;
-                paginationHtml += `<button onclick="renderTablePage(${{page + 1}})" ${{page === totalPages ? 'disabled' : ''}}>Next &raquo;</button>`;
-                paginationHtml += '</div>';
-            }}
-            placeholder.innerHTML = tableHtml + paginationHtml;
-        }}
-
-        async function fetchInsights(btn) {{
+            document.getElementById('insights-pagination').style.display = totalPages > 1 ? '' : 'none';
+            document.getElementById('insights-prev').disabled = page === 1;
+            document.getElementById('insights-next').disabled = page === totalPages;
+            document.getElementById('insights-page-label').textContent = ` Page ${page} of ${totalPages} `;
+        }
+
+        async function fetchInsights(btn) {
             const placeholder = document.getElementById('insights-placeholder');
             const introText = document.querySelector('.insights-intro');
             const loader = btn.querySelector('.loader');
             btn.disabled = true;
             loader.style.display = 'inline-block';
             placeholder.innerHTML = "";
-            try {{
-                const response = await fetch('/api/get-insights', {{
+            try {
+                const response = await fetch('/api/get-insights', {
                     method: 'POST',
-                    headers: {{ 'Content-Type': 'application/json' }},
-                    body: JSON.stringify({{ scope: '{scope}', scope_id: '{scope_id}' }})
-                }});
-                if (!response.ok) {{ throw new Error('Network response was not ok'); }}
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ scope: CG_CTX.scope, scope_id: CG_CTX.scope_id, job_id: CG_CTX.job_id })
+                });
+                if (!response.ok) { throw new Error('Network response was not ok'); }
                 allInsightsData = await response.json();
-                if (allInsightsData.length === 0) {{
+                if (allInsightsData.length === 0) {
                     placeholder.innerHTML = "<p>No detailed insights found.</p>";
-                }} else {{
-                    if (introText) {{ introText.style.display = 'none'; }}
+                } else {
+                    if (introText) { introText.style.display = 'none'; }
                     renderTablePage(1);
-                }}
+                }
                 btn.style.display = 'none';
-            }} catch (error) {{
+            } catch (error) {
                 placeholder.innerHTML = "<p style='color:var(--error-color);'>Failed to load insights. Check logs.</p>";
                 btn.textContent = "Error - Retry?";
                 btn.disabled = false;
                 loader.style.display = 'none';
-            }}
-        }}
-
-        function renderMarkdown(text) {{
-            text = text.replace(/\\*\\*([^\\*]+)\\*\\*/g, '<strong>$1</strong>');
-            text = text.replace(/^\\*\\s(.*)$/gm, '<li>$1</li>');
-            text = text.replace(/(<li>.*<\\/li>)/s, '<ul>$1</ul>');
-            text = text.replace(/\\n/g, '<br>');
-            return text;
-        }}
-
-        async function getGeminiSuggestions() {{
+            }
+        }
+
+        const MD_BOLD_RE = /\\*\\*([^\\*]+)\\*\\*/g;
+        const MD_BULLET_RE = /^\\*\\s/;
+
+        function renderMarkdown(text) {
+            // One pass over the lines: bullets become <li>, the run from the first to the
+            // last bullet is wrapped in a single <ul>, and lines are joined with <br>.
+            const lines = text.replace(MD_BOLD_RE, '<strong>$1</strong>').split('\\n');
+            let firstItem = -1, lastItem = -1;
+            for (let i = 0; i < lines.length; i++) {
+                if (MD_BULLET_RE.test(lines[i])) {
+                    lines[i] = '<li>' + lines[i].slice(2) + '</li>';
+                    if (firstItem < 0) firstItem = i;
+                    lastItem = i;
+                }
+            }
+            if (firstItem >= 0) {
+                lines[firstItem] = '<ul>' + lines[firstItem];
+                lines[lastItem] += '</ul>';
+            }
+            return lines.join('<br>');
+        }
+
+        async function getGeminiSuggestions() {
             const btn = event.target;
             btn.disabled = true;
             const findingsToFix = [];
             const placeholders = document.querySelectorAll(".remediation-placeholder");
 
-            placeholders.forEach((placeholder) => {{
+            placeholders.forEach((placeholder) => {
                 const listItem = placeholder.closest('li');
                 const detailsDiv = listItem.querySelector('.details');
                 const table = detailsDiv.querySelector('table.details-table');
@@ -2219,85 +3387,100 @@ def get_js_script_content(scope, scope_id, job_id):
                 let findingText = '';
                 let projectId = '';
 
-                if (table) {{
+                if (table) {
                     // Case 1: Handle structured table data
                     const headers = Array.from(table.querySelectorAll('thead th')).map(th => th.textContent.trim());
                     const projectIndex = headers.indexOf('Project');
                     // Look for multiple possible column names for the recommendation
                     const recommendationIndex = ['Recommendation', 'Issue', 'Role', 'Tier'].find(h => headers.includes(h)) ? headers.findIndex(h => ['Recommendation', 'Issue', 'Role', 'Tier'].includes(h)) : -1;
                     
-                    if (recommendationIndex !== -1) {{
+                    if (recommendationIndex !== -1) {
                         const rows = table.querySelectorAll('tbody tr');
                         const recommendations = [];
-                        rows.forEach((row, i) => {{
+                        rows.forEach((row, i) => {
                             const cells = row.querySelectorAll('td');
                             const currentProject = (projectIndex !== -1) ? cells[projectIndex].textContent.trim() : '';
                             const recommendation = cells[recommendationIndex].textContent.trim();
                             
-                            if (i === 0) {{ projectId = currentProject; }} // Use first project for the batch context
+                            if (i === 0) { projectId = currentProject; } // Use first project for the batch context
 
                             // Combine all relevant cell data into a clear, readable string for the LLM
-                            let fullRecommendationText = headers.map((h, idx) => `${{h}}: ${{cells[idx].textContent.trim()}}`).join(', ');
+                            let fullRecommendationText = headers.map((h, idx) => `${h}: ${cells[idx].textContent.trim()}`).join(', ');
                             recommendations.push(fullRecommendationText);
-                        }});
+                        });
                         findingText = recommendations.join('\\n'); // Use newline to separate multiple findings
-                    }} else {{
+                    } else {
                         findingText = detailsDiv.innerText.trim(); // Fallback if no recommendation column
-                    }}
-                }} else {{
+                    }
+                } else {
                     // Case 2: Handle simple text data (no table)
                     findingText = detailsDiv.innerText.trim();
-                }}
+                }
 
                 // Extract project ID with regex as a final fallback if not found in table
-                if (!projectId) {{
+                if (!projectId) {
                     const projectIdMatch = findingText.match(/Project `([^`]+)`/);
-                    if (projectIdMatch) {{ projectId = projectIdMatch[1]; }}
-                }}
+                    if (projectIdMatch) { projectId = projectIdMatch[1]; }
+                }
 
-                if (findingText) {{
-                    findingsToFix.push({{ index: index, finding_text: findingText, project_id: projectId }});
-                }}
-            }});
+                if (findingText) {
+                    findingsToFix.push({ index: index, finding_text: findingText, project_id: projectId });
+                }
+            });
 
-            if (findingsToFix.length === 0) {{
+            if (findingsToFix.length === 0) {
                 btn.textContent = "No Actionable Findings";
                 return;
-            }}
+            }
 
             const BATCH_SIZE = 5;
-            for (let i = 0; i < findingsToFix.length; i += BATCH_SIZE) {{
-                const batch = findingsToFix.slice(i, i + BATCH_SIZE);
-                btn.textContent = `Getting Fixes (${{i + batch.length}}/${{findingsToFix.length}})...`;
-                try {{
-                    const response = await fetch('/api/get-suggestions', {{
-                        method: 'POST',
-                        headers: {{ 'Content-Type': 'application/json' }},
-                        body: JSON.stringify({{ findings: batch }})
-                    }});
-                    if (!response.ok) {{ throw new Error(`API returned status ${{response.status}}`); }}
-                    const suggestions = await response.json();
-                    for (const [key, suggestion] of Object.entries(suggestions)) {{
-                         const originalIndex = key.split('-')[1];
-                         if (suggestion) {{
-                            const placeholder = document.getElementById(`fix-${{originalIndex}}`);
-                            if (placeholder) {{
-                                const preNode = document.createElement("pre");
-                                preNode.style.cssText = 'background-color: #f1f3f4; padding: 10px; border-radius: 4px; margin-top: 10px; white-space: pre-wrap; word-break: break-all;';
-                                preNode.textContent = suggestion;
-                                placeholder.innerHTML = `<strong>Suggested Fix:</strong>`;
-                                placeholder.appendChild(preNode);
-                            }}
-                        }}
-                    }}
-                }} catch (e) {{
-                    console.error("Failed to get Gemini suggestions:", e);
-                    btn.textContent = "Error - Check Logs";
-                    return;
-                }}
-            }}
-            btn.textContent = "Suggestions Loaded";
-        }}
+            // Batches are independent, so a few are kept in flight at once rather than awaiting each in turn
+            const MAX_IN_FLIGHT_BATCHES = 3;
+            const batches = [];
+            for (let i = 0; i < findingsToFix.length; i += BATCH_SIZE) {
+                batches.push(findingsToFix.slice(i, i + BATCH_SIZE));
+            }
+            let nextBatch = 0, completed = 0, failed = false;
+            btn.textContent = `Getting Fixes (0/${findingsToFix.length})...`;
+
+            async function processBatches() {
+                while (!failed && nextBatch < batches.length) {
+                    const batch = batches[nextBatch++];
+                    try {
+                        const response = await fetch('/api/get-suggestions', {
+                            method: 'POST',
+                            headers: { 'Content-Type': 'application/json' },
+                            body: JSON.stringify({ findings: batch })
+                        });
+                        if (!response.ok) { throw new Error(`API returned status ${response.status}`); }
+                        const suggestions = await response.json();
+                        for (const [key, suggestion] of Object.entries(suggestions)) {
+                             const originalIndex = key.split('-')[1];
+                             if (suggestion) {
+                                const placeholder = document.getElementById(`fix-${originalIndex}`);
+                                if (placeholder) {
+                                    const preNode = document.createElement("pre");
+                                    preNode.style.cssText = 'background-color: #f1f3f4; padding: 10px; border-radius: 4px; margin-top: 10px; white-space: pre-wrap; word-break: break-all;';
+                                    preNode.textContent = suggestion;
+                                    placeholder.innerHTML = `<strong>Suggested Fix:</strong>`;
+                                    placeholder.appendChild(preNode);
+                                }
+                            }
+                        }
+                        completed += batch.length;
+                        if (!failed) {
+                            btn.textContent = `Getting Fixes (${completed}/${findingsToFix.length})...`;
+                        }
+                    } catch (e) {
+                        console.error("Failed to get Gemini suggestions:", e);
+                        failed = true;
+                    }
+                }
+            }
+
+            await Promise.all(Array.from({ length: Math.min(MAX_IN_FLIGHT_BATCHES, batches.length) }, processBatches));
+            btn.textContent = failed ? "Error - Check Logs" : "Suggestions Loaded";
+        }
     """
 
 # --- Report Generation ---
@@ -2305,7 +3488,7 @@ def get_js_script_content(scope, scope_id, job_id):
 def update_status_in_gcs(job_id, scope_id, progress, current_task, status="running"):
     """Creates or overwrites a status file in GCS for the given job."""
     try:
-        bucket = storage_client.bucket(RESULTS_BUCKET)
+        bucket = results_bucket
         status_blob = bucket.blob(f"{job_id}/{scope_id}_status.json")
         status_data = {
             "job_id": job_id,
@@ -2315,41 +3498,85 @@ def update_status_in_gcs(job_id, scope_id, progress, current_task, status="runni
             "status": status,
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
-        status_blob.upload_from_string(json.dumps(status_data), content_type='application/json')
-        print(f"[{job_id}] Status updated: {progress}% - {current_task}")
+        status_blob.upload_from_string(orjson.dumps(status_data), content_type='application/json')
+        logger.info("[%s] Status updated: %s%% - %s", job_id, progress, current_task)
     except Exception as e:
-        print(f"[{job_id}] WARNING: Could not update status file in GCS: {e}")
+        logger.warning("[%s] Could not update status file in GCS: %s", job_id, e)
 
 
 
 def generate_and_upload_reports(scope_id, job_id, all_results):
     """Generates HTML and CSV reports and uploads them to GCS."""
-    print(f"[{job_id}] Generating and uploading reports...")
-    bucket = storage_client.bucket(RESULTS_BUCKET)
+    logger.info("[%s] Generating and uploading reports...", job_id)
+    bucket = results_bucket
     
     # --- Generate HTML ---
     html_report = generate_html_report(scope_id, job_id, **all_results)
     html_blob = bucket.blob(f"{job_id}/{scope_id}_report.html")
-    html_blob.upload_from_string(html_report, content_type='text/html')
-    print(f"[{job_id}] HTML report uploaded to {html_blob.public_url}")
+    _upload_html_report(html_blob, html_report)
+    logger.info("[%s] HTML report uploaded to %s", job_id, html_blob.public_url)
 
     # --- Generate CSV ---
-    csv_data = generate_csv_data(all_results)
     csv_blob = bucket.blob(f"{job_id}/{scope_id}_report.csv")
-    csv_blob.upload_from_string(csv_data, content_type='text/csv')
-    print(f"[{job_id}] CSV report uploaded to {csv_blob.public_url}")
+    _upload_csv_report(csv_blob, all_results)
+    logger.info("[%s] CSV report uploaded to %s", job_id, csv_blob.public_url)
+
+_ORG_POLICY_ROW = "<tr><td>{}</td><td>{}</td><td>{}</td><td class='status-text-{}'>{}</td></tr>"
+_ORG_POLICY_CATEGORY_ROW = '<tr class="category-header"><td colspan="4">{}</td></tr>'
+_ORG_POLICY_STATUS_CLASSES = {
+    status: status.lower().replace(' ', '-') for status in ("Compliant", "Non-compliant", "Not Configured", "Unsupported")
+}
+
+def _evaluate_org_policy(policy, current_policies):
+    """
+    Compares one best-practice policy with the organization's effective policies.
+    Shared by the HTML and CSV reports.
 
-def generate_csv_data(all_results):
+    Returns:
+        tuple: (current value as display text, status).
+    """
+    policy_details = current_policies.get(policy['policyId'])
+    if policy_details is None:
+        return "N/A", "Not Configured"
+    boolean_policy = policy_details.get('booleanPolicy')
+    if boolean_policy is None:
+        return "List Policy/Other", "Unsupported"
+    current_value_str = str(boolean_policy.get('enforced', False))
+    status = "Compliant" if current_value_str.lower() == policy['expectedValue'].lower() else "Non-compliant"
+    return current_value_str, status
+
+def _upload_html_report(blob, html_report):
+    """Uploads the HTML report, splitting very large reports into concurrently uploaded parts."""
+    data = html_report.encode('utf-8')
+    if len(data) <= PARALLEL_REPORT_UPLOAD_THRESHOLD:
+        blob.upload_from_string(data, content_type='text/html')
+        return
+    # The transfer manager uploads from a file, so the report is staged on local disk first
+    with tempfile.NamedTemporaryFile(suffix='.html') as staged:
+        staged.write(data)
+        staged.flush()
+        del data
+        transfer_manager.upload_chunks_concurrently(
+            staged.name, blob,
+            content_type='text/html',
+            chunk_size=PARALLEL_REPORT_UPLOAD_CHUNK_SIZE,
+            max_workers=PARALLEL_REPORT_UPLOAD_MAX_WORKERS,
+            worker_type=transfer_manager.THREAD,
+        )
+
+def _upload_csv_report(blob, all_results):
+    """Streams the CSV report into `blob` as it is generated, in FINDINGS_UPLOAD_CHUNK_SIZE parts."""
+    with blob.open('w', content_type='text/csv', chunk_size=FINDINGS_UPLOAD_CHUNK_SIZE, newline='') as output:
+        write_csv_data(all_results, output)
+
+def write_csv_data(all_results, output):
     """
-    Generates a comprehensive CSV report from the categorized results.
+    Generates a comprehensive CSV report from the categorized results, writing it row by row.
 
     Args:
         all_results (dict): The dictionary of categorized findings from `run_all_checks`.
-
-    Returns:
-        str: A string containing the full report in CSV format.
+        output: A writable text file object, e.g. a GCS blob writer.
     """
-    output = io.StringIO()
     writer = csv.writer(output)
 
     # --- Write Org Policies Section  ---
@@ -2361,17 +3588,8 @@ def generate_csv_data(all_results):
         for category, policies in sorted(best_practices.items()):
             if not policies: continue
             for policy in policies:
-                policy_id, details = policy['policyId'], policy
-                status, current_value_str = "Not Configured", "N/A"
-                if policy_id in current_policies:
-                    policy_details = current_policies[policy_id]
-                    if 'booleanPolicy' in policy_details:
-                        current_value = policy_details['booleanPolicy'].get('enforced', False)
-                        current_value_str = str(current_value)
-                        status = "Compliant" if current_value_str.lower() == details['expectedValue'].lower() else "Non-compliant"
-                    else:
-                        status, current_value_str = "Unsupported", "List Policy/Other"
-                writer.writerow([category, details['displayName'], details['expectedValue'], current_value_str, status])
+                current_value_str, status = _evaluate_org_policy(policy, current_policies)
+                writer.writerow([category, policy['displayName'], policy['expectedValue'], current_value_str, status])
 
     # --- Helper to Write Other Sections ---
     def write_section(title, results):
@@ -2389,39 +3607,46 @@ def generate_csv_data(all_results):
                 # For structured data, create headers and write each dict as a new row
                 headers = ['Check', 'Status'] + list(details[0].keys())
                 writer.writerow(headers)
-                for detail_dict in details:
-                    row_data = [check_name, status] + list(detail_dict.values())
-                    writer.writerow(row_data)
+                # writerows drives the row loop from the csv module's C code
+                writer.writerows([check_name, status, *detail_dict.values()] for detail_dict in details)
                 writer.writerow([]) # Add a space after a detailed check
             else:
                 # Fallback for simple findings (e.g., compliant checks)
                 writer.writerow(['Check', 'Status', 'Details'])
-                details_str = '; '.join(map(str, details)) if isinstance(details, list) else str(details)
+                if isinstance(details, list):
+                    details_str = '; '.join(map(str, details))
+                elif isinstance(details, dict):
+                    # orjson serializes a dict in one C call and gives readable JSON rather than a Python repr
+                    details_str = orjson.dumps(details, default=str).decode()
+                else:
+                    details_str = str(details)
                 writer.writerow([check_name, status, details_str])
 
     # --- Main Loop to Write All Other Sections ---
     for category_name, findings in all_results.items():
         if category_name != 'Organization Policies':
             write_section(category_name, findings)
-            
-    return output.getvalue()
-
 
-def generate_html_report(scope, scope_id, job_id, **all_results):
-    """
-    Generates a dynamic and interactive HTML report from the scan results.
 
-    Args:
-        org_id (str): The organization ID.
-        job_id (str): The unique ID for this scan job.
-        **all_results: The dictionary of categorized findings.
+# The report script is rendered once per process and served from /assets/cloudgauge.js.
+# Reports reference it with a content-hash query string, so browsers can cache it indefinitely.
+REPORT_JS = get_js_script_content().encode('utf-8')
+REPORT_JS_VERSION = hashlib.sha256(REPORT_JS).hexdigest()[:12]
+# Compressed once as well, so serving it never re-gzips the same bytes.
+REPORT_JS_GZIP = gzip.compress(REPORT_JS)
 
-    Returns:
-        str: A string containing the full HTML report.
-    """
-    print(f"[{job_id}] 📊 Generating final report for {scope}: {scope_id}...")
-    css_license_header = """
-/*
+# Static skeleton of the HTML report. Only the $-placeholders change between reports, so the
+# multi-KB page (CSS included) is one module constant instead of an f-string rebuilt per report.
+_REPORT_PAGE_TEMPLATE = string.Template("""
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>CloudGauge Report: $scope_title $scope_id</title>
+        <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@400;500;700&display=swap" rel="stylesheet">
+        <style>
+            /*
  * Copyright 2025 Google LLC
  *
  * Licensed under the Apache License, Version 2.0 (the "License");
@@ -2436,28 +3661,188 @@ def generate_html_report(scope, scope_id, job_id, **all_results):
  * See the License for the specific language governing permissions and
  * limitations under the License.
  */
-"""
+            :root {
+                --primary-color: #4285F4; --success-color: #1e8e3e; --error-color: #d93025; --warning-color: #f9ab00; --info-color: #5f6368;
+                --background-color: #f8f9fa; --text-color: #3c4043; --light-text-color: #5f6368; --border-color: #dfe1e5; --card-bg-color: #ffffff;
+                --font-family: 'Roboto', -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif;
+            }
+            body { font-family: var(--font-family); margin: 0; background-color: var(--background-color); color: var(--text-color); display: flex; }
+            .sidebar { width: 240px; background-color: var(--card-bg-color); border-right: 1px solid var(--border-color); height: 100vh; position: fixed; top: 0; left: 0; padding: 20px; box-sizing: border-box; }
+            .sidebar-header { padding-bottom: 20px; margin-bottom: 20px; border-bottom: 1px solid var(--border-color); }
+            .sidebar-header h2 { margin: 0; font-size: 20px; }
+            .sidebar .nav-link { display: block; padding: 10px 15px; text-decoration: none; color: var(--text-color); border-radius: 5px; margin-bottom: 5px; font-size: 14px; }
+            .sidebar .nav-link:hover { background-color: #f1f3f4; }
+            .sidebar .nav-link.active { background-color: var(--primary-color); color: white; font-weight: 500; }
+            .main-content { margin-left: 240px; padding: 20px; width: calc(100% - 240px); }
+            h1, h2, h3 { color: #202124; font-weight: 500; }
+            h2 { margin-top: 0; }
+            h3 { margin-top: 20px; margin-bottom: 10px; color: #3c4043; }
+            .btn { background-color: var(--primary-color); color: white; padding: 10px 15px; border-radius: 5px; border: none; cursor: pointer; font-size: 16px; font-weight: 500; transition: background-color 0.2s ease, box-shadow 0.2s ease; margin-left: 10px; }
+            .btn:hover { box-shadow: 0 1px 3px rgba(0,0,0,0.1); }
+            .btn.summary-btn { background-color: var(--success-color); }
+            .btn.toggle-btn { background-color: var(--light-text-color); font-size: 14px; padding: 8px 12px; margin-left: 0; margin-top: 10px; }
+            .overview-container { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; text-align: center; margin-bottom: 30px; }
+            .summary-card { background-color: var(--card-bg-color); padding: 20px; border-radius: 8px; box-shadow: 0 1px 3px rgba(0,0,0,0.04); border: 1px solid var(--border-color); }
+            .summary-card h3 { margin-top: 0; border-bottom: none; font-size: 18px; color: var(--light-text-color); }
+            .summary-card .count { font-size: 48px; font-weight: 700; margin: 10px 0; }
+            .summary-card.compliant .count { color: var(--success-color); }
+            .summary-card.action-required .count { color: var(--error-color); }
+            .summary-card.investigation .count { color: var(--warning-color); }
+            .summary-card.error .count { color: var(--info-color); }
+            .checks-section { background-color: var(--card-bg-color); padding: 20px 30px; border-radius: 8px; box-shadow: 0 1px 3px rgba(0,0,0,0.04); border: 1px solid var(--border-color); margin-bottom: 30px; transition: background-color 0.5s ease; }
+            .section-header { display: flex; justify-content: space-between; align-items: center; border-bottom: 1px solid var(--border-color); padding-bottom: 10px; margin-bottom: 10px; }
+            .section-header h2 { border-bottom: none; margin: 0; padding: 0; font-size: 22px; }
+            .score-badge { font-size: 14px; font-weight: 500; padding: 5px 12px; border-radius: 16px; color: white; }
+            .score-badge.score-high { background-color: var(--success-color); }
+            .score-badge.score-medium { background-color: var(--warning-color); }
+            .score-badge.score-low { background-color: var(--error-color); }
+            .checks-list { list-style: none; padding: 0; margin: 0; }
+            .checks-list li { display: flex; align-items: flex-start; padding: 15px 0; border-top: 1px solid var(--border-color); }
+            .checks-list li:first-child { border-top: none; padding-top: 0; }
+            .checks-list .icon { margin-right: 15px; font-size: 20px; margin-top: 2px; }
+            .checks-list .status-compliant .icon { color: var(--success-color); }
+            .checks-list .status-action-required .icon { color: var(--error-color); }
+            .checks-list .status-investigation .icon { color: var(--warning-color); }
+            .checks-list .status-error .icon, .checks-list .status-informational .icon { color: var(--info-color); }
+            .check-content { flex-grow: 1; } .check-content strong { font-weight: 500; }
+            .check-content .details { color: var(--light-text-color); margin: 5px 0 0 0; }
+            .status-badge { font-size: 12px; font-weight: 500; padding: 4px 8px; border-radius: 12px; color: white; white-space: nowrap; }
+            .status-compliant .status-badge { background-color: var(--success-color); }
+            .status-action-required .status-badge { background-color: var(--error-color); }
+            .status-investigation .status-badge { background-color: var(--warning-color); }
+            .styled-table, .details-table { width: 100%; border-collapse: collapse; margin-top: 10px; }
+            .styled-table th, .styled-table td, .details-table th, .details-table td { padding: 12px 15px; text-align: left; border-bottom: 1px solid var(--border-color); }
+            .details-table { border: 1px solid var(--border-color); border-radius: 4px; font-size: 14px; }
+            .details-table th { background-color: #f8f9fa; }
+            .details-table td { font-size: 13px; word-break: break-all; }
+            .styled-table a { color: var(--primary-color); text-decoration: none; font-weight: 500; }
+            .styled-table a:hover { text-decoration: underline; }
+            .styled-table th { background-color: #f8f9fa; font-weight: 500; }
+            .styled-table .category-header td { background-color: #f1f3f4; font-weight: 500; }
+            .status-text-compliant { color: var(--success-color); font-weight: 500; }
+            .status-text-non-compliant, .status-text-not-configured { color: var(--error-color); font-weight: 500; }
+            .loader { border: 4px solid #f3f3f3; border-top: 4px solid var(--primary-color); border-radius: 50%; width: 30px; height: 30px; margin: 20px auto; animation: spin 1s linear infinite; }
+            .section-footer { margin-top: 20px; padding-top: 20px; border-top: 1px solid var(--border-color); }
+            .org-policy-subsection { margin-top: 20px; padding-top: 20px; border-top: 1px solid var(--border-color); }
+            #insights-btn .loader { width: 18px; height: 18px; margin-right: 10px; display: none; border-width: 3px; }
+            .pagination-controls { margin-top: 20px; text-align: center; }
+            .pagination-controls button { background-color: #e8eaed; color: var(--text-color); border: 1px solid var(--border-color); border-radius: 4px; padding: 8px 12px; margin: 0 4px; cursor: pointer; font-size: 14px; }
+            .pagination-controls button:disabled { cursor: not-allowed; opacity: 0.6; }
+            .pagination-controls button.active { background-color: var(--primary-color); color: white; border-color: var(--primary-color); font-weight: 500; }
+            @keyframes spin { 0% { transform: rotate(0deg); } 100% { transform: rotate(360deg); } }
+            .gemini-summary-card { background: linear-gradient(135deg, #e8f0fe, #d6e4ff); color: var(--text-color); border-color: #cde0ff; }
+            .gemini-summary-card h2 { color: #1967d2; }
+            #ai-summary-content ul { padding-left: 20px; }
+            #ai-summary-content li { margin-bottom: 10px; }
+            .gemini-loader-container { display: flex; flex-direction: column; align-items: center; justify-content: center; padding: 40px 20px; color: #1967d2; font-weight: 500; }
+            .gemini-loader { position: relative; width: 60px; height: 60px; }
+            .gemini-loader .sparkle { position: absolute; background-image: url('data:image/svg+xml;utf8,<svg width="20" height="20" viewBox="0 0 100 100" xmlns="http://www.w3.org/2000/svg"><path d="M50 0L61.2 38.8L100 50L61.2 61.2L50 100L38.8 61.2L0 50L38.8 38.8L50 0Z" fill="%234285F4"/></svg>'); background-size: contain; width: 15px; height: 15px; animation: sparkle 1.5s ease-in-out infinite; }
+            .gemini-loader .sparkle:nth-child(1) { top: 0; left: 50%; transform: translateX(-50%); animation-delay: 0s; }
+            .gemini-loader .sparkle:nth-child(2) { top: 50%; right: 0; transform: translateY(-50%); animation-delay: 0.3s; }
+            .gemini-loader .sparkle:nth-child(3) { bottom: 0; left: 50%; transform: translateX(-50%); animation-delay: 0.6s; }
+            .gemini-loader .sparkle:nth-child(4) { top: 50%; left: 0; transform: translateY(-50%); animation-delay: 0.9s; }
+            @keyframes sparkle { 0%, 100% { opacity: 0; transform: scale(0.5) translateY(-50%) rotate(0deg); } 50% { opacity: 1; transform: scale(1) translateY(-50%) rotate(180deg); } }
+        </style>
+    </head>
+    <body>
+        <nav class="sidebar">
+            <div class="sidebar-header"><h2>Report Sections</h2></div>
+            <a href="#overview" class="nav-link active" onclick="showSection('overview', this)">Overview</a>
+            <a href="#security-identity" class="nav-link" onclick="showSection('security-identity', this)">Security & Identity</a>
+            <a href="#cost-optimization" class="nav-link" onclick="showSection('cost-optimization', this)">Cost Optimization</a>
+            <a href="#reliability-resilience" class="nav-link" onclick="showSection('reliability-resilience', this)">Reliability & Resilience</a>
+            <a href="#operational-excellence-observability" class="nav-link" onclick="showSection('operational-excellence-observability', this)">Operational Excellence</a>
+        </nav>
+        <div class="main-content">
+            <h1>CloudGauge Report</h1>
+            <p style="color: var(--light-text-color);">Scope: $scope_title | ID: $scope_id | Report ID: $job_id</p>
+            
+            <div id="overview-section" class="content-section">
+                <div class="checks-section">
+                    <h2>Overview</h2>
+                    <div class="overview-container">
+                        <div class="summary-card action-required"><h3>Action Required</h3><p class="count">$action_count</p></div>
+                        <div class="summary-card investigation"><h3>Investigation Recommended</h3><p class="count">$investigation_count</p></div>
+                        <div class="summary-card compliant"><h3>Compliant</h3><p class="count">$compliant_count</p></div>
+                        <div class="summary-card error"><h3>Errors</h3><p class="count">$error_count</p></div>
+                    </div>
+                    <div class="section-footer" style="display:flex; justify-content:center; margin-left:-10px;">
+                        <button class="btn" onclick="getGeminiSuggestions()">Get Remediation Suggestions</button>
+                        <button id="summaryBtn" class="btn summary-btn" onclick="generateAiSummary()">Get AI Summary</button>
+                    </div>
+                </div>
+                <div id="ai-summary-container" class="checks-section" style="display: none;">
+                    <h2>Executive Summary (AI Generated)</h2>
+                    <div id="ai-summary-content" style="line-height: 1.6;"></div>
+                </div>
+                <div class="checks-section">
+                    <h2>Review Scores</h2>
+                    <table class="styled-table">
+                        <tbody>$score_summary_html</tbody>
+                    </table>
+                </div>
+            </div>
+            $all_category_sections_html
+        </div>
+        <script>window.CG_CTX = $report_context;</script>
+        <script src="/assets/cloudgauge.js?v=$js_version"></script>
+    </body>
+    </html>
+    """)
+
+# Report lookup tables, built once instead of on every group_findings/section call.
+_REPORT_STATUS_PRIORITY = {"Action Required": 0, "Investigation Recommended": 1, "Informational": 2, "Compliant": 3, "Error": 4}
+_REPORT_STATUS_STYLES = {
+    "Action Required": {"icon": "&#10007;", "class": "action-required"}, "Investigation Recommended": {"icon": "&#9888;", "class": "investigation"},
+    "Compliant": {"icon": "&#10003;", "class": "compliant"}, "Error": {"icon": "&#10069;", "class": "error"}, "Informational": {"icon": "&#8505;", "class": "informational"}
+}
+_REMEDIABLE_STATUSES = frozenset(("Action Required", "Investigation Recommended"))
+_REPORT_CATEGORY_ORDER = ("Security & Identity", "Cost Optimization", "Reliability & Resilience", "Operational Excellence & Observability")
+_REPORT_SECTION_IDS = {c: c.lower().replace(' & ', '-').replace(' ', '-') for c in _REPORT_CATEGORY_ORDER}
+
+def _score_class(score):
+    """Maps a category score (0-100) to the badge colour class used in the report."""
+    return "high" if score > 90 else "medium" if score > 70 else "low"
+
+def generate_html_report(scope, scope_id, job_id, **all_results):
+    """
+    Generates a dynamic and interactive HTML report from the scan results.
+
+    Args:
+        org_id (str): The organization ID.
+        job_id (str): The unique ID for this scan job.
+        **all_results: The dictionary of categorized findings.
+
+    Returns:
+        str: A string containing the full HTML report.
+    """
+    logger.info("[%s] 📊 Generating final report for %s: %s...", job_id, scope, scope_id)
 
     
     def group_findings(findings_list):
         grouped = {}
-        status_priority = {"Action Required": 0, "Investigation Recommended": 1, "Informational": 2, "Compliant": 3, "Error": 4}
+        # Priority of each group's current status, kept alongside so it is only looked up once per finding
+        group_priority = {}
         for finding in findings_list:
             check_name = finding.get('Check')
             if not check_name: continue
-            if check_name not in grouped:
-                grouped[check_name] = {"details": [], "Status": finding.get('Status')}
+            status = finding.get('Status')
+            priority = _REPORT_STATUS_PRIORITY.get(status, 99)
+            entry = grouped.get(check_name)
+            if entry is None:
+                entry = grouped[check_name] = {"details": [], "Status": status}
+                group_priority[check_name] = priority
+            elif priority < group_priority[check_name]:
+                entry['Status'] = status
+                group_priority[check_name] = priority
             
             finding_detail = finding.get('Finding')
             
             # FIX: When the finding is already a list (like from cost checks), extend the details. Don't append the list itself.
             if isinstance(finding_detail, list):
-                grouped[check_name]["details"].extend(finding_detail)
+                entry["details"].extend(finding_detail)
             elif finding_detail:
-                grouped[check_name]["details"].append(finding_detail)
-            
-            if status_priority.get(finding.get('Status'), 99) < status_priority.get(grouped[check_name]['Status'], 99):
-                grouped[check_name]['Status'] = finding.get('Status')
+                entry["details"].append(finding_detail)
         return grouped
 
     def create_details_html(details_list):
@@ -2467,10 +3852,10 @@ def generate_html_report(scope, scope_id, job_id, **all_results):
             try:
                 headers = details_list[0].keys()
                 header_html = "".join(f"<th>{h}</th>" for h in headers)
-                rows_html = ""
-                for item in details_list:
-                    row_data = "".join(f"<td>{item.get(h, '')}</td>" for h in headers)
-                    rows_html += f"<tr>{row_data}</tr>"
+                rows_html = "".join(
+                    "<tr>" + "".join(f"<td>{item.get(h, '')}</td>" for h in headers) + "</tr>"
+                    for item in details_list
+                )
                 return f"<table class='details-table'><thead><tr>{header_html}</tr></thead><tbody>{rows_html}</tbody></table>"
             except Exception:
                 return "<br>".join(str(d) for d in details_list)
@@ -2478,15 +3863,10 @@ def generate_html_report(scope, scope_id, job_id, **all_results):
     
     finding_counter = 0
     
-    def build_category_section_html(title, section_id, grouped_data, scope_id, score, org_policy_content=None):
+    def build_category_section_html(title, section_id, score_class, grouped_data, scope_id, score, org_policy_content=None):
         nonlocal finding_counter
         if not grouped_data and not org_policy_content:
             return ""
-        score_class = "high" if score > 90 else "medium" if score > 70 else "low"
-        status_map = {
-            "Action Required": {"icon": "&#10007;", "class": "action-required"}, "Investigation Recommended": {"icon": "&#9888;", "class": "investigation"},
-            "Compliant": {"icon": "&#10003;", "class": "compliant"}, "Error": {"icon": "&#10069;", "class": "error"}, "Informational": {"icon": "&#8505;", "class": "informational"}
-        }
         
        
         #  Build the Org Policy HTML as the FIRST LIST ITEM
@@ -2517,16 +3897,16 @@ def generate_html_report(scope, scope_id, job_id, **all_results):
             """
         
 
-        items_html = ""
+        item_parts = []
         for check_name, group_data in sorted(grouped_data.items()):
             status = group_data.get("Status", "Informational")
-            status_info = status_map.get(status, status_map["Informational"])
+            status_info = _REPORT_STATUS_STYLES.get(status, _REPORT_STATUS_STYLES["Informational"])
             details_html = create_details_html(group_data.get('details', []))
             remediation_placeholder = ""
-            if status in ["Action Required", "Investigation Recommended"]:
+            if status in _REMEDIABLE_STATUSES:
                 remediation_placeholder = f"<div class='remediation-placeholder' id='fix-{finding_counter}'></div>"
                 finding_counter += 1
-            items_html += f"""
+            item_parts.append(f"""
                 <li class="status-{status_info['class']}">
                     <span class="icon">{status_info['icon']}</span>
                     <div class="check-content">
@@ -2536,9 +3916,9 @@ def generate_html_report(scope, scope_id, job_id, **all_results):
                     </div>
                     <span class="status-badge">{status}</span>
                 </li>
-            """
+            """)
+        items_html = "".join(item_parts)
 
-        
         footer_html = ""
         if title == "Cost Optimization":
             footer_html = """
@@ -2576,35 +3956,31 @@ def generate_html_report(scope, scope_id, job_id, **all_results):
     org_policy_content_data = None
     if all_results.get('Organization Policies'):
         best_practices_by_category, current_policies = all_results['Organization Policies']
-        org_policy_rows = ""
-        compliant_policy_count, total_policies = 0, 0
+        org_policy_row_parts = []
+        policy_status_counts = Counter()
         for category, policies in sorted(best_practices_by_category.items()):
             if not policies: continue
-            org_policy_rows += f'<tr class="category-header"><td colspan="4">{category}</td></tr>'
+            org_policy_row_parts.append(_ORG_POLICY_CATEGORY_ROW.format(category))
             for policy in policies:
-                total_policies += 1
-                policy_id, details = policy['policyId'], policy
-                status, current_value_str = "Not Configured", "N/A"
-                if policy_id in current_policies:
-                    policy_details = current_policies[policy_id]
-                    if 'booleanPolicy' in policy_details:
-                        current_value = policy_details['booleanPolicy'].get('enforced', False)
-                        current_value_str = str(current_value)
-                        status = "Compliant" if current_value_str.lower() == details['expectedValue'].lower() else "Non-compliant"
-                    else: status, current_value_str = "Unsupported", "List Policy/Other"
-                if status == "Compliant": compliant_policy_count += 1
-                org_policy_rows += f"<tr><td>{details['displayName']}</td><td>{details['expectedValue']}</td><td>{current_value_str}</td><td class='status-text-{status.lower().replace(' ','-')}'>{status}</td></tr>"
-        org_policy_content_data = (org_policy_rows, compliant_policy_count, total_policies)
+                current_value_str, status = _evaluate_org_policy(policy, current_policies)
+                org_policy_row_parts.append(_ORG_POLICY_ROW.format(
+                    policy['displayName'], policy['expectedValue'], current_value_str, _ORG_POLICY_STATUS_CLASSES[status], status
+                ))
+                policy_status_counts[status] += 1
+        org_policy_content_data = ("".join(org_policy_row_parts), policy_status_counts["Compliant"], sum(policy_status_counts.values()))
 
     category_scores = {}
-    category_order = ["Security & Identity", "Cost Optimization", "Reliability & Resilience", "Operational Excellence & Observability"]
-    all_other_findings = []
-    for category_name in category_order:
-        findings = all_results.get(category_name, [])
-        all_other_findings.extend(findings)
-        grouped_data = group_findings(findings)
-        pass_count = sum(1 for g in grouped_data.values() if g.get('Status') == 'Compliant')
-        fail_count = sum(1 for g in grouped_data.values() if g.get('Status') in ["Action Required", "Investigation Recommended", "Error"])
+    # Each category is grouped once; the status tallies for its score and for the overview
+    # cards all come from a single Counter pass over the groups.
+    grouped_by_category = {}
+    section_meta = {}
+    status_totals = Counter()
+    for category_name in _REPORT_CATEGORY_ORDER:
+        grouped_data = grouped_by_category[category_name] = group_findings(all_results.get(category_name, []))
+        status_counts = Counter(g.get('Status') for g in grouped_data.values())
+        status_totals.update(status_counts)
+        pass_count = status_counts['Compliant']
+        fail_count = status_counts['Action Required'] + status_counts['Investigation Recommended'] + status_counts['Error']
         if category_name == "Security & Identity" and org_policy_content_data:
             _, org_compliant, org_total = org_policy_content_data
             pass_count += org_compliant
@@ -2612,187 +3988,60 @@ def generate_html_report(scope, scope_id, job_id, **all_results):
         total_for_score = pass_count + fail_count
         score = (pass_count / total_for_score) * 100 if total_for_score > 0 else 100
         category_scores[category_name] = score
+        section_meta[category_name] = (_REPORT_SECTION_IDS[category_name], _score_class(score))
 
-    grouped_all_findings = group_findings(all_other_findings)
-    action_count = sum(1 for g in grouped_all_findings.values() if g.get('Status') == 'Action Required')
-    investigation_count = sum(1 for g in grouped_all_findings.values() if g.get('Status') == 'Investigation Recommended')
-    compliant_count = sum(1 for g in grouped_all_findings.values() if g.get('Status') == 'Compliant')
-    error_count = sum(1 for g in grouped_all_findings.values() if g.get('Status') == 'Error')
+    action_count = status_totals['Action Required']
+    investigation_count = status_totals['Investigation Recommended']
+    compliant_count = status_totals['Compliant']
+    error_count = status_totals['Error']
     if org_policy_content_data:
         _, org_compliant, org_total = org_policy_content_data
         compliant_count += org_compliant
         action_count += (org_total - org_compliant)
 
     # --- BUILD HTML FOR EACH HIDDEN CATEGORY SECTION ---
-    all_category_sections_html = ""
-    for category_name in category_order:
-        section_id = category_name.lower().replace(' & ', '-').replace(' ', '-')
-        findings = all_results.get(category_name, [])
-        grouped_data = group_findings(findings)
+    category_sections = []
+    for category_name in _REPORT_CATEGORY_ORDER:
+        section_id, score_class = section_meta[category_name]
+        grouped_data = grouped_by_category[category_name]
         score = category_scores[category_name]
         org_content_for_section = org_policy_content_data if category_name == "Security & Identity" else None
-        all_category_sections_html += build_category_section_html(category_name, section_id, grouped_data, scope_id, score, org_policy_content=org_content_for_section)
+        category_sections.append(build_category_section_html(category_name, section_id, score_class, grouped_data, scope_id, score, org_policy_content=org_content_for_section))
+    # Joined once rather than concatenated per section, which re-copied the growing page every time
+    all_category_sections_html = "".join(category_sections)
 
     # --- BUILD HTML FOR THE NEW SCORE SUMMARY TABLE ---
-    score_summary_html = ""
+    score_summary_parts = []
     for category_name, score in category_scores.items():
-        section_id = category_name.lower().replace(' & ', '-').replace(' ', '-')
-        score_class = "high" if score > 90 else "medium" if score > 70 else "low"
-        score_summary_html += f"""
+        section_id, score_class = section_meta[category_name]
+        score_summary_parts.append(f"""
             <tr>
                 <td><a href="#{section_id}" onclick="showSection('{section_id}')">{category_name}</a></td>
                 <td><span class="score-badge score-{score_class}">{score:.0f}%</span></td>
             </tr>
-        """
+        """)
+    score_summary_html = "".join(score_summary_parts)
 
     # --- ASSEMBLE THE FINAL HTML PAGE ---
-    html_content = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>CloudGauge Report: {scope.capitalize()} {scope_id}</title>
-        <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@400;500;700&display=swap" rel="stylesheet">
-        <style>
-            {css_license_header}
-            :root {{
-                --primary-color: #4285F4; --success-color: #1e8e3e; --error-color: #d93025; --warning-color: #f9ab00; --info-color: #5f6368;
-                --background-color: #f8f9fa; --text-color: #3c4043; --light-text-color: #5f6368; --border-color: #dfe1e5; --card-bg-color: #ffffff;
-                --font-family: 'Roboto', -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif;
-            }}
-            body {{ font-family: var(--font-family); margin: 0; background-color: var(--background-color); color: var(--text-color); display: flex; }}
-            .sidebar {{ width: 240px; background-color: var(--card-bg-color); border-right: 1px solid var(--border-color); height: 100vh; position: fixed; top: 0; left: 0; padding: 20px; box-sizing: border-box; }}
-            .sidebar-header {{ padding-bottom: 20px; margin-bottom: 20px; border-bottom: 1px solid var(--border-color); }}
-            .sidebar-header h2 {{ margin: 0; font-size: 20px; }}
-            .sidebar .nav-link {{ display: block; padding: 10px 15px; text-decoration: none; color: var(--text-color); border-radius: 5px; margin-bottom: 5px; font-size: 14px; }}
-            .sidebar .nav-link:hover {{ background-color: #f1f3f4; }}
-            .sidebar .nav-link.active {{ background-color: var(--primary-color); color: white; font-weight: 500; }}
-            .main-content {{ margin-left: 240px; padding: 20px; width: calc(100% - 240px); }}
-            h1, h2, h3 {{ color: #202124; font-weight: 500; }}
-            h2 {{ margin-top: 0; }}
-            h3 {{ margin-top: 20px; margin-bottom: 10px; color: #3c4043; }}
-            .btn {{ background-color: var(--primary-color); color: white; padding: 10px 15px; border-radius: 5px; border: none; cursor: pointer; font-size: 16px; font-weight: 500; transition: background-color 0.2s ease, box-shadow 0.2s ease; margin-left: 10px; }}
-            .btn:hover {{ box-shadow: 0 1px 3px rgba(0,0,0,0.1); }}
-            .btn.summary-btn {{ background-color: var(--success-color); }}
-            .btn.toggle-btn {{ background-color: var(--light-text-color); font-size: 14px; padding: 8px 12px; margin-left: 0; margin-top: 10px; }}
-            .overview-container {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; text-align: center; margin-bottom: 30px; }}
-            .summary-card {{ background-color: var(--card-bg-color); padding: 20px; border-radius: 8px; box-shadow: 0 1px 3px rgba(0,0,0,0.04); border: 1px solid var(--border-color); }}
-            .summary-card h3 {{ margin-top: 0; border-bottom: none; font-size: 18px; color: var(--light-text-color); }}
-            .summary-card .count {{ font-size: 48px; font-weight: 700; margin: 10px 0; }}
-            .summary-card.compliant .count {{ color: var(--success-color); }}
-            .summary-card.action-required .count {{ color: var(--error-color); }}
-            .summary-card.investigation .count {{ color: var(--warning-color); }}
-            .summary-card.error .count {{ color: var(--info-color); }}
-            .checks-section {{ background-color: var(--card-bg-color); padding: 20px 30px; border-radius: 8px; box-shadow: 0 1px 3px rgba(0,0,0,0.04); border: 1px solid var(--border-color); margin-bottom: 30px; transition: background-color 0.5s ease; }}
-            .section-header {{ display: flex; justify-content: space-between; align-items: center; border-bottom: 1px solid var(--border-color); padding-bottom: 10px; margin-bottom: 10px; }}
-            .section-header h2 {{ border-bottom: none; margin: 0; padding: 0; font-size: 22px; }}
-            .score-badge {{ font-size: 14px; font-weight: 500; padding: 5px 12px; border-radius: 16px; color: white; }}
-            .score-badge.score-high {{ background-color: var(--success-color); }}
-            .score-badge.score-medium {{ background-color: var(--warning-color); }}
-            .score-badge.score-low {{ background-color: var(--error-color); }}
-            .checks-list {{ list-style: none; padding: 0; margin: 0; }}
-            .checks-list li {{ display: flex; align-items: flex-start; padding: 15px 0; border-top: 1px solid var(--border-color); }}
-            .checks-list li:first-child {{ border-top: none; padding-top: 0; }}
-            .checks-list .icon {{ margin-right: 15px; font-size: 20px; margin-top: 2px; }}
-            .checks-list .status-compliant .icon {{ color: var(--success-color); }}
-            .checks-list .status-action-required .icon {{ color: var(--error-color); }}
-            .checks-list .status-investigation .icon {{ color: var(--warning-color); }}
-            .checks-list .status-error .icon, .checks-list .status-informational .icon {{ color: var(--info-color); }}
-            .check-content {{ flex-grow: 1; }} .check-content strong {{ font-weight: 500; }}
-            .check-content .details {{ color: var(--light-text-color); margin: 5px 0 0 0; }}
-            .status-badge {{ font-size: 12px; font-weight: 500; padding: 4px 8px; border-radius: 12px; color: white; white-space: nowrap; }}
-            .status-compliant .status-badge {{ background-color: var(--success-color); }}
-            .status-action-required .status-badge {{ background-color: var(--error-color); }}
-            .status-investigation .status-badge {{ background-color: var(--warning-color); }}
-            .styled-table, .details-table {{ width: 100%; border-collapse: collapse; margin-top: 10px; }}
-            .styled-table th, .styled-table td, .details-table th, .details-table td {{ padding: 12px 15px; text-align: left; border-bottom: 1px solid var(--border-color); }}
-            .details-table {{ border: 1px solid var(--border-color); border-radius: 4px; font-size: 14px; }}
-            .details-table th {{ background-color: #f8f9fa; }}
-            .details-table td {{ font-size: 13px; word-break: break-all; }}
-            .styled-table a {{ color: var(--primary-color); text-decoration: none; font-weight: 500; }}
-            .styled-table a:hover {{ text-decoration: underline; }}
-            .styled-table th {{ background-color: #f8f9fa; font-weight: 500; }}
-            .styled-table .category-header td {{ background-color: #f1f3f4; font-weight: 500; }}
-            .status-text-compliant {{ color: var(--success-color); font-weight: 500; }}
-            .status-text-non-compliant, .status-text-not-configured {{ color: var(--error-color); font-weight: 500; }}
-            .loader {{ border: 4px solid #f3f3f3; border-top: 4px solid var(--primary-color); border-radius: 50%; width: 30px; height: 30px; margin: 20px auto; animation: spin 1s linear infinite; }}
-            .section-footer {{ margin-top: 20px; padding-top: 20px; border-top: 1px solid var(--border-color); }}
-            .org-policy-subsection {{ margin-top: 20px; padding-top: 20px; border-top: 1px solid var(--border-color); }}
-            #insights-btn .loader {{ width: 18px; height: 18px; margin-right: 10px; display: none; border-width: 3px; }}
-            .pagination-controls {{ margin-top: 20px; text-align: center; }}
-            .pagination-controls button {{ background-color: #e8eaed; color: var(--text-color); border: 1px solid var(--border-color); border-radius: 4px; padding: 8px 12px; margin: 0 4px; cursor: pointer; font-size: 14px; }}
-            .pagination-controls button:disabled {{ cursor: not-allowed; opacity: 0.6; }}
-            .pagination-controls button.active {{ background-color: var(--primary-color); color: white; border-color: var(--primary-color); font-weight: 500; }}
-            @keyframes spin {{ 0% {{ transform: rotate(0deg); }} 100% {{ transform: rotate(360deg); }} }}
-            .gemini-summary-card {{ background: linear-gradient(135deg, #e8f0fe, #d6e4ff); color: var(--text-color); border-color: #cde0ff; }}
-            .gemini-summary-card h2 {{ color: #1967d2; }}
-            #ai-summary-content ul {{ padding-left: 20px; }}
-            #ai-summary-content li {{ margin-bottom: 10px; }}
-            .gemini-loader-container {{ display: flex; flex-direction: column; align-items: center; justify-content: center; padding: 40px 20px; color: #1967d2; font-weight: 500; }}
-            .gemini-loader {{ position: relative; width: 60px; height: 60px; }}
-            .gemini-loader .sparkle {{ position: absolute; background-image: url('data:image/svg+xml;utf8,<svg width="20" height="20" viewBox="0 0 100 100" xmlns="http://www.w3.org/2000/svg"><path d="M50 0L61.2 38.8L100 50L61.2 61.2L50 100L38.8 61.2L0 50L38.8 38.8L50 0Z" fill="%234285F4"/></svg>'); background-size: contain; width: 15px; height: 15px; animation: sparkle 1.5s ease-in-out infinite; }}
-            .gemini-loader .sparkle:nth-child(1) {{ top: 0; left: 50%; transform: translateX(-50%); animation-delay: 0s; }}
-            .gemini-loader .sparkle:nth-child(2) {{ top: 50%; right: 0; transform: translateY(-50%); animation-delay: 0.3s; }}
-            .gemini-loader .sparkle:nth-child(3) {{ bottom: 0; left: 50%; transform: translateX(-50%); animation-delay: 0.6s; }}
-            .gemini-loader .sparkle:nth-child(4) {{ top: 50%; left: 0; transform: translateY(-50%); animation-delay: 0.9s; }}
-            @keyframes sparkle {{ 0%, 100% {{ opacity: 0; transform: scale(0.5) translateY(-50%) rotate(0deg); }} 50% {{ opacity: 1; transform: scale(1) translateY(-50%) rotate(180deg); }} }}
-        </style>
-    </head>
-    <body>
-        <nav class="sidebar">
-            <div class="sidebar-header"><h2>Report Sections</h2></div>
-            <a href="#overview" class="nav-link active" onclick="showSection('overview', this)">Overview</a>
-            <a href="#security-identity" class="nav-link" onclick="showSection('security-identity', this)">Security & Identity</a>
-            <a href="#cost-optimization" class="nav-link" onclick="showSection('cost-optimization', this)">Cost Optimization</a>
-            <a href="#reliability-resilience" class="nav-link" onclick="showSection('reliability-resilience', this)">Reliability & Resilience</a>
-            <a href="#operational-excellence-observability" class="nav-link" onclick="showSection('operational-excellence-observability', this)">Operational Excellence</a>
-        </nav>
-        <div class="main-content">
-            <h1>CloudGauge Report</h1>
-            <p style="color: var(--light-text-color);">Scope: {scope.capitalize()} | ID: {scope_id} | Report ID: {job_id}</p>
-            
-            <div id="overview-section" class="content-section">
-                <div class="checks-section">
-                    <h2>Overview</h2>
-                    <div class="overview-container">
-                        <div class="summary-card action-required"><h3>Action Required</h3><p class="count">{action_count}</p></div>
-                        <div class="summary-card investigation"><h3>Investigation Recommended</h3><p class="count">{investigation_count}</p></div>
-                        <div class="summary-card compliant"><h3>Compliant</h3><p class="count">{compliant_count}</p></div>
-                        <div class="summary-card error"><h3>Errors</h3><p class="count">{error_count}</p></div>
-                    </div>
-                    <div class="section-footer" style="display:flex; justify-content:center; margin-left:-10px;">
-                        <button class="btn" onclick="getGeminiSuggestions()">Get Remediation Suggestions</button>
-                        <button id="summaryBtn" class="btn summary-btn" onclick="generateAiSummary()">Get AI Summary</button>
-                    </div>
-                </div>
-                <div id="ai-summary-container" class="checks-section" style="display: none;">
-                    <h2>Executive Summary (AI Generated)</h2>
-                    <div id="ai-summary-content" style="line-height: 1.6;"></div>
-                </div>
-                <div class="checks-section">
-                    <h2>Review Scores</h2>
-                    <table class="styled-table">
-                        <tbody>{score_summary_html}</tbody>
-                    </table>
-                </div>
-            </div>
-            {all_category_sections_html}
-        </div>
-        <script>
-            {get_js_script_content(scope, scope_id, job_id)}
-        </script>
-    </body>
-    </html>
-    """
+    html_content = _REPORT_PAGE_TEMPLATE.substitute(
+        scope_title=scope.capitalize(),
+        scope_id=scope_id,
+        job_id=job_id,
+        action_count=action_count,
+        investigation_count=investigation_count,
+        compliant_count=compliant_count,
+        error_count=error_count,
+        score_summary_html=score_summary_html,
+        all_category_sections_html=all_category_sections_html,
+        report_context=orjson.dumps({"scope": scope, "scope_id": scope_id, "job_id": job_id}).decode(),
+        js_version=REPORT_JS_VERSION,
+    )
     return html_content
 
 # --- Flask API Endpoints ---
 
-@app.route('/', methods=['GET'])
-def index():
-    """Renders the main landing page with a dynamic form to select a resource."""
-    return render_template_string("""
+# The landing page has no template variables, so it is served as-is without a Jinja render.
+LANDING_PAGE_HTML = """
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -2894,7 +4143,14 @@ def index():
             </script>
         </body>
         </html>
-    """)
+    """
+
+LANDING_PAGE_BYTES = LANDING_PAGE_HTML.encode('utf-8')
+
+@app.route('/', methods=['GET'])
+def index():
+    """Renders the main landing page with a dynamic form to select a resource."""
+    return Response(LANDING_PAGE_BYTES, mimetype='text/html', headers={'Cache-Control': 'public, max-age=300'})
 
 @app.route('/scan', methods=['POST'])
 def create_scan_task():
@@ -2902,29 +4158,36 @@ def create_scan_task():
     Receives the scope ( Org, Folder or Project ) from the form, creates an asynchronous Cloud Task
     to perform the scan, and redirects the user to a status page.
     """
-    scope = request.form['scope']
-    scope_id = request.form['scope_id']
-    if not scope_id or not scope:
+    scope = request.form.get('scope', '')
+    scope_id = request.form.get('scope_id', '')
+    # Rejected before any job ID or Cloud Tasks RPC is spent on it
+    if scope not in VALID_SCOPES or not scope_id:
         return "Scope and ID are required.", 400
 
     job_id = str(uuid.uuid4())
-    print(f"Creating scan task for {scope}: {scope_id} with Job ID: {job_id}")
+    logger.info("Creating scan task for %s: %s with Job ID: %s", scope, scope_id, job_id)
 
     task = {
         "http_request": {
             "http_method": tasks_v2.HttpMethod.POST,
-            "url": f"{WORKER_URL}/run-scan",
+            "url": WORKER_SCAN_URL,
             "headers": {"Content-Type": "application/json"},
             "oidc_token": {
-                "service_account_email": os.environ.get('SERVICE_ACCOUNT_EMAIL')
+                "service_account_email": SA_EMAIL
             },
         }
     }
     # NEW: Use a generic payload
-    task["http_request"]["body"] = json.dumps({"scope": scope, "scope_id": scope_id, "job_id": job_id}).encode()
+    task["http_request"]["body"] = orjson.dumps({"scope": scope, "scope_id": scope_id, "job_id": job_id})
 
-    parent = tasks_client.queue_path(PROJECT_ID, LOCATION, TASK_QUEUE)
-    tasks_client.create_task(parent=parent, task=task)
+    # Naming the task after the job makes create_task idempotent: if the client library retries
+    # the RPC after the task was already created, Cloud Tasks rejects the duplicate instead of
+    # dispatching the same scan twice.
+    task["name"] = f"{TASK_PARENT}/tasks/scan-{job_id}"
+    try:
+        tasks_client.create_task(parent=TASK_PARENT, task=task)
+    except AlreadyExists:
+        logger.info("Scan task for job %s already exists; not dispatching it again.", job_id)
     
     # NEW: Pass both IDs to the status page
     return redirect(url_for('get_status', job_id=job_id, scope_id=scope_id, scope=scope))
@@ -2940,37 +4203,40 @@ def run_scan_worker():
         scope = data['scope']
         scope_id = data['scope_id']
         job_id = data['job_id']
-        print(f"[{job_id}] Worker received task for ID: {scope_id}")
+        logger.info("[%s] Worker received task for ID: %s", job_id, scope_id)
 
         update_status_in_gcs(job_id, scope_id, 5, "Initializing scan and listing resources...")
 
         # --- Throttling logic setup ---
         # We will only update GCS if at least 2 seconds have passed since the last update.
         UPDATE_INTERVAL = 2  # seconds
-        last_update_time = 0
-        # A lock ensures thread-safe updates to the last_update_time variable.
+        # A lock ensures thread-safe updates to the throttle state; the GCS write itself
+        # happens outside it so other checks reporting progress never queue behind an upload.
         lock = threading.Lock()
         final_progress = {"progress": 0, "task": ""}
+        last_written = {"time": float('-inf'), "state": None}
 
         def progress_reporter(progress, current_task):
-            nonlocal last_update_time
-            current_time = time.time()
-
-            # Store the latest progress regardless of timing
-            final_progress["progress"] = progress
-            final_progress["task"] = current_task
-
             with lock:
-                if (current_time - last_update_time) > UPDATE_INTERVAL:
-                    update_status_in_gcs(job_id, scope_id, progress, current_task)
-                    last_update_time = current_time
+                # Store the latest progress regardless of timing
+                final_progress["progress"] = progress
+                final_progress["task"] = current_task
+
+                current_time = time.monotonic()
+                if (current_time - last_written["time"]) <= UPDATE_INTERVAL:
+                    return
+                last_written["time"] = current_time
+                last_written["state"] = (progress, current_task)
+            update_status_in_gcs(job_id, scope_id, progress, current_task)
 
         run_all_checks(scope, scope_id, job_id, progress_callback=progress_reporter)
+        # Upload the last partial batch of findings before reading them back
+        _flush_findings_to_gcs(job_id)
 
         # --- Final, unconditional update after checks complete ---
         # This ensures the user sees the 100% completion of the checks phase, even if
         # it happened within the 2-second throttle window.
-        if final_progress["task"]:
+        if final_progress["task"] and last_written["state"] != (final_progress["progress"], final_progress["task"]):
             update_status_in_gcs(job_id, scope_id, final_progress["progress"], final_progress["task"])
 
         update_status_in_gcs(job_id, scope_id, 98, "Generating final HTML and CSV reports...")
@@ -2983,19 +4249,19 @@ def run_scan_worker():
             all_results["Organization Policies"] = org_policy_data
 
         html_report = generate_html_report(scope, scope_id, job_id, **all_results)
-        csv_report = generate_csv_data(all_results)
-
 
-        bucket = storage_client.bucket(RESULTS_BUCKET)
-        bucket.blob(f"{job_id}/{scope_id}_report.html").upload_from_string(html_report, content_type='text/html')
-        bucket.blob(f"{job_id}/{scope_id}_report.csv").upload_from_string(csv_report, content_type='text/csv')
+        bucket = results_bucket
+        _upload_html_report(bucket.blob(f"{job_id}/{scope_id}_report.html"), html_report)
+        del html_report
+        # The CSV is written straight into the upload stream instead of being built as one string first
+        _upload_csv_report(bucket.blob(f"{job_id}/{scope_id}_report.csv"), all_results)
 
         update_status_in_gcs(job_id, scope_id, 100, "Scan complete!", status="completed")
 
-        print(f"[{job_id}] Task completed successfully.")
+        logger.info("[%s] Task completed successfully.", job_id)
         return "Scan completed and reports uploaded.", 200
     except Exception as e:
-        print(f"[{job_id}] CRITICAL ERROR in worker for ID {scope_id}: {e}")
+        logger.error("[%s] CRITICAL ERROR in worker for ID %s: %s", job_id, scope_id, e)
         traceback.print_exc()
         if job_id and scope_id:
              update_status_in_gcs(job_id, scope_id, 100, f"A critical error occurred: {e}", status="error")
@@ -3003,16 +4269,21 @@ def run_scan_worker():
     finally:
         # CRUCIAL: Clean up all intermediate files from GCS for this job_id
         if job_id:
-            print(f"[{job_id}] Cleaning up intermediate files from GCS...")
+            _discard_buffered_findings(job_id)
+            logger.info("[%s] Cleaning up intermediate files from GCS...", job_id)
             try:
-                bucket = storage_client.bucket(RESULTS_BUCKET)
+                bucket = results_bucket
                 prefix_to_delete = f"intermediate/{job_id}/"
-                blobs_to_delete = list(bucket.list_blobs(prefix=prefix_to_delete))
+                blobs_to_delete = list(bucket.list_blobs(prefix=prefix_to_delete, fields='items(name),nextPageToken'))
+                # Deletes are sent as batched requests (GCS accepts up to 100 calls per batch)
+                # instead of one HTTP round trip per intermediate file
+                for i in range(0, len(blobs_to_delete), 100):
+                    with storage_client.batch(raise_exception=False):
+                        bucket.delete_blobs(blobs_to_delete[i:i + 100])
                 if blobs_to_delete:
-                    bucket.delete_blobs(blobs_to_delete)
-                    print(f"[{job_id}] Deleted {len(blobs_to_delete)} intermediate files.")
+                    logger.info("[%s] Deleted %s intermediate files.", job_id, len(blobs_to_delete))
             except Exception as e:
-                logging.error(f"[{job_id}] Failed to clean up intermediate GCS files: {e}")
+                logger.error("[%s] Failed to clean up intermediate GCS files: %s", job_id, e)
     
 @app.route('/api/status/<string:job_id>/<string:scope_id>')
 def api_check_status(job_id, scope_id):
@@ -3021,26 +4292,26 @@ def api_check_status(job_id, scope_id):
     in GCS to provide real-time progress updates.
     """
     try:
-        bucket = storage_client.bucket(RESULTS_BUCKET)
+        bucket = results_bucket
         status_blob = bucket.blob(f"{job_id}/{scope_id}_status.json")
 
         if status_blob.exists():
             # If the status file is there, return its content
-            status_data = json.loads(status_blob.download_as_text())
+            status_data = orjson.loads(status_blob.download_as_bytes())
             return jsonify(status_data)
         else:
             # If the worker hasn't created the file yet, return a pending state
             return jsonify({"status": "pending", "progress": 0, "current_task": "Waiting for task to start..."})
             
     except Exception as e:
-        print(f"Error checking status for job {job_id}: {e}")
+        logger.error("Error checking status for job %s: %s", job_id, e)
         return jsonify({"status": "error", "message": str(e)}), 500
 
 @app.route('/report/<string:job_id>/<string:scope_id>')
 def view_report(job_id, scope_id):
     """Serves the final HTML report from GCS to the user."""
     try:
-        bucket = storage_client.bucket(RESULTS_BUCKET)
+        bucket = results_bucket
         report_blob_name = f"{job_id}/{scope_id}_report.html"
         blob = bucket.blob(report_blob_name)
 
@@ -3051,9 +4322,23 @@ def view_report(job_id, scope_id):
         return report_html
 
     except Exception as e:
-        print(f"Error fetching report {job_id} from GCS: {e}")
+        logger.error("Error fetching report %s from GCS: %s", job_id, e)
         return "Could not retrieve report.", 500
     
+@app.route('/assets/cloudgauge.js')
+def report_script():
+    """Serves the shared report JavaScript with long-lived cache headers."""
+    if request.accept_encodings['gzip']:
+        response = Response(REPORT_JS_GZIP, mimetype='application/javascript')
+        response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(f"{REPORT_JS_VERSION}-gzip")
+    else:
+        response = Response(REPORT_JS, mimetype='application/javascript')
+        response.set_etag(REPORT_JS_VERSION)
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response.make_conditional(request)
+
 @app.route('/api/get-insights', methods=['POST'])
 def get_insights():
     """
@@ -3063,20 +4348,25 @@ def get_insights():
     data = request.get_json()
     scope = data.get('scope')
     scope_id = data.get('scope_id')
-    if not scope_id or not scope:
+    job_id = data.get('job_id')
+    if not scope_id or scope not in VALID_SCOPES:
         return jsonify({"error": "Scope and Scope ID are required."}), 400
 
     
     def run_cost_optimization_insights(scope, scope_id):
-        print("💡 Performing on-demand detailed INSIGHT scan...")
+        logger.info("💡 Performing on-demand detailed INSIGHT scan...")
         all_findings = []
         all_projects = list_projects_for_scope(scope, scope_id)
         if not all_projects:
             return []
         
-        active_zones, active_regions = get_active_compute_locations(all_projects)
-        from google.cloud.recommender_v1 import RecommenderClient
-        recommender_client = RecommenderClient()
+        # Reuse the locations the scan job already discovered; only rediscover if they aren't available
+        try:
+            active_zones, active_regions = _read_locations_from_gcs(job_id, scope_id)
+        except Exception as e:
+            logger.info("Saved locations unavailable for job %s (%s); rediscovering.", job_id, e)
+            active_zones, active_regions = get_active_compute_locations(scope, scope_id, all_projects)
+        recommender_client = _get_grpc_client(recommender_v1.RecommenderClient)
 
         
         global_insights = {
@@ -3108,7 +4398,7 @@ def get_insights():
                     for insight in insights:
                         resource_name = insight.target_resources[0].split('/')[-1] if insight.target_resources else 'N/A'
                         all_findings.append({"check": check_name, "project": project_id, "resource": resource_name, "details": insight.description})
-                except Exception as e: logging.warning(f"Could not check global insight for {project_id}: {e}")
+                except Exception as e: logger.warning("Could not check global insight for %s: %s", project_id, e)
 
             # Scan for REGIONAL insights
             for loc in active_regions:
@@ -3119,7 +4409,7 @@ def get_insights():
                         for insight in insights:
                             resource_name = insight.target_resources[0].split('/')[-1] if insight.target_resources else 'N/A'
                             all_findings.append({"check": check_name, "project": project_id, "resource": resource_name, "details": insight.description})
-                    except Exception as e: logging.warning(f"Could not check regional insight for {project_id}: {e}")
+                    except Exception as e: logger.warning("Could not check regional insight for %s: %s", project_id, e)
             
             # Scan for ZONAL insights
             for loc in active_zones:
@@ -3130,7 +4420,7 @@ def get_insights():
                         for insight in insights:
                             resource_name = insight.target_resources[0].split('/')[-1] if insight.target_resources else 'N/A'
                             all_findings.append({"check": check_name, "project": project_id, "resource": resource_name, "details": insight.description})
-                    except Exception as e: logging.warning(f"Could not check zonal isnight for {project_id}: {e}")
+                    except Exception as e: logger.warning("Could not check zonal isnight for %s: %s", project_id, e)
         
         return all_findings
 
@@ -3152,14 +4442,14 @@ def get_summary():
         data = request.get_json()
         scope_id = data.get('scope_id')  # CORRECTED
         job_id = data.get('job_id')
-        print(f"🤖 Received on-demand request for AI summary for job {job_id}...")
+        logger.info("🤖 Received on-demand request for AI summary for job %s...", job_id)
 
         if not scope_id or not job_id:
             return jsonify({"error": "Scope ID and Job ID are required."}), 400
 
 
         # 1. Fetch the context (the full CSV report) from GCS
-        bucket = storage_client.bucket(RESULTS_BUCKET)
+        bucket = results_bucket
         csv_blob_name = f"{job_id}/{scope_id}_report.csv"
         blob = bucket.blob(csv_blob_name)
         
@@ -3168,10 +4458,9 @@ def get_summary():
             
         csv_data = blob.download_as_text()
 
-        # 2. Initialize Vertex AI and the Generative Model
-        vertexai.init(project=os.environ.get('PROJECT_ID'), location="global")
+        # 2. Get the shared Generative Model (Vertex AI is initialized on first use)
         # Using 2.5 Flash as it's great for summarization and fast
-        model = GenerativeModel("gemini-2.5-flash") 
+        model = _get_gemini_model()
 
         # 3. Use the optimized prompt
         prompt = f"""
@@ -3196,14 +4485,34 @@ def get_summary():
         7.  Format your entire response in GitHub-flavored Markdown.
         """
         
-        # 4. Generate the summary
-        response = model.generate_content(prompt)
-        
-        print(f"✅ AI summary generated successfully for job {job_id}.")
-        return jsonify({"summary": response.text})
+        # 4. Generate the summary, streaming text to the browser as Gemini produces it.
+        # The first chunk is pulled here so request failures still surface as a JSON error.
+        chunks = iter(model.generate_content(prompt, stream=True))
+        first_chunk = next(chunks, None)
+
+        def stream_summary():
+            try:
+                for chunk in itertools.chain((first_chunk,) if first_chunk is not None else (), chunks):
+                    try:
+                        text = chunk.text
+                    except ValueError:
+                        # Chunks without text parts (e.g. a bare finish reason) carry nothing to show
+                        continue
+                    if text:
+                        yield text
+                logger.info("✅ AI summary generated successfully for job %s.", job_id)
+            except Exception as e:
+                logger.error("AI summary stream for job %s ended early: %s", job_id, e)
+                # The 200 status is already sent, so tell the reader in-band that the text is incomplete
+                yield "\n\n_Summary generation was interrupted._"
+
+        response = Response(stream_with_context(stream_summary()), mimetype='text/plain; charset=utf-8')
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Accel-Buffering'] = 'no'
+        return response
 
     except Exception as e:
-        print(f"CRITICAL ERROR in /api/get-summary: {e}")
+        logger.error("CRITICAL ERROR in /api/get-summary: %s", e)
         traceback.print_exc()
         return jsonify({"error": "An internal error occurred while generating the AI summary."}), 500
 
@@ -3219,27 +4528,29 @@ def get_suggestions():
         
         remediation_map = {}
         if actionable_findings:
-            print(f"🤖 On-demand request for {len(actionable_findings)} Gemini suggestions...")
+            logger.info("🤖 On-demand request for %s Gemini suggestions...", len(actionable_findings))
+            # Identical findings (same text, same project) are only sent to Gemini once
+            unique_prompts = list(dict.fromkeys((f['finding_text'], f['project_id']) for f in actionable_findings))
             with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-                def call_gemini(finding_info):
+                def call_gemini(prompt_key):
                     # The generate_remediation_command function already has its own internal try/except,
                     # which is good for handling individual AI call failures.
-                    return generate_remediation_command(finding_info['finding_text'], finding_info['project_id'])
+                    return generate_remediation_command(*prompt_key)
                 
-                results = executor.map(call_gemini, actionable_findings)
+                commands = dict(zip(unique_prompts, executor.map(call_gemini, unique_prompts)))
             
-            for i, command in enumerate(results):
+            for finding_info in actionable_findings:
                 # The key is now based on the original index from the batch
-                original_index = actionable_findings[i]['index']
-                remediation_map[f"finding-{original_index}"] = command
+                original_index = finding_info['index']
+                remediation_map[f"finding-{original_index}"] = commands[(finding_info['finding_text'], finding_info['project_id'])]
 
-            print("✅ Gemini on-demand suggestions received.")
+            logger.info("✅ Gemini on-demand suggestions received.")
 
         return jsonify(remediation_map)
 
     except Exception as e:
         # This is the crucial safety net. It will catch any unhandled exceptions.
-        print(f"CRITICAL ERROR in /api/get-suggestions: {e}")
+        logger.error("CRITICAL ERROR in /api/get-suggestions: %s", e)
         traceback.print_exc()
         # Return a 500 error to the browser so the 'catch' block is triggered.
         return jsonify({"error": "An internal error occurred on the server."}), 500
@@ -3258,21 +4569,17 @@ def get_status(job_id, scope, scope_id):
     try:
         # --- START SIGNED LOGIC ---
         
-        # 1. Get the default credentials from the metadata server
-        creds, _ = google.auth.default(scopes=["https://www.googleapis.com/auth/cloud-platform"])
-        
-        # 2. Manually refresh them to get a usable access token
-        auth_req = google.auth.transport.requests.Request()
-        creds.refresh(auth_req)
-        access_token = creds.token
+        # 1-2. Get a usable access token from the shared credentials; it is only
+        #      refreshed against the metadata server when it's close to expiring
+        access_token = _get_access_token()
 
         # 3. Get the service account email from the environment variable
-        signer_email = os.environ.get('SERVICE_ACCOUNT_EMAIL')
+        signer_email = SA_EMAIL
 
         # 4. Generate the signed URL, providing BOTH the email and the access token
         #    This tells the library: "Use this token to authorize a request for
         #    'signer_email' to sign the following content."
-        bucket = storage_client.bucket(RESULTS_BUCKET)
+        bucket = results_bucket
         csv_blob_name = f"{job_id}/{scope_id}_report.csv"
         blob = bucket.blob(csv_blob_name)
         
@@ -3288,7 +4595,7 @@ def get_status(job_id, scope, scope_id):
         # --- END SIGNED LOGIC ---
         
     except Exception as e:
-        print(f"Could not generate signed URL for job {job_id}: {e}")
+        logger.error("Could not generate signed URL for job %s: %s", job_id, e)
     
     # Pass the signed URL into the template
     return render_template_string("""